@@ -37,13 +37,49 @@ import json
 import re
 from datetime import datetime
 import os
+import sys
 import redis
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'versalogiq-secret-key'
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+# Output patterns, compiled once at import rather than on every call
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_SUDO_NOT_FOUND = re.compile(r'sudo: (?:command )?not found', re.IGNORECASE)
+_SUDO_PASSWORD_PROMPT = re.compile(r'password(?: for \S+)?:', re.IGNORECASE)
+# Root shell markers watched for while `sudo su` settles
+_ROOT_SHELL_MARKERS = re.compile('|'.join(map(re.escape, ('root@', '# '))))
+_PROBE_MARKER = re.compile(r'^__VLQ_(\d+|END)__$', re.MULTILINE)
+# Unanchored: the prompt can precede the begin marker and output may lack a final newline.
+# An echoed command line never matches, since it holds '__VLQ_BEGIN__;', '__VLQ_DONE_${...}__' and
+# the ready marker with printf's escaped backslash-n rather than a newline
+_SHELL_READY = re.compile(r'__VLQ_READY__\n')
+_SHELL_BEGIN = re.compile(r'__VLQ_BEGIN__\n')
+_SHELL_STDERR = re.compile(r'__VLQ_ERR__\n')
+_SHELL_DONE = re.compile(r'__VLQ_DONE_(\d+)__')
+
+@lru_cache(maxsize=256)
+def _lowered_patterns(patterns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercased, de-duplicated form of a rule's patterns, computed once per pattern tuple"""
+    return tuple(dict.fromkeys(pattern.lower() for pattern in patterns))
+
+@lru_cache(maxsize=256)
+def _pattern_automaton(patterns: Tuple[str, ...]):
+    """Aho-Corasick automaton mapping each distinct pattern to its index"""
+    automaton = ahocorasick.Automaton()
+    for index, pattern in enumerate(patterns):
+        automaton.add_word(pattern, index)
+    automaton.make_automaton()
+    return automaton
+
 class VersaLogIQ:
     def __init__(self, session_id=None):
         # SSH connection variables
@@ -51,6 +87,10 @@ class VersaLogIQ:
         self.shell = None
         self.connected = False
         
+        # Persistent unprivileged shell reused for plain commands (see _open_command_shell)
+        self._command_shell = None
+        self._command_shell_lock = threading.Lock()
+        
         # Session tracking
         self.session_id = session_id
         
@@ -64,9 +104,19 @@ class VersaLogIQ:
         self.detected_flavor = "Unknown"
         self.flavour_configs = {}
         
+        # Detection rules flattened into parallel lists sorted by priority (see _build_detection_rules)
+        self._rules_source = None
+        self._rule_commands = []
+        
         # Queue for thread communication
         self.output_queue = queue.Queue()
         
+        # Optional Socket.IO batching: events emitted within the window go out as one frame
+        self.emit_batch_window_ms = None
+        self._pending_emits = []
+        self._emit_timer = None
+        self._emit_lock = threading.Lock()
+        
         # Create Logs directory if it doesn't exist
         self.logs_dir = "logs"
         self._ensure_logs_directory()
@@ -80,6 +130,39 @@ class VersaLogIQ:
         # Load flavor configurations
         self._load_flavour_configs()
     
+    def emit(self, event, data, batch_window_ms=None):
+        """Emit a Socket.IO event to this client's room, optionally batching frames"""
+        window_ms = batch_window_ms if batch_window_ms is not None else self.emit_batch_window_ms
+        if not window_ms:
+            self._emit_frame(event, data)
+            return
+        
+        with self._emit_lock:
+            self._pending_emits.append([event, data])
+            if self._emit_timer is None:
+                self._emit_timer = threading.Timer(window_ms / 1000.0, self.flush_emits)
+                self._emit_timer.daemon = True
+                self._emit_timer.start()
+    
+    def flush_emits(self):
+        """Send any batched events now as a single 'event_batch' frame"""
+        with self._emit_lock:
+            pending, self._pending_emits = self._pending_emits, []
+            timer, self._emit_timer = self._emit_timer, None
+        
+        if timer:
+            timer.cancel()
+        if pending:
+            self._emit_frame('event_batch', {'events': pending})
+    
+    def _emit_frame(self, event, data):
+        """Send one frame to this session's room, or to all clients without a session"""
+        if self.session_id:
+            socketio.emit(event, data, room=self.session_id)
+        else:
+            # Fallback: emit to all clients (for backward compatibility)
+            socketio.emit(event, data)
+    
     def _ensure_logs_directory(self):
         """Create Logs directory if it doesn't exist"""
         try:
@@ -98,19 +181,11 @@ class VersaLogIQ:
         timestamp = datetime.now().strftime("%H:%M:%S")
         
         # Emit to web interface - use instance session_id if available
-        if self.session_id:
-            socketio.emit('log_output', {
-                'message': message,
-                'tag': tag,
-                'timestamp': timestamp
-            }, room=self.session_id)
-        else:
-            # Fallback: emit to all clients (for backward compatibility)
-            socketio.emit('log_output', {
-                'message': message,
-                'tag': tag,
-                'timestamp': timestamp
-            })
+        self.emit('log_output', {
+            'message': message,
+            'tag': tag,
+            'timestamp': timestamp
+        })
         
         # Also write to persistent log file
         self._write_to_log_file(message, tag)
@@ -184,6 +259,7 @@ Note: Each new session and operation is marked with decorative separators
                 flavour_data = json.load(f)
                 
             self.flavour_configs = flavour_data.get('server_flavors', {})
+            self._build_detection_rules()
             print(f"✅ Loaded {len(self.flavour_configs)} flavour detection configurations")
             return True
             
@@ -212,9 +288,8 @@ Note: Each new session and operation is marked with decorative separators
             else:
                 self.log_output(f"🔓 Executing without sudo: {command}", "info")
             
-            # Add a small delay to allow shell to stabilize
-            time.sleep(0.5)
-            
+            # exec_command runs on its own channel and read() blocks until EOF (bounded by
+            # the channel timeout), so no settling or polling delays are needed around it
             # For VOS commands (vsh), try to source the environment first
             if original_command.strip().startswith('vsh'):
                 # Try multiple approaches for VOS commands
@@ -227,7 +302,6 @@ Note: Each new session and operation is marked with decorative separators
                 
                 for vos_cmd in vos_commands:
                     stdin, stdout, stderr = self.ssh_client.exec_command(vos_cmd, timeout=timeout)
-                    time.sleep(1.0)
                     
                     stdout_data = stdout.read().decode('utf-8', errors='ignore').strip()
                     stderr_data = stderr.read().decode('utf-8', errors='ignore').strip()
@@ -239,8 +313,13 @@ Note: Each new session and operation is marked with decorative separators
                 # If all VOS commands failed, return the last result
                 return stdout_data, stderr_data
             else:
+                # Reuse the persistent shell when one is open instead of a new channel per command
+                if self._command_shell is not None:
+                    result = self._execute_in_command_shell(command, timeout)
+                    if result is not None:
+                        return result
+                
                 stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
-                time.sleep(1.0)
                 
                 stdout_data = stdout.read().decode('utf-8', errors='ignore').strip()
                 stderr_data = stderr.read().decode('utf-8', errors='ignore').strip()
@@ -250,6 +329,107 @@ Note: Each new session and operation is marked with decorative separators
         except Exception as e:
             return "", str(e)
     
+    def _open_command_shell(self, timeout: int = 10):
+        """Open the persistent shell used by execute_ssh_command; on failure commands use exec_command"""
+        shell = None
+        try:
+            shell = self.ssh_client.invoke_shell()
+            # No echo keeps the transcript small; the banner and prompts are skipped by the markers.
+            # The ready marker confirms the login shell is POSIX-like before any command relies on it
+            shell.send("stty -echo; printf '__VLQ_READY__\\n'\n")
+            self._recv_until(shell, _SHELL_READY, timeout, [])
+            self._command_shell = shell
+        except Exception as e:
+            self._command_shell = None
+            if shell is not None:
+                try:
+                    shell.close()
+                except Exception:
+                    pass
+            error = f"no ready marker within {timeout}s" if isinstance(e, TimeoutError) else str(e)
+            self.log_output(f"⚠️  Persistent command shell unavailable, using exec_command: {error}", "info")
+    
+    def _close_command_shell(self):
+        """Close the persistent command shell if it is open"""
+        shell, self._command_shell = self._command_shell, None
+        if shell is not None:
+            try:
+                shell.close()
+            except Exception:
+                pass
+    
+    def _recv_until(self, shell, pattern, timeout: float, chunks: List[str]) -> str:
+        """Read shell output into chunks until pattern appears; raises TimeoutError or EOFError"""
+        deadline = time.time() + timeout
+        buffer = "".join(chunks)
+        while not pattern.search(buffer):
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError()
+            shell.settimeout(remaining)
+            chunk = shell.recv(65536)
+            if not chunk:
+                raise EOFError("command shell closed")
+            chunks.append(chunk.decode('utf-8', errors='ignore').replace('\r', ''))
+            buffer += chunks[-1]
+        return buffer
+    
+    def _execute_in_command_shell(self, command: str, timeout: int = 15):
+        """Run command on the persistent shell; returns (stdout, stderr), or None if it did not run there"""
+        with self._command_shell_lock:
+            shell = self._command_shell
+            if shell is None:
+                return None
+            # stderr is captured into a variable and printed after its own marker, so the pty does not
+            # mix it into stdout and callers get the same (stdout, stderr) split as with exec_command.
+            # The command sits on its own lines so a '#' in it cannot comment out the rest of the wrapper
+            wrapped = (
+                f"echo __VLQ_BEGIN__; {{ __vlq_err=$( {{\n{command}\n}} 2>&1 1>&3 ); }} 3>&1; __vlq_rc=$?; "
+                f"echo __VLQ_ERR__; printf '%s\\n' \"$__vlq_err\"; echo __VLQ_DONE_${{__vlq_rc}}__\n"
+            )
+            try:
+                shell.send(wrapped)
+            except Exception as e:
+                # Nothing ran; drop the shell and let this and later commands use exec_command
+                self.log_output(f"⚠️  Command shell unavailable ({str(e)}), falling back to exec_command", "info")
+                self._close_command_shell()
+                return None
+            
+            chunks = []
+            try:
+                buffer = self._recv_until(shell, _SHELL_DONE, timeout, chunks)
+                
+                begin = _SHELL_BEGIN.search(buffer)
+                err = _SHELL_STDERR.search(buffer)
+                done = _SHELL_DONE.search(buffer)
+                if begin is None or err is None or not begin.end() <= err.start() <= err.end() <= done.start():
+                    raise ValueError("malformed command shell transcript")
+                
+                stdout_data = _ANSI_ESCAPE.sub('', buffer[begin.end():err.start()]).strip()
+                stderr_data = _ANSI_ESCAPE.sub('', buffer[err.end():done.start()]).strip()
+                return stdout_data, stderr_data
+                
+            except Exception as e:
+                self._close_command_shell()
+                # The whole wrapper is parsed before the begin marker is echoed, so without the marker
+                # nothing ran and the caller can safely retry over exec_command
+                if isinstance(e, (TimeoutError, EOFError)) and not _SHELL_BEGIN.search("".join(chunks)):
+                    self.log_output("⚠️  Command shell did not start the command, falling back to exec_command", "info")
+                    return None
+                # The command may already have run, so it is not retried; the shell state is unknown
+                # now, so later commands use exec_command
+                error = f"Command timed out after {timeout}s" if isinstance(e, TimeoutError) else str(e)
+                self.log_output(f"⚠️  Command shell failed ({error}), closing it", "info")
+                return "", error
+    
+    def check_sudo_requirements(self, text: str) -> Tuple[bool, bool]:
+        """Classify a sudo response as (needs_password, needs_sudo)"""
+        if not text or _SUDO_NOT_FOUND.search(text):
+            return False, False
+        if _SUDO_PASSWORD_PROMPT.search(text):
+            return True, True
+        return False, False
+    
     def _execute_with_sudo_shell(self, command: str, timeout: int = 15) -> Tuple[str, str]:
         """Execute a command using interactive shell with sudo su (similar to versalogiq_app.py)"""
         try:
@@ -305,8 +485,7 @@ Note: Each new session and operation is marked with decorative separators
             shell.close()
             
             # Clean the output - remove ANSI codes and command echoes
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            cleaned_output = ansi_escape.sub('', command_output)
+            cleaned_output = _ANSI_ESCAPE.sub('', command_output)
             
             # Remove command echo and prompts
             lines = cleaned_output.strip().split('\n')
@@ -382,8 +561,7 @@ Note: Each new session and operation is marked with decorative separators
             self.log_output(f"📊 Raw interactive output: '{final_output}'", "info")
             
             # Clean the output - remove ANSI codes, command echoes, and prompts
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            cleaned_output = ansi_escape.sub('', final_output)
+            cleaned_output = _ANSI_ESCAPE.sub('', final_output)
             
             # Split into lines and filter
             lines = cleaned_output.split('\n')
@@ -417,57 +595,65 @@ Note: Each new session and operation is marked with decorative separators
             self.log_output(f"❌ Interactive shell execution failed: {str(e)}", "error")
             return "", f"Interactive sudo execution failed: {str(e)}"
 
-    def detect_server_flavour(self) -> str:
-        """Detect the actual server flavour using detection rules"""
+    def detect_server_flavour(self, max_probes=None) -> str:
+        """Detect the actual server flavour using detection rules (at most max_probes commands, if given)"""
         if not self.flavour_configs:
             self.log_output("⚠️  No flavour configuration available - detection skipped", "info")
             return "Unknown"
         
         self.log_output(f"🔍 Detecting server flavour for {self.host}...", "info")
         
-        # Sort flavours by priority (highest first)
-        flavour_items = []
-        for flavour_key, flavour_config in self.flavour_configs.items():
-            if flavour_key == 'unknown':  # Skip unknown as it's the fallback
-                continue
-                
-            detection_rules = flavour_config.get('detection_rules', [])
-            fallback_commands = flavour_config.get('fallback_commands', [])
-            
-            # Add primary detection rules
-            for rule in detection_rules:
-                rule['flavour_key'] = flavour_key
-                rule['flavour_name'] = flavour_config.get('name', flavour_key)
-                rule['flavour_icon'] = flavour_config.get('icon', '❓')
-                flavour_items.append(rule)
-            
-            # Add fallback commands
-            for rule in fallback_commands:
-                rule['flavour_key'] = flavour_key
-                rule['flavour_name'] = flavour_config.get('name', flavour_key)
-                rule['flavour_icon'] = flavour_config.get('icon', '❓')
-                flavour_items.append(rule)
-        
-        # Sort by priority (highest first)
-        flavour_items.sort(key=lambda x: x.get('priority', 0), reverse=True)
-        
-        # Test each detection rule until we find a match
-        for rule in flavour_items:
+        if self._rules_source is not self.flavour_configs:
+            self._build_detection_rules()
+        
+        rule_count = len(self._rule_commands)
+        if max_probes is not None and rule_count > max_probes:
+            self.log_output(f"🔢 Limiting detection to the {max_probes} highest priority rules", "info")
+            rule_count = max_probes
+        
+        commands = self._rule_commands
+        use_sudo_flags = self._rule_use_sudo
+        
+        # Rules that share a command reuse its output instead of another SSH round trip
+        command_cache: Dict[Tuple[str, bool], Tuple[str, str]] = {}
+        
+        # Plain probes run together in one remote script; sudo and vsh commands keep
+        # their dedicated execution paths and run per rule
+        batchable = [
+            bool(command) and not use_sudo and not command.strip().startswith('vsh')
+            for command, use_sudo in zip(commands[:rule_count], use_sudo_flags)
+        ]
+        batch_pending = sum(batchable) > 1
+        
+        # Test each detection rule until we find a match; a match ends detection immediately,
+        # so the batch only runs once detection actually reaches a plain probe
+        for i in range(rule_count):
+            command = commands[i]
+            use_sudo = use_sudo_flags[i]
+            flavour_id = self._rule_flavour_ids[i]
+            flavour_name = self._flavour_names[flavour_id]
             try:
-                command = rule.get('command', '')
-                use_sudo = rule.get('use_sudo', False)
-                required_patterns = rule.get('required_patterns', [])
-                pattern_match_type = rule.get('pattern_match_type', 'contains')
-                case_sensitive = rule.get('case_sensitive', False)
-                timeout = rule.get('timeout', 15)
-                flavour_name = rule['flavour_name']
-                flavour_icon = rule['flavour_icon']
-                priority = rule.get('priority', 0)
+                required_patterns = self._rule_patterns[i]
+                case_sensitive = self._rule_case_sensitive[i]
                 
-                self.log_output(f"🧪 Testing {flavour_name} (Priority: {priority}) - Command: {command}", "info")
+                self.log_output(f"🧪 Testing {flavour_name} (Priority: {self._rule_priorities[i]}) - Command: {command}", "info")
                 self.log_output(f"🔧 Use sudo: {use_sudo}", "info")
                 
-                stdout, stderr = self.execute_ssh_command(command, timeout, use_sudo)
+                cache_key = (command, use_sudo)
+                if batch_pending and batchable[i] and cache_key not in command_cache:
+                    batch_pending = False
+                    # The probes run one after another, so the script gets the sum of their timeouts
+                    batch_timeouts: Dict[str, int] = {}
+                    for j in range(i, rule_count):
+                        if batchable[j]:
+                            batch_timeouts[commands[j]] = max(batch_timeouts.get(commands[j], 0), self._rule_timeouts[j])
+                    batch_commands = list(batch_timeouts)
+                    batch_timeout = sum(batch_timeouts.values())
+                    for batched, output in self._batch_probe_commands(batch_commands, batch_timeout).items():
+                        command_cache[(batched, False)] = output
+                if cache_key not in command_cache:
+                    command_cache[cache_key] = self.execute_ssh_command(command, self._rule_timeouts[i], use_sudo)
+                stdout, stderr = command_cache[cache_key]
                 
                 # Debug output for VOS detection
                 if 'vsh' in command.lower():
@@ -477,15 +663,20 @@ Note: Each new session and operation is marked with decorative separators
                     if stderr:
                         self.log_output(f"⚠️  Error output: {stderr[:200]}...", "info")
                 
-                # Check if all required patterns are found
-                if self._check_patterns(stdout, required_patterns, pattern_match_type, case_sensitive):
-                    self.log_output(f"✅ Server flavour detected: {flavour_icon} {flavour_name}", "success")
+                # Check if all required patterns are found; ASCII output shorter than the rule's
+                # longest literal pattern cannot contain it, so the scan is skipped outright
+                if stdout.isascii() and len(stdout) < self._rule_min_lengths[i]:
+                    matched = False
+                else:
+                    matched = self._check_patterns(stdout, required_patterns, self._rule_match_types[i], case_sensitive)
+                if matched:
+                    self.log_output(f"✅ Server flavour detected: {self._flavour_icons[flavour_id]} {flavour_name}", "success")
                     return flavour_name
                 elif stdout or stderr:
                     self.log_output(f"❌ Pattern not found for {flavour_name}", "info")
                     # Debug output for pattern matching
                     if 'vsh' in command.lower() and required_patterns:
-                        self.log_output(f"🔍 Looking for patterns: {required_patterns}", "info")
+                        self.log_output(f"🔍 Looking for patterns: {list(required_patterns)}", "info")
                         for pattern in required_patterns:
                             search_text = stdout if case_sensitive else stdout.lower()
                             search_pattern = pattern if case_sensitive else pattern.lower()
@@ -495,22 +686,92 @@ Note: Each new session and operation is marked with decorative separators
                     self.log_output(f"⚠️  No output from command for {flavour_name}", "info")
                     
             except Exception as e:
-                self.log_output(f"❌ Error testing {rule.get('flavour_name', 'unknown')}: {str(e)}", "error")
+                self.log_output(f"❌ Error testing {flavour_name}: {str(e)}", "error")
                 continue
         
         self.log_output(f"❓ No flavour detected, defaulting to Unknown", "info")
         return "Unknown"
     
+    def _build_detection_rules(self):
+        """Flatten every flavour's detection and fallback rules into parallel lists, sorted by priority once"""
+        # Each flavour gets an integer id; rules carry the id and the interned name is looked up on a match
+        rules = []
+        self._flavour_names = []
+        self._flavour_icons = []
+        for flavour_key, flavour_config in self.flavour_configs.items():
+            if flavour_key == 'unknown':  # Skip unknown as it's the fallback
+                continue
+            flavour_id = len(self._flavour_names)
+            self._flavour_names.append(sys.intern(flavour_config.get('name', flavour_key)))
+            self._flavour_icons.append(flavour_config.get('icon', '❓'))
+            for rule in flavour_config.get('detection_rules', []) + flavour_config.get('fallback_commands', []):
+                rules.append((rule, flavour_id))
+        
+        # Sort by priority (highest first); stable, so config order breaks ties as before
+        rules.sort(key=lambda item: item[0].get('priority', 0), reverse=True)
+        
+        self._rule_commands = [rule.get('command', '') for rule, _ in rules]
+        self._rule_use_sudo = [rule.get('use_sudo', False) for rule, _ in rules]
+        self._rule_patterns = [tuple(rule.get('required_patterns', [])) for rule, _ in rules]
+        self._rule_match_types = [rule.get('pattern_match_type', 'contains') for rule, _ in rules]
+        self._rule_case_sensitive = [rule.get('case_sensitive', False) for rule, _ in rules]
+        self._rule_timeouts = [rule.get('timeout', 15) for rule, _ in rules]
+        self._rule_priorities = [rule.get('priority', 0) for rule, _ in rules]
+        self._rule_flavour_ids = [flavour_id for _, flavour_id in rules]
+        self._rule_min_lengths = [
+            max(map(len, patterns if case_sensitive else _lowered_patterns(patterns)), default=0)
+            if match_type in ('contains', 'exact') else 0
+            for patterns, match_type, case_sensitive in zip(
+                self._rule_patterns, self._rule_match_types, self._rule_case_sensitive
+            )
+        ]
+        self._rules_source = self.flavour_configs
+    
+    def _batch_probe_commands(self, commands: List[str], timeout: int = 15) -> Dict[str, Tuple[str, str]]:
+        """Run several probe commands in one exec, returning {command: (stdout, stderr)}"""
+        script = "; ".join(
+            f"echo __VLQ_{index}__; ({command}) </dev/null 2>/dev/null" for index, command in enumerate(commands)
+        ) + "; echo __VLQ_END__"
+        
+        self.log_output(f"📦 Batching {len(commands)} detection commands into one SSH exec", "info")
+        try:
+            stdout, _ = self.execute_ssh_command(script, timeout, False)
+        except Exception as e:
+            self.log_output(f"⚠️  Batched detection failed, probing per rule: {str(e)}", "info")
+            return {}
+        
+        # Only trust a complete transcript; anything else falls back to per-rule execution
+        parts = _PROBE_MARKER.split(stdout)
+        if len(parts) < 3 or parts[-2] != 'END':
+            return {}
+        
+        results = {}
+        for marker, output in zip(parts[1:-2:2], parts[2:-2:2]):
+            index = int(marker)
+            if index < len(commands):
+                results[commands[index]] = (output.strip(), "")
+        return results
+    
     def _check_patterns(self, text: str, patterns: List[str], match_type: str = 'contains', case_sensitive: bool = False) -> bool:
         """Check if all required patterns are found in the text"""
         if not patterns:
             return False
             
+        # Text is lowered once per call; patterns once per distinct pattern tuple
         search_text = text if case_sensitive else text.lower()
+        search_patterns = tuple(dict.fromkeys(patterns)) if case_sensitive else _lowered_patterns(tuple(patterns))
+        
+        # Several substrings: one automaton pass over the text instead of one scan per pattern
+        if match_type == 'contains' and ahocorasick is not None and len(search_patterns) > 1:
+            if all(search_patterns):
+                remaining = (1 << len(search_patterns)) - 1
+                for _, index in _pattern_automaton(search_patterns).iter(search_text):
+                    remaining &= ~(1 << index)
+                    if not remaining:
+                        return True
+                return False
         
-        for pattern in patterns:
-            search_pattern = pattern if case_sensitive else pattern.lower()
-            
+        for search_pattern in search_patterns:
             if match_type == 'contains':
                 if search_pattern not in search_text:
                     return False
@@ -679,17 +940,14 @@ Note: Each new session and operation is marked with decorative separators
                     self.log_output(f"Debug - Received chunk: '{resp.strip()}'", "info")
                     
                     # Check for password prompt (multiple variations)
-                    if ("password for" in buff.lower() or 
-                        "password:" in buff.lower() or
-                        "[sudo] password" in buff.lower()):
+                    needs_password, _ = self.check_sudo_requirements(buff)
+                    if needs_password:
                         password_required = True
                         self.log_output("Password prompt detected", "info")
                         break
                     
                     # Check for immediate root shell (passwordless sudo)
-                    if ("root@" in buff or 
-                        buff.strip().endswith("# ") or
-                        "# " in buff):
+                    if _ROOT_SHELL_MARKERS.search(buff):
                         self.log_output("Passwordless sudo detected - no password required", "success")
                         break
                         
@@ -716,12 +974,12 @@ Note: Each new session and operation is marked with decorative separators
                 self.log_output(f"Debug - Looking for: 'password for' or 'root@' or '# '", "info")
                 raise Exception("Sudo command failed - neither password prompt nor root shell detected")
             
+            # Separate unprivileged shell that plain commands (flavour probes included) reuse
+            self._open_command_shell()
+            
             # Update connection state
             self.connected = True
-            if self.session_id:
-                socketio.emit('connection_status', {'connected': True, 'message': 'Connected successfully'}, room=self.session_id)
-            else:
-                socketio.emit('connection_status', {'connected': True, 'message': 'Connected successfully'})
+            self.emit('connection_status', {'connected': True, 'message': 'Connected successfully'})
             
             # Detect server flavor after successful connection
             self.log_output("", "normal")  # Empty line for separation
@@ -735,14 +993,9 @@ Note: Each new session and operation is marked with decorative separators
             self.log_output("", "normal")  # Empty line for separation
             
             # Send flavor information to the frontend
-            if self.session_id:
-                socketio.emit('flavor_detected', {'flavor': self.detected_flavor}, room=self.session_id)
-                # Signal that flavor detection is complete and operations section should be shown
-                socketio.emit('flavor_detection_complete', {}, room=self.session_id)
-            else:
-                socketio.emit('flavor_detected', {'flavor': self.detected_flavor})
-                # Signal that flavor detection is complete and operations section should be shown
-                socketio.emit('flavor_detection_complete', {})
+            self.emit('flavor_detected', {'flavor': self.detected_flavor})
+            # Signal that flavor detection is complete and operations section should be shown
+            self.emit('flavor_detection_complete', {})
             
             # Automatically start log scanning after flavor detection
             self.log_output("Connection successful! Starting log file scanning...", "success")
@@ -755,19 +1008,13 @@ Note: Each new session and operation is marked with decorative separators
             
             self.log_output(f"Connection failed: {str(e)}", "error")
             self.connected = False
+            self._close_command_shell()
             
-            if self.session_id:
-                socketio.emit('connection_status', {
-                    'connected': False, 
-                    'message': error_details['simple_message'],
-                    'error_details': error_details
-                }, room=self.session_id)
-            else:
-                socketio.emit('connection_status', {
-                    'connected': False, 
-                    'message': error_details['simple_message'],
-                    'error_details': error_details
-                })
+            self.emit('connection_status', {
+                'connected': False, 
+                'message': error_details['simple_message'],
+                'error_details': error_details
+            })
     
     def disconnect_from_server(self):
         """Disconnect from SSH server"""
@@ -779,6 +1026,7 @@ Note: Each new session and operation is marked with decorative separators
             if self.shell:
                 self.shell.send("exit\n")
                 time.sleep(0.5)
+            self._close_command_shell()
             if self.ssh_client:
                 self.ssh_client.close()
         except Exception as e:
@@ -794,10 +1042,7 @@ Note: Each new session and operation is marked with decorative separators
         self.detected_flavor = "Unknown"
         
         self.log_output("Disconnected from server", "info")
-        if self.session_id:
-            socketio.emit('connection_status', {'connected': False, 'message': 'Disconnected'}, room=self.session_id)
-        else:
-            socketio.emit('connection_status', {'connected': False, 'message': 'Disconnected'})
+        self.emit('connection_status', {'connected': False, 'message': 'Disconnected'})
     
     def scan_system_logs(self):
         """Scan for all log files in /var/log directory and subdirectories"""
@@ -877,10 +1122,7 @@ Note: Each new session and operation is marked with decorative separators
                 self.log_output(f"  {directory}: {len(files)} files -> {file_summary}", "info")
             
             # Send log files data to web interface
-            if self.session_id:
-                socketio.emit('log_files_response', {'log_files': log_files}, room=self.session_id)
-            else:
-                socketio.emit('log_files_response', {'log_files': log_files})
+            self.emit('log_files_response', {'log_files': log_files})
             
             return log_files
             
@@ -969,8 +1211,7 @@ Note: Each new session and operation is marked with decorative separators
     
     def _clean_ansi_codes(self, text):
         """Remove ANSI escape codes from text"""
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        return _ANSI_ESCAPE.sub('', text)
 
 # Session-based instances - each client gets their own instance
 client_instances = {}
@@ -1023,9 +1264,87 @@ def version():
             'System Log Scanning',
             'Docker Microservices Architecture',
             'Enhanced Update Process'
+        ],
+        # Machine-readable REST capabilities, so clients can skip endpoints up front
+        'api_features': [
+            'test_connection',
+            'batch_test_connection',
+            'bulk_check',
+            'server_status',
+            'connectivity_report'
         ]
     }), 200
 
+def _run_connection_test(data):
+    """Test one connection payload; returns the response body and HTTP status"""
+    # Extract connection parameters
+    hostname = data.get('hostname')
+    username = data.get('username')
+    password = data.get('password')
+    key_filename = data.get('key_filename')
+    expected_flavor = data.get('expected_flavor')
+    use_mock = data.get('use_mock', False)
+    
+    if not hostname or not username:
+        return {
+            'success': False, 
+            'error': 'hostname and username are required'
+        }, 400
+    
+    if not password and not key_filename:
+        return {
+            'success': False,
+            'error': 'Either password or key_filename is required'
+        }, 400
+    
+    start_time = time.time()
+    
+    # Mock response for testing
+    if use_mock:
+        connection_time = time.time() - start_time + 0.5  # Simulate connection time
+        return {
+            'success': True,
+            'hostname': hostname,
+            'detected_flavor': expected_flavor or 'VMS',
+            'sudo_available': True,
+            'requires_password': False,
+            'connection_time': round(connection_time, 3),
+            'mock': True
+        }, 200
+    
+    # Create a temporary VersaLogIQ instance for testing
+    test_client = VersaLogIQ()
+    
+    # Attempt real connection
+    success = test_client.connect_to_server(hostname, username, password, key_filename)
+    connection_time = time.time() - start_time
+    
+    if not success:
+        return {
+            'success': False,
+            'hostname': hostname,
+            'error': 'Failed to establish SSH connection',
+            'connection_time': round(connection_time, 3)
+        }, 200
+    
+    # Detect server flavor
+    detected_flavor = test_client.detect_server_flavour()
+    
+    # Test sudo access
+    sudo_info = test_client.test_sudo_access()
+    
+    # Close test connection
+    test_client.ssh_client.close()
+    
+    return {
+        'success': True,
+        'hostname': hostname,
+        'detected_flavor': detected_flavor,
+        'sudo_available': sudo_info.get('sudo_available', False),
+        'requires_password': sudo_info.get('requires_password', True),
+        'connection_time': round(connection_time, 3)
+    }, 200
+
 @app.route('/api/test_connection', methods=['POST'])
 def api_test_connection():
     """REST API endpoint to test connection to a specific server"""
@@ -1034,73 +1353,22 @@ def api_test_connection():
         if not data:
             return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
         
-        # Extract connection parameters
-        hostname = data.get('hostname')
-        username = data.get('username')
-        password = data.get('password')
-        key_filename = data.get('key_filename')
-        expected_flavor = data.get('expected_flavor')
-        use_mock = data.get('use_mock', False)
-        
-        if not hostname or not username:
-            return jsonify({
-                'success': False, 
-                'error': 'hostname and username are required'
-            }), 400
-        
-        if not password and not key_filename:
-            return jsonify({
-                'success': False,
-                'error': 'Either password or key_filename is required'
-            }), 400
-        
-        # Create a temporary VersaLogIQ instance for testing
-        test_client = VersaLogIQ()
-        
-        start_time = time.time()
-        
-        # Mock response for testing
-        if use_mock:
-            connection_time = time.time() - start_time + 0.5  # Simulate connection time
-            return jsonify({
-                'success': True,
-                'hostname': hostname,
-                'detected_flavor': expected_flavor or 'VMS',
-                'sudo_available': True,
-                'requires_password': False,
-                'connection_time': round(connection_time, 3),
-                'mock': True
-            })
-        
-        # Attempt real connection
-        success = test_client.connect_to_server(hostname, username, password, key_filename)
-        connection_time = time.time() - start_time
-        
-        if not success:
-            return jsonify({
-                'success': False,
-                'hostname': hostname,
-                'error': 'Failed to establish SSH connection',
-                'connection_time': round(connection_time, 3)
-            })
-        
-        # Detect server flavor
-        detected_flavor = test_client.detect_server_flavour()
-        
-        # Test sudo access
-        sudo_info = test_client.test_sudo_access()
-        
-        # Close test connection
-        test_client.ssh_client.close()
+        # ?batch=1 takes {"tests": [payload, ...]} and answers them all in one response
+        if request.args.get('batch'):
+            tests = data.get('tests')
+            if not isinstance(tests, list):
+                return jsonify({'success': False, 'error': 'tests list is required for batch requests'}), 400
+            results = []
+            for payload in tests:
+                try:
+                    result, _ = _run_connection_test(payload)
+                except Exception as e:
+                    result = {'success': False, 'error': f'Connection test failed: {str(e)}'}
+                results.append(result)
+            return jsonify({'results': results})
         
-        return jsonify({
-            'success': True,
-            'hostname': hostname,
-            'detected_flavor': detected_flavor,
-            'sudo_available': sudo_info.get('sudo_available', False),
-            'requires_password': sudo_info.get('requires_password', True),
-            'connection_time': round(connection_time, 3)
-        })
+        result, status = _run_connection_test(data)
+        return jsonify(result), status
         
     except Exception as e:
         return jsonify({
@@ -1115,23 +1383,25 @@ def api_check_all_servers():
         data = request.get_json() or {}
         use_mock = data.get('use_mock', False)
         
-        # Load servers from ssh_hosts.json
-        ssh_hosts_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ssh_hosts.json')
-        
-        try:
-            with open(ssh_hosts_file, 'r') as f:
-                hosts_data = json.load(f)
-                servers = hosts_data.get('hosts', [])
-        except FileNotFoundError:
-            return jsonify({
-                'success': False,
-                'error': 'ssh_hosts.json file not found'
-            }), 404
-        except json.JSONDecodeError:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid JSON in ssh_hosts.json'
-            }), 400
+        # Callers may supply the server list directly; otherwise use ssh_hosts.json
+        servers = data.get('servers')
+        if servers is None:
+            ssh_hosts_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ssh_hosts.json')
+            
+            try:
+                with open(ssh_hosts_file, 'r') as f:
+                    hosts_data = json.load(f)
+                    servers = hosts_data.get('hosts', [])
+            except FileNotFoundError:
+                return jsonify({
+                    'success': False,
+                    'error': 'ssh_hosts.json file not found'
+                }), 404
+            except json.JSONDecodeError:
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid JSON in ssh_hosts.json'
+                }), 400
         
         if not servers:
             return jsonify({
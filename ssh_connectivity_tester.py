@@ -12,20 +12,151 @@ Features:
 - Export results to CSV/JSON
 """
 
-import paramiko
-import json
+import socket
 import sys
 import time
 import threading
 import argparse
 from datetime import datetime
-import csv
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple
 import re
+import asyncio
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The SSH stacks and export formats are imported where they are used, so --help
+# and report-only runs don't pay for them; asyncssh is bound on first use
+asyncssh = None
+
+def _import_asyncssh():
+    """Import asyncssh on first use, returning None if it isn't installed"""
+    global asyncssh
+    if asyncssh is None:
+        try:
+            import asyncssh as asyncssh_module
+        except ImportError:
+            return None
+        asyncssh = asyncssh_module
+    return asyncssh
+
+# Marker echoed before each command when probes are batched on one channel
+PROBE_MARKER = "__VLQ_PROBE__"
+
+# Columns written by the CSV export
+CSV_FIELDNAMES = [
+    'name', 'hostname', 'username', 'flavour', 'detected_flavour', 'flavour_mismatch',
+    'status', 'error_type', 'error_message', 'response_time', 'command_test', 'timestamp'
+]
+
+_CSV_ROW_GETTER = itemgetter(*CSV_FIELDNAMES)
+
+# Report separators
+SEPARATOR_WIDE = "─" * 80
+SEPARATOR_NARROW = "─" * 40
+
+# Flavour column of the summary, keyed by (flavour_mismatch, detected flavour is Unknown)
+FLAVOUR_DISPLAY = {
+    (True, False): "⚠️ {configured}→{detected}",
+    (True, True): "⚠️ {configured}→{detected}",
+    (False, False): "✅ {detected}",
+    (False, True): "❓ {configured}",
+}
+
+# Strips terminal escape sequences from interactive shell output
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_ANSI_ESCAPE_RE_BYTES = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Echoed after a sudo shell command so its output can be read without prompt guessing
+SUDO_DONE_MARKER = "__VLQ_DONE__"
+
+def _pool_thread_init() -> None:
+    """Mark worker threads SCHED_BATCH on Linux; they spend nearly all their time blocked on I/O"""
+    if not hasattr(os, 'SCHED_BATCH'):
+        return
+    try:
+        # On Linux pid 0 applies to the calling thread only
+        os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+    except OSError:
+        pass
+
+class SSHConnectionPool:
+    """Keep established SSH clients warm between scans, keyed by (hostname, user)"""
+    
+    def __init__(self, idle_timeout: int = 300, reap_interval: int = 30):
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._connections = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+    
+    def acquire(self, host_key: Tuple[str, str]):
+        """Take a live pooled connection for the host, or None if there isn't one"""
+        with self._lock:
+            entry = self._connections.pop(host_key, None)
+        
+        if entry is None:
+            return None
+        
+        ssh = entry[0]
+        transport = ssh.get_transport()
+        if transport is None or not transport.is_active():
+            ssh.close()
+            return None
+        return ssh
+    
+    def release(self, host_key: Tuple[str, str], ssh) -> None:
+        """Return a connection to the pool instead of closing it"""
+        with self._lock:
+            previous = self._connections.get(host_key)
+            self._connections[host_key] = (ssh, time.time())
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = threading.Thread(target=self._reap_loop, name="ssh-pool-reaper", daemon=True)
+                self._reaper.start()
+        
+        if previous and previous[0] is not ssh:
+            previous[0].close()
+    
+    def reap_idle(self) -> int:
+        """Close connections that have been idle longer than idle_timeout"""
+        cutoff = time.time() - self.idle_timeout
+        with self._lock:
+            expired = [key for key, (_, last_used) in self._connections.items() if last_used < cutoff]
+            stale = [self._connections.pop(key)[0] for key in expired]
+        
+        for ssh in stale:
+            ssh.close()
+        return len(stale)
+    
+    def close_all(self) -> None:
+        """Close every pooled connection"""
+        with self._lock:
+            connections = [ssh for ssh, _ in self._connections.values()]
+            self._connections.clear()
+        
+        for ssh in connections:
+            ssh.close()
+    
+    def _reap_loop(self) -> None:
+        """Background reaper; exits once the pool is empty"""
+        while True:
+            time.sleep(self.reap_interval)
+            self.reap_idle()
+            with self._lock:
+                if not self._connections:
+                    self._reaper = None
+                    return
 
 class SSHConnectivityTester:
+    # Shared across instances so repeated scans reuse established connections
+    pool = SSHConnectionPool()
+    
     def __init__(self, config_file: str = "ssh_hosts.json", flavour_config_file: str = "VersaLogIQ/config/server_flavors.json"):
         """Initialize the SSH connectivity tester"""
         self.config_file = config_file
@@ -34,10 +165,26 @@ class SSHConnectivityTester:
         self.results = []
         self.start_time = None
         self.end_time = None
+        self._summary = Counter()
+        self._export_timestamp = None
         self.flavour_configs = {}
         
+        # Detection rules flattened into parallel arrays, built once at load time
+        self._rule_cmd = []
+        self._rule_sudo = []
+        self._rule_patterns = []
+        self._rule_search_patterns = []
+        self._rule_match_type = []
+        self._rule_case_sensitive = []
+        self._rule_timeout = []
+        self._rule_priority = []
+        self._rule_flavour_name = []
+        self._rule_order = []
+        
     def load_flavour_configs(self) -> bool:
         """Load server flavour detection configurations"""
+        import json
+        
         try:
             if not os.path.exists(self.flavour_config_file):
                 print(f"⚠️  Flavour config file not found: {self.flavour_config_file}")
@@ -48,6 +195,7 @@ class SSHConnectivityTester:
                 flavour_data = json.load(f)
                 
             self.flavour_configs = flavour_data.get('server_flavors', {})
+            self._build_rule_arrays()
             print(f"✅ Loaded {len(self.flavour_configs)} flavour detection configurations")
             return True
             
@@ -58,8 +206,55 @@ class SSHConnectivityTester:
             print(f"❌ Error loading flavour config: {str(e)}")
             return False
         
+    def _build_rule_arrays(self) -> None:
+        """Flatten detection and fallback rules into parallel arrays sorted by priority"""
+        self._rule_cmd = []
+        self._rule_sudo = []
+        self._rule_patterns = []
+        self._rule_search_patterns = []
+        self._rule_match_type = []
+        self._rule_case_sensitive = []
+        self._rule_timeout = []
+        self._rule_priority = []
+        self._rule_flavour_name = []
+        
+        for flavour_key, flavour_config in self.flavour_configs.items():
+            if flavour_key == 'unknown':  # Skip unknown as it's the fallback
+                continue
+            
+            flavour_name = flavour_config.get('name', flavour_key)
+            rules = flavour_config.get('detection_rules', []) + flavour_config.get('fallback_commands', [])
+            for rule in rules:
+                patterns = tuple(rule.get('required_patterns', []))
+                match_type = rule.get('pattern_match_type', 'contains')
+                case_sensitive = rule.get('case_sensitive', False)
+                
+                # Patterns are prepared once: casefolded for plain matches, compiled for regex
+                if match_type == 'regex':
+                    flags = 0 if case_sensitive else re.IGNORECASE
+                    search_patterns = tuple(re.compile(pattern, flags) for pattern in patterns)
+                elif case_sensitive:
+                    search_patterns = patterns
+                else:
+                    search_patterns = tuple(pattern.casefold() for pattern in patterns)
+                
+                self._rule_cmd.append(rule.get('command', ''))
+                self._rule_sudo.append(rule.get('use_sudo', False))
+                self._rule_patterns.append(patterns)
+                self._rule_search_patterns.append(search_patterns)
+                self._rule_match_type.append(match_type)
+                self._rule_case_sensitive.append(case_sensitive)
+                self._rule_timeout.append(rule.get('timeout', 15))
+                self._rule_priority.append(rule.get('priority', 0))
+                self._rule_flavour_name.append(flavour_name)
+        
+        # Highest priority first; the sort is stable so config order breaks ties
+        self._rule_order = sorted(range(len(self._rule_cmd)), key=lambda idx: -self._rule_priority[idx])
+        
     def load_hosts(self) -> bool:
         """Load host configurations from JSON file"""
+        import json
+        
         try:
             print(f"📋 Loading host configurations from: {self.config_file}")
             
@@ -189,48 +384,45 @@ class SSHConnectivityTester:
             # Check if sudo was successful
             output = shell.recv(10000).decode('utf-8', errors='ignore')
             
-            # Now execute the actual command
-            shell.send(f"{command}\n")
-            time.sleep(2)
+            # Now execute the actual command, followed by a sentinel marking its end
+            shell.send(f"{command}; echo {SUDO_DONE_MARKER}\n")
             
-            # Collect output
-            command_output = ""
+            # Parse output line by line as it arrives and stop at the sentinel
+            command_bytes = command.encode('utf-8')
+            done_marker = SUDO_DONE_MARKER.encode('utf-8')
+            buf = bytearray()
+            result_lines = []
+            done = False
             start_time = time.time()
             
-            while time.time() - start_time < timeout:
-                if shell.recv_ready():
-                    chunk = shell.recv(4096).decode('utf-8', errors='ignore')
-                    command_output += chunk
-                    if chunk.endswith('# ') or chunk.endswith('$ '):
+            while not done and time.time() - start_time < timeout:
+                if not shell.recv_ready():
+                    time.sleep(0.1)
+                    continue
+                
+                buf += shell.recv(4096)
+                while True:
+                    i = buf.find(b'\n')
+                    if i == -1:
                         break
-                time.sleep(0.1)
+                    line = _ANSI_ESCAPE_RE_BYTES.sub(b'', bytes(buf[:i])).strip()
+                    del buf[:i + 1]
+                    
+                    if line == done_marker:
+                        done = True
+                        break
+                    # Skip command echo, prompts, and empty lines
+                    if (not line or
+                            line.startswith(command_bytes) or
+                            line.startswith(b'[root@')):
+                        continue
+                    result_lines.append(line.decode('utf-8', errors='ignore'))
             
             # Clean up
             shell.send("exit\n")
-            time.sleep(0.5)
             shell.close()
             
-            # Clean the output - remove ANSI codes and command echoes
-            import re
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            cleaned_output = ansi_escape.sub('', command_output)
-            
-            # Remove command echo and prompts
-            lines = cleaned_output.strip().split('\n')
-            result_lines = []
-            for line in lines:
-                line = line.strip()
-                # Skip command echo, prompts, and empty lines  
-                if (not line or 
-                    line.startswith(command) or
-                    line.endswith('# ') or 
-                    line.endswith('$ ') or
-                    line.startswith('[root@')):
-                    continue
-                result_lines.append(line)
-            
-            result_output = '\n'.join(result_lines)
-            return result_output, ""
+            return '\n'.join(result_lines), ""
             
         except Exception as e:
             return "", f"Sudo shell execution failed: {str(e)}"
@@ -296,9 +488,7 @@ class SSHConnectivityTester:
             print(f"          📊 Raw interactive output: '{final_output}'")
             
             # Clean the output - remove ANSI codes, command echoes, and prompts
-            import re
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            cleaned_output = ansi_escape.sub('', final_output)
+            cleaned_output = _ANSI_ESCAPE_RE.sub('', final_output)
             
             # Split into lines and filter
             lines = cleaned_output.split('\n')
@@ -332,53 +522,150 @@ class SSHConnectivityTester:
             print(f"          ❌ Interactive shell execution failed: {str(e)}")
             return "", f"Interactive sudo execution failed: {str(e)}"
 
-    def detect_server_flavour(self, ssh_client, host_name: str) -> str:
-        """Detect the actual server flavour using detection rules"""
-        if not self.flavour_configs:
-            return "Unknown"
+    def _build_probe_script(self, commands: List[str]) -> str:
+        """Build a shell script that runs each command after its own marker line"""
+        # Source the profile and VOS path once so vsh commands resolve without retries
+        script_lines = [
+            "[ -f /etc/profile ] && . /etc/profile >/dev/null 2>&1",
+            "export PATH=/opt/versa/bin:$PATH",
+        ]
+        for index, command in enumerate(commands):
+            script_lines.append(f"echo '{PROBE_MARKER}{index}'")
+            # Probes get no stdin, so one that reads it cannot swallow the rest of the script
+            script_lines.append(f"( {command} ) </dev/null 2>/dev/null")
+        return "\n".join(script_lines) + "\n"
+    
+    def _parse_probe_output(self, raw_output: str, commands: List[str]) -> Dict[str, str]:
+        """Split the combined probe script output back into per-command output"""
+        outputs = {}
+        current = None
+        current_lines = []
+        for line in raw_output.split('\n'):
+            if line.startswith(PROBE_MARKER):
+                if current is not None:
+                    outputs[commands[current]] = '\n'.join(current_lines).strip()
+                current = int(line[len(PROBE_MARKER):])
+                current_lines = []
+            elif current is not None:
+                current_lines.append(line)
+        if current is not None:
+            outputs[commands[current]] = '\n'.join(current_lines).strip()
         
-        print(f"   🔍 Detecting server flavour for {host_name}...")
+        return outputs
+    
+    def run_probe_script(self, ssh_client, commands: List[str], timeout: int = 15) -> Dict[str, str]:
+        """Run non-sudo probe commands as one script over a single session channel"""
+        script = self._build_probe_script(commands)
         
-        # Sort flavours by priority (highest first)
-        flavour_items = []
-        for flavour_key, flavour_config in self.flavour_configs.items():
-            if flavour_key == 'unknown':  # Skip unknown as it's the fallback
+        raw_output = bytearray()
+        timed_out = False
+        chan = ssh_client.get_transport().open_session()
+        try:
+            chan.settimeout(timeout)
+            chan.exec_command('bash -s')
+            chan.sendall(script.encode('utf-8'))
+            chan.shutdown_write()
+            while True:
+                data = chan.recv(65536)
+                if not data:
+                    break
+                raw_output += data
+        except socket.timeout:
+            # Keep what the finished probes produced; the rest fall back to per-command execution
+            timed_out = True
+            print(f"   ⚠️  Probe script stalled for {timeout}s, using the partial output")
+        finally:
+            chan.close()
+        
+        outputs = self._parse_probe_output(raw_output.decode('utf-8', errors='ignore'), commands)
+        if timed_out and outputs:
+            # The last probe that started was cut off mid-output
+            outputs.pop(next(reversed(outputs)))
+        return outputs
+
+    def collect_probe_outputs(self, ssh_client, extra_commands: List[str] = None) -> Dict[str, str]:
+        """Run every non-sudo detection probe (plus any extra commands) in one round trip"""
+        probe_commands = list(extra_commands or [])
+        for idx in self._rule_order:
+            command = self._rule_cmd[idx]
+            if command and not self._rule_sudo[idx] and command not in probe_commands:
+                probe_commands.append(command)
+        
+        if not probe_commands:
+            return {}
+        
+        try:
+            probe_outputs = self.run_probe_script(ssh_client, probe_commands)
+            print(f"   📦 Ran {len(probe_commands)} probe commands over a single channel")
+            return probe_outputs
+        except Exception as e:
+            print(f"   ⚠️  Batched probe failed, falling back to per-command execution: {str(e)}")
+            return {}
+
+    def match_all_rules(self, probe_outputs: Dict[str, str]) -> set:
+        """Return the indices of every rule whose required patterns all match its probe output"""
+        matched = set()
+        folded_outputs = {}
+        
+        for idx, command in enumerate(self._rule_cmd):
+            text = probe_outputs.get(command)
+            if text is None or self._rule_sudo[idx]:
                 continue
-                
-            detection_rules = flavour_config.get('detection_rules', [])
-            fallback_commands = flavour_config.get('fallback_commands', [])
             
-            # Add primary detection rules
-            for rule in detection_rules:
-                rule['flavour_key'] = flavour_key
-                rule['flavour_name'] = flavour_config.get('name', flavour_key)
-                flavour_items.append(rule)
+            # Each distinct output is casefolded at most once across all rules
+            if not self._rule_case_sensitive[idx] and self._rule_match_type[idx] != 'regex':
+                if command not in folded_outputs:
+                    folded_outputs[command] = text.casefold()
+                text = folded_outputs[command]
             
-            # Add fallback commands
-            for rule in fallback_commands:
-                rule['flavour_key'] = flavour_key
-                rule['flavour_name'] = flavour_config.get('name', flavour_key)
-                flavour_items.append(rule)
+            if self._rule_matches(idx, text):
+                matched.add(idx)
+        
+        return matched
+    
+    def _rule_matches(self, idx: int, text: str) -> bool:
+        """Check prepared rule patterns against already-normalised text"""
+        search_patterns = self._rule_search_patterns[idx]
+        if not search_patterns:
+            return False
+        
+        match_type = self._rule_match_type[idx]
+        if match_type == 'regex':
+            return all(pattern.search(text) for pattern in search_patterns)
+        if match_type == 'exact':
+            return all(pattern == text for pattern in search_patterns)
+        return all(pattern in text for pattern in search_patterns)
+
+    def detect_server_flavour(self, ssh_client, host_name: str, probe_outputs: Dict[str, str] = None) -> str:
+        """Detect the actual server flavour using detection rules"""
+        if not self.flavour_configs:
+            return "Unknown"
         
-        # Sort by priority (highest first)
-        flavour_items.sort(key=lambda x: x.get('priority', 0), reverse=True)
+        print(f"   🔍 Detecting server flavour for {host_name}...")
+        
+        # Sudo rules keep the interactive path; everything else comes from the batched probe
+        if probe_outputs is None:
+            probe_outputs = self.collect_probe_outputs(ssh_client)
+        batch_matches = self.match_all_rules(probe_outputs)
         
         # Test each detection rule until we find a match
-        for rule in flavour_items:
+        for idx in self._rule_order:
+            flavour_name = self._rule_flavour_name[idx]
             try:
-                command = rule.get('command', '')
-                use_sudo = rule.get('use_sudo', False)
-                required_patterns = rule.get('required_patterns', [])
-                pattern_match_type = rule.get('pattern_match_type', 'contains')
-                case_sensitive = rule.get('case_sensitive', False)
-                timeout = rule.get('timeout', 15)
-                flavour_name = rule['flavour_name']
-                priority = rule.get('priority', 0)
+                command = self._rule_cmd[idx]
+                use_sudo = self._rule_sudo[idx]
+                required_patterns = self._rule_patterns[idx]
+                case_sensitive = self._rule_case_sensitive[idx]
                 
-                print(f"      🧪 Testing {flavour_name} (Priority: {priority}) - Command: {command}")
+                print(f"      🧪 Testing {flavour_name} (Priority: {self._rule_priority[idx]}) - Command: {command}")
                 print(f"          🔧 Use sudo: {use_sudo}")
                 
-                stdout, stderr = self.execute_ssh_command(ssh_client, command, timeout, use_sudo)
+                if not use_sudo and command in probe_outputs:
+                    stdout, stderr = probe_outputs[command], ""
+                    matched = idx in batch_matches
+                else:
+                    stdout, stderr = self.execute_ssh_command(ssh_client, command, self._rule_timeout[idx], use_sudo)
+                    matched = self.check_patterns(stdout, list(required_patterns), self._rule_match_type[idx], case_sensitive)
                 
                 # Debug output for VOS detection
                 if 'vsh' in command.lower():
@@ -389,14 +676,14 @@ class SSHConnectivityTester:
                         print(f"          ⚠️  Error output: {stderr[:200]}...")
                 
                 # Check if all required patterns are found
-                if self.check_patterns(stdout, required_patterns, pattern_match_type, case_sensitive):
+                if matched:
                     print(f"      ✅ Flavour detected: {flavour_name}")
                     return flavour_name
                 elif stdout or stderr:
                     print(f"      ❌ Pattern not found for {flavour_name}")
                     # Debug output for pattern matching
                     if 'vsh' in command.lower() and required_patterns:
-                        print(f"          🔍 Looking for patterns: {required_patterns}")
+                        print(f"          🔍 Looking for patterns: {list(required_patterns)}")
                         for pattern in required_patterns:
                             search_text = stdout if case_sensitive else stdout.lower()
                             search_pattern = pattern if case_sensitive else pattern.lower()
@@ -406,7 +693,7 @@ class SSHConnectivityTester:
                     print(f"      ⚠️  No output from command for {flavour_name}")
                     
             except Exception as e:
-                print(f"      ❌ Error testing {rule.get('flavour_name', 'unknown')}: {str(e)}")
+                print(f"      ❌ Error testing {flavour_name}: {str(e)}")
                 continue
         
         print(f"      ❓ No flavour detected, defaulting to Unknown")
@@ -437,31 +724,54 @@ class SSHConnectivityTester:
     
     def test_single_host(self, host_config: Dict, timeout: int = 10) -> Dict:
         """Test SSH connection to a single host"""
-        host_name = host_config.get('name', 'Unknown')
-        hostname = host_config.get('hostname', '')
-        username = host_config.get('user', '')
-        password = host_config.get('password', '')
-        flavour = host_config.get('flavour', 'Unknown')
-        
-        result = {
-            'name': host_name,
-            'hostname': hostname,
-            'username': username,
-            'flavour': flavour,
+        ssh, result = self._phase_connect(host_config, timeout)
+        if ssh is None:
+            return result
+        return self._phase_detect(ssh, result)
+    
+    def _new_result(self, host_config: Dict) -> Dict:
+        """Fresh result record with every exported field present"""
+        return {
+            'name': host_config.get('name', 'Unknown'),
+            'hostname': host_config.get('hostname', ''),
+            'username': host_config.get('user', ''),
+            'flavour': host_config.get('flavour', 'Unknown'),
+            'detected_flavour': None,
+            'flavour_mismatch': None,
             'status': 'UNKNOWN',
             'error_type': None,
             'error_message': '',
             'response_time': 0,
+            'detection_time': 0,
             'timestamp': datetime.now().isoformat(),
             'command_test': False,
             'suggestions': []
         }
+    
+    def _phase_connect(self, host_config: Dict, timeout: int = 10) -> Tuple[object, Dict]:
+        """Open the SSH connection for a host, returning (ssh, result)"""
+        import paramiko
+        
+        host_name = host_config.get('name', 'Unknown')
+        hostname = host_config.get('hostname', '')
+        username = host_config.get('user', '')
+        password = host_config.get('password', '')
+        flavour = host_config.get('flavour', 'Unknown')
+        
+        result = self._new_result(host_config)
         
         start_time = time.time()
         
         try:
             print(f"🔍 Testing {host_name} ({hostname}) - Flavour: {flavour} - User: {username}")
             
+            # Reuse a warm connection from a previous scan when one is available
+            ssh = self.pool.acquire((hostname, username))
+            if ssh is not None:
+                print("   ♻️  Reusing pooled connection")
+                result['response_time'] = round(time.time() - start_time, 2)
+                return ssh, result
+            
             # Create SSH client
             ssh = paramiko.SSHClient()
             ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -479,42 +789,73 @@ class SSHConnectivityTester:
             
             # Calculate response time
             result['response_time'] = round(time.time() - start_time, 2)
+            return ssh, result
             
-            # Add delay to allow SSH session to fully stabilize
-            time.sleep(2.0)
-            
-            # Test a simple command
-            stdin, stdout, stderr = ssh.exec_command('whoami', timeout=5)
-            command_output = stdout.read().decode().strip()
-            command_error = stderr.read().decode().strip()
+        except Exception as e:
+            self._record_error(result, e)
+            result['response_time'] = round(time.time() - start_time, 2)
+            return None, result
+    
+    def _phase_detect(self, ssh, result: Dict) -> Dict:
+        """Run the command test and flavour detection on a connected host"""
+        host_name = result['name']
+        start_time = time.time()
+        
+        try:
+            # The command test rides along as the first section of the batched probe
+            probe_outputs = self.collect_probe_outputs(ssh, ['whoami'])
+            command_output = probe_outputs.get('whoami', '')
             
-            if command_output and not command_error:
+            if self._command_test_passed(result, command_output):
                 result['command_test'] = True
                 result['command_output'] = command_output
             
-            # Add another small delay before flavour detection
-            time.sleep(1.0)
-            
             # Detect actual server flavour
-            detected_flavour = self.detect_server_flavour(ssh, host_name)
-            result['detected_flavour'] = detected_flavour
-            
-            # Check if detected flavour matches configured flavour
-            if detected_flavour != flavour and detected_flavour != "Unknown":
-                result['flavour_mismatch'] = True
-                result['configured_flavour'] = flavour
-                print(f"   ⚠️  Flavour mismatch! Configured: {flavour}, Detected: {detected_flavour}")
-            else:
-                result['flavour_mismatch'] = False
-                if detected_flavour != "Unknown":
-                    print(f"   ✅ Flavour confirmed: {detected_flavour}")
+            detected_flavour = self.detect_server_flavour(ssh, host_name, probe_outputs)
+            self._record_flavour(result, detected_flavour)
             
-            ssh.close()
+            # Keep the connection warm for the next scan instead of closing it
+            self.pool.release((result['hostname'], result['username']), ssh)
             
             result['status'] = 'SUCCESS'
             print(f"   ✅ Connection successful (Response time: {result['response_time']}s)")
             
-        except paramiko.AuthenticationException as e:
+        except Exception as e:
+            ssh.close()
+            self._record_error(result, e)
+        
+        finally:
+            # response_time stays the connect time; detection is timed separately
+            result['detection_time'] = round(time.time() - start_time, 2)
+        
+        return result
+    
+    def _command_test_passed(self, result: Dict, command_output: str) -> bool:
+        """Check whoami output; stderr is discarded by the probes, so require exactly the login name"""
+        return bool(command_output) and command_output == result['username']
+    
+    def _record_flavour(self, result: Dict, detected_flavour: str) -> None:
+        """Store the detected flavour and flag a mismatch with the configured one"""
+        flavour = result['flavour']
+        result['detected_flavour'] = detected_flavour
+        
+        # Check if detected flavour matches configured flavour; a confirmed match is the common case
+        if detected_flavour == flavour:
+            result['flavour_mismatch'] = False
+            if detected_flavour != "Unknown":
+                print(f"   ✅ Flavour confirmed: {detected_flavour}")
+        elif detected_flavour == "Unknown":
+            result['flavour_mismatch'] = False
+        else:
+            result['flavour_mismatch'] = True
+            result['configured_flavour'] = flavour
+            print(f"   ⚠️  Flavour mismatch! Configured: {flavour}, Detected: {detected_flavour}")
+    
+    def _record_error(self, result: Dict, e: Exception) -> None:
+        """Classify a connection error and fill in status, message and suggestions"""
+        import paramiko
+        
+        if isinstance(e, paramiko.AuthenticationException) or (asyncssh and isinstance(e, asyncssh.PermissionDenied)):
             result['status'] = 'AUTH_FAILED'
             result['error_type'] = 'Authentication'
             result['error_message'] = str(e)
@@ -525,7 +866,7 @@ class SSHConnectivityTester:
             ]
             print(f"   ❌ Authentication failed")
             
-        except paramiko.ssh_exception.NoValidConnectionsError as e:
+        elif isinstance(e, (paramiko.ssh_exception.NoValidConnectionsError, ConnectionRefusedError)):
             result['status'] = 'CONNECTION_REFUSED'
             result['error_type'] = 'Connection Refused'
             result['error_message'] = str(e)
@@ -536,7 +877,7 @@ class SSHConnectivityTester:
             ]
             print(f"   ❌ Connection refused")
             
-        except paramiko.ssh_exception.SSHException as e:
+        elif isinstance(e, paramiko.ssh_exception.SSHException) or (asyncssh and isinstance(e, asyncssh.Error)):
             result['status'] = 'SSH_ERROR'
             result['error_type'] = 'SSH Protocol'
             result['error_message'] = str(e)
@@ -546,10 +887,10 @@ class SSHConnectivityTester:
             ]
             print(f"   ❌ SSH protocol error")
             
-        except Exception as e:
+        else:
             error_str = str(e).lower()
             
-            if 'timeout' in error_str or 'timed out' in error_str:
+            if isinstance(e, TimeoutError) or 'timeout' in error_str or 'timed out' in error_str:
                 result['status'] = 'TIMEOUT'
                 result['error_type'] = 'Timeout'
                 result['suggestions'] = [
@@ -578,11 +919,6 @@ class SSHConnectivityTester:
                 print(f"   ❌ Unexpected error: {str(e)}")
             
             result['error_message'] = str(e)
-        
-        finally:
-            result['response_time'] = round(time.time() - start_time, 2)
-        
-        return result
     
     def test_all_hosts_sequential(self, timeout: int = 10) -> None:
         """Test all hosts sequentially"""
@@ -599,32 +935,198 @@ class SSHConnectivityTester:
             self.results.append(result)
         
         self.end_time = datetime.now()
+        self._update_summary()
     
-    def test_all_hosts_parallel(self, timeout: int = 10, max_workers: int = 5) -> None:
-        """Test all hosts in parallel using ThreadPoolExecutor"""
+    def test_all_hosts_parallel(self, timeout: int = 10, max_workers: int = None, connect_workers: int = 64) -> None:
+        """Test all hosts in parallel, with separate pools for connecting and detection"""
+        if not max_workers:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        connect_workers = max(1, min(connect_workers, len(self.hosts)))
+        
         print(f"\n🚀 Starting parallel SSH connectivity tests...")
         print(f"📊 Total hosts to test: {len(self.hosts)}")
         print(f"⏱️  Connection timeout: {timeout}s")
-        print(f"🧵 Max parallel connections: {max_workers}")
+        print(f"🔌 Parallel connects: {connect_workers}")
+        print(f"🧵 Max parallel detections: {max_workers}")
         print("=" * 70)
         
         self.start_time = datetime.now()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_host = {
-                executor.submit(self.test_single_host, host_config, timeout): host_config 
+        # Connects are pure network waits, so they get a wide pool; each connected
+        # host is handed to the detection pool as soon as its handshake finishes
+        with ThreadPoolExecutor(max_workers=connect_workers, initializer=_pool_thread_init) as connect_executor, \
+                ThreadPoolExecutor(max_workers=max_workers, initializer=_pool_thread_init) as detect_executor:
+            connect_futures = [
+                connect_executor.submit(self._phase_connect, host_config, timeout)
                 for host_config in self.hosts
-            }
+            ]
+            
+            detect_futures = []
+            for future in as_completed(connect_futures):
+                ssh, result = future.result()
+                if ssh is None:
+                    self.results.append(result)
+                else:
+                    detect_futures.append(detect_executor.submit(self._phase_detect, ssh, result))
             
             # Collect results as they complete
-            for future in as_completed(future_to_host):
-                result = future.result()
-                self.results.append(result)
+            for future in as_completed(detect_futures):
+                self.results.append(future.result())
         
         # Sort results by hostname for consistent output
         self.results.sort(key=lambda x: x['hostname'])
         self.end_time = datetime.now()
+        self._update_summary()
+    
+    async def _probe_async(self, host_config: Dict, timeout: int, semaphore) -> Dict:
+        """Probe a single host with asyncssh, reusing one connection for all commands"""
+        result = self._new_result(host_config)
+        
+        async with semaphore:
+            start_time = time.time()
+            connected_at = None
+            try:
+                conn = await asyncio.wait_for(
+                    asyncssh.connect(
+                        result['hostname'],
+                        username=result['username'],
+                        password=host_config.get('password', ''),
+                        known_hosts=None,
+                        client_keys=None,
+                        agent_path=None
+                    ),
+                    timeout
+                )
+                connected_at = time.time()
+                result['response_time'] = round(connected_at - start_time, 2)
+                
+                async with conn:
+                    # The command test and flavour probes run concurrently on the same connection
+                    whoami, (detected_flavour, probe_outputs) = await asyncio.gather(
+                        self._run_probe_async(conn, 'whoami'),
+                        self.detect_flavour_async(conn)
+                    )
+                
+                # A sudo rule is next in priority order: finish on the paramiko/sudo path
+                if detected_flavour is None:
+                    detected_flavour = await asyncio.to_thread(
+                        self._detect_over_paramiko, host_config, probe_outputs, timeout
+                    )
+                
+                command_output = whoami[1]
+                if self._command_test_passed(result, command_output):
+                    result['command_test'] = True
+                    result['command_output'] = command_output
+                
+                result['status'] = 'SUCCESS'
+                print(f"   ✅ {result['name']} ({result['hostname']}) connected in {result['response_time']}s")
+                self._record_flavour(result, detected_flavour)
+                
+            except Exception as e:
+                print(f"   🔴 {result['name']} ({result['hostname']})")
+                self._record_error(result, e)
+            
+            finally:
+                if connected_at is None:
+                    result['response_time'] = round(time.time() - start_time, 2)
+                else:
+                    result['detection_time'] = round(time.time() - connected_at, 2)
+        
+        return result
+    
+    async def _run_probe_async(self, conn, command: str, timeout: int = 15) -> Tuple[str, str]:
+        """Run one probe command on an asyncssh connection, returning (command, stdout)"""
+        try:
+            completed = await asyncio.wait_for(
+                conn.run(f"export PATH=/opt/versa/bin:$PATH; {command}"), timeout
+            )
+            return command, str(completed.stdout or '').strip()
+        except Exception:
+            return command, ''
+    
+    async def detect_flavour_async(self, conn) -> Tuple[str, Dict[str, str]]:
+        """Launch every non-sudo probe at once and return (flavour, probe outputs) once the winner is known.
+        
+        The flavour is None when a sudo rule is reached first; it needs the interactive paramiko shell.
+        """
+        if not self.flavour_configs:
+            return "Unknown", {}
+        
+        rule_indices = [idx for idx in self._rule_order if self._rule_cmd[idx]]
+        commands = list(dict.fromkeys(
+            self._rule_cmd[idx] for idx in rule_indices if not self._rule_sudo[idx]
+        ))
+        tasks = [asyncio.ensure_future(self._run_probe_async(conn, command)) for command in commands]
+        completed = asyncio.as_completed(tasks)
+        
+        outputs = {}
+        matched = set()
+        position = 0
+        try:
+            while True:
+                # A match only wins once every higher-priority rule has been ruled out
+                while position < len(rule_indices):
+                    idx = rule_indices[position]
+                    if self._rule_sudo[idx]:
+                        return None, outputs
+                    if self._rule_cmd[idx] not in outputs:
+                        break
+                    if idx in matched:
+                        return self._rule_flavour_name[idx], outputs
+                    position += 1
+                else:
+                    return "Unknown", outputs
+                
+                command, stdout = await next(completed)
+                outputs[command] = stdout
+                matched |= self.match_all_rules({command: stdout})
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _detect_over_paramiko(self, host_config: Dict, probe_outputs: Dict[str, str], timeout: int) -> str:
+        """Finish flavour detection on a paramiko connection, reusing the probes already run"""
+        ssh, _ = self._phase_connect(host_config, timeout)
+        if ssh is None:
+            return "Unknown"
+        try:
+            return self.detect_server_flavour(ssh, host_config.get('name', 'Unknown'), probe_outputs)
+        finally:
+            self.pool.release((host_config.get('hostname', ''), host_config.get('user', '')), ssh)
+    
+    async def test_all_hosts_async(self, timeout: int = 10, concurrency: int = 200) -> None:
+        """Test all hosts concurrently on a single asyncio event loop using asyncssh"""
+        print(f"\n🚀 Starting async SSH connectivity tests...")
+        print(f"📊 Total hosts to test: {len(self.hosts)}")
+        print(f"⏱️  Connection timeout: {timeout}s")
+        print(f"🔀 Max concurrent connections: {concurrency}")
+        print("=" * 70)
+        
+        self.start_time = datetime.now()
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [self._probe_async(host_config, timeout, semaphore) for host_config in self.hosts]
+        
+        # Collect results as they complete
+        for next_result in asyncio.as_completed(tasks):
+            self.results.append(await next_result)
+        
+        # Sort results by hostname for consistent output
+        self.results.sort(key=lambda x: x['hostname'])
+        self.end_time = datetime.now()
+        self._update_summary()
+    
+    def _update_summary(self) -> None:
+        """Cache per-status result counts once a test run completes"""
+        self._summary = Counter(r['status'] for r in self.results)
+    
+    def status_counts(self) -> Tuple[int, int]:
+        """Return (successful, failed) from the cached status summary"""
+        if sum(self._summary.values()) != len(self.results):
+            self._update_summary()
+        successful = self._summary.get('SUCCESS', 0)
+        failed = sum(count for status, count in self._summary.items() if status != 'SUCCESS')
+        return successful, failed
     
     def print_summary_report(self) -> None:
         """Print a detailed summary report"""
@@ -632,8 +1134,37 @@ class SSHConnectivityTester:
             print("❌ No test results available")
             return
         
+        # Aggregate everything the report needs in a single pass over the results
+        status_groups = defaultdict(list)
+        flavour_stats = defaultdict(lambda: {'total': 0, 'success': 0})
+        detected_flavours = Counter()
+        detection_stats = {'detected': 0, 'mismatches': 0, 'unknown': 0}
+        successful = 0
+        total_response_time = 0
+        
+        for result in self.results:
+            status = result['status']
+            status_groups[status].append(result)
+            
+            stats = flavour_stats[result.get('flavour', 'Unknown')]
+            stats['total'] += 1
+            
+            if status == 'SUCCESS':
+                successful += 1
+                total_response_time += result['response_time']
+                stats['success'] += 1
+                
+                detected_flavour = result.get('detected_flavour', 'Unknown')
+                if detected_flavour == 'Unknown':
+                    detection_stats['unknown'] += 1
+                else:
+                    detection_stats['detected'] += 1
+                    detected_flavours[detected_flavour] += 1
+                
+                if result.get('flavour_mismatch', False):
+                    detection_stats['mismatches'] += 1
+        
         total_tests = len(self.results)
-        successful = len([r for r in self.results if r['status'] == 'SUCCESS'])
         failed = total_tests - successful
         
         duration = (self.end_time - self.start_time).total_seconds() if self.start_time and self.end_time else 0
@@ -648,44 +1179,16 @@ class SSHConnectivityTester:
         print(f"📈 Success Rate: {(successful/total_tests*100):.1f}%")
         
         if successful > 0:
-            avg_response_time = sum(r['response_time'] for r in self.results if r['status'] == 'SUCCESS') / successful
+            avg_response_time = total_response_time / successful
             print(f"⚡ Average Response Time: {avg_response_time:.2f}s")
         
         # Flavour breakdown
-        flavour_stats = {}
-        for result in self.results:
-            flavour = result.get('flavour', 'Unknown')
-            if flavour not in flavour_stats:
-                flavour_stats[flavour] = {'total': 0, 'success': 0}
-            flavour_stats[flavour]['total'] += 1
-            if result['status'] == 'SUCCESS':
-                flavour_stats[flavour]['success'] += 1
-        
         print(f"\n🏷️  FLAVOUR BREAKDOWN (Configured):")
         for flavour, stats in sorted(flavour_stats.items()):
             success_rate = (stats['success'] / stats['total'] * 100) if stats['total'] > 0 else 0
             print(f"   {flavour}: {stats['success']}/{stats['total']} ({success_rate:.0f}%)")
         
         # Flavour detection summary
-        detection_stats = {'detected': 0, 'mismatches': 0, 'unknown': 0}
-        detected_flavours = {}
-        
-        for result in self.results:
-            if result['status'] == 'SUCCESS':
-                detected_flavour = result.get('detected_flavour', 'Unknown')
-                flavour_mismatch = result.get('flavour_mismatch', False)
-                
-                if detected_flavour == 'Unknown':
-                    detection_stats['unknown'] += 1
-                else:
-                    detection_stats['detected'] += 1
-                    if detected_flavour not in detected_flavours:
-                        detected_flavours[detected_flavour] = 0
-                    detected_flavours[detected_flavour] += 1
-                    
-                if flavour_mismatch:
-                    detection_stats['mismatches'] += 1
-        
         if successful > 0:
             print(f"\n🔍 FLAVOUR DETECTION RESULTS:")
             print(f"   ✅ Successfully Detected: {detection_stats['detected']}/{successful} ({detection_stats['detected']/successful*100:.0f}%)")
@@ -697,73 +1200,71 @@ class SSHConnectivityTester:
                 for flavour, count in sorted(detected_flavours.items()):
                     print(f"   {flavour}: {count} hosts")
         
-        print("\n" + "─" * 80)
+        print("\n" + SEPARATOR_WIDE)
         print("📝 DETAILED RESULTS")
-        print("─" * 80)
-        
-        # Group results by status
-        status_groups = {}
-        for result in self.results:
-            status = result['status']
-            if status not in status_groups:
-                status_groups[status] = []
-            status_groups[status].append(result)
+        print(SEPARATOR_WIDE)
         
         # Print successful connections
         if 'SUCCESS' in status_groups:
             print(f"\n✅ SUCCESSFUL CONNECTIONS ({len(status_groups['SUCCESS'])})")
-            print("─" * 40)
+            print(SEPARATOR_NARROW)
             for result in status_groups['SUCCESS']:
-                configured_flavour = result.get('flavour', 'Unknown')
                 detected_flavour = result.get('detected_flavour', 'Unknown')
-                flavour_mismatch = result.get('flavour_mismatch', False)
-                
-                if flavour_mismatch:
-                    flavour_display = f"⚠️ {configured_flavour}→{detected_flavour}"
-                elif detected_flavour != 'Unknown':
-                    flavour_display = f"✅ {detected_flavour}"
-                else:
-                    flavour_display = f"❓ {configured_flavour}"
-                    
+                display_key = (bool(result.get('flavour_mismatch', False)), detected_flavour == 'Unknown')
+                flavour_display = FLAVOUR_DISPLAY[display_key].format(
+                    configured=result.get('flavour', 'Unknown'), detected=detected_flavour
+                )
                 print(f"   🟢 {result['name']} ({result['hostname']}) - {flavour_display} - {result['response_time']}s")
         
         # Print failed connections with details
-        failed_statuses = [k for k in status_groups.keys() if k != 'SUCCESS']
-        if failed_statuses:
-            print(f"\n❌ FAILED CONNECTIONS ({sum(len(status_groups[s]) for s in failed_statuses)})")
-            print("─" * 40)
-            
-            for status in failed_statuses:
-                for result in status_groups[status]:
-                    print(f"   🔴 {result['name']} ({result['hostname']}) - {result['flavour']}")
-                    print(f"      Error Type: {result['error_type']}")
-                    print(f"      Error: {result['error_message']}")
+        if failed:
+            print(f"\n❌ FAILED CONNECTIONS ({failed})")
+            print(SEPARATOR_NARROW)
+            
+            for status, results in status_groups.items():
+                if status == 'SUCCESS':
+                    continue
+                
+                # One write per status group rather than one per line
+                lines = []
+                for result in results:
+                    lines.append(f"   🔴 {result['name']} ({result['hostname']}) - {result['flavour']}")
+                    lines.append(f"      Error Type: {result['error_type']}")
+                    lines.append(f"      Error: {result['error_message']}")
                     if result['suggestions']:
-                        print(f"      Suggestions:")
-                        for suggestion in result['suggestions']:
-                            print(f"        • {suggestion}")
-                    print()
+                        lines.append(f"      Suggestions:")
+                        lines.extend(f"        • {suggestion}" for suggestion in result['suggestions'])
+                    lines.append("")
+                print('\n'.join(lines))
+    
+    def _export_filename(self, extension: str) -> str:
+        """Default timestamped export filename; every export of a run shares one timestamp"""
+        if self._export_timestamp is None:
+            self._export_timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+        return f"ssh_test_results_{self._export_timestamp}.{extension}"
+    
+    def _export_payload(self) -> Dict:
+        """Summary block plus results, as written by the JSON export"""
+        successful, failed = self.status_counts()
+        return {
+            'test_summary': {
+                'total_hosts': len(self.results),
+                'successful': successful,
+                'failed': failed,
+                'start_time': self.start_time.isoformat() if self.start_time else None,
+                'end_time': self.end_time.isoformat() if self.end_time else None,
+                'duration_seconds': (self.end_time - self.start_time).total_seconds() if self.start_time and self.end_time else 0
+            },
+            'results': self.results
+        }
     
     def export_results_csv(self, filename: str = None) -> str:
         """Export results to CSV file"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"ssh_test_results_{timestamp}.csv"
+            filename = self._export_filename('csv')
         
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'name', 'hostname', 'username', 'flavour', 'detected_flavour', 'flavour_mismatch',
-                    'status', 'error_type', 'error_message', 'response_time', 'command_test', 'timestamp'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for result in self.results:
-                    # Create a clean copy for CSV export
-                    csv_row = {k: v for k, v in result.items() if k in fieldnames}
-                    writer.writerow(csv_row)
-            
+            _write_csv(filename, self.results)
             print(f"\n💾 Results exported to CSV: {filename}")
             return filename
             
@@ -771,34 +1272,154 @@ class SSHConnectivityTester:
             print(f"❌ Error exporting to CSV: {str(e)}")
             return None
     
-    def export_results_json(self, filename: str = None) -> str:
+    def export_results_json(self, filename: str = None, compact: bool = False) -> str:
         """Export results to JSON file"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"ssh_test_results_{timestamp}.json"
+            filename = self._export_filename('json')
         
         try:
-            export_data = {
-                'test_summary': {
-                    'total_hosts': len(self.results),
-                    'successful': len([r for r in self.results if r['status'] == 'SUCCESS']),
-                    'failed': len([r for r in self.results if r['status'] != 'SUCCESS']),
-                    'start_time': self.start_time.isoformat() if self.start_time else None,
-                    'end_time': self.end_time.isoformat() if self.end_time else None,
-                    'duration_seconds': (self.end_time - self.start_time).total_seconds() if self.start_time and self.end_time else 0
-                },
-                'results': self.results
-            }
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-            
+            _write_json(filename, self._export_payload(), compact)
             print(f"💾 Results exported to JSON: {filename}")
             return filename
             
         except Exception as e:
             print(f"❌ Error exporting to JSON: {str(e)}")
             return None
+    
+    def export_results_parquet(self, filename: str = None) -> str:
+        """Export results to a zstd-compressed Parquet file (requires pyarrow)"""
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            print("❌ Parquet export requires pyarrow (pip install pyarrow)")
+            return None
+        
+        if not filename:
+            filename = self._export_filename('parquet')
+        
+        try:
+            # Build the table column by column so optional fields become nulls
+            columns = list(dict.fromkeys(key for result in self.results for key in result))
+            table = pyarrow.table({key: [result.get(key) for result in self.results] for key in columns})
+            pyarrow.parquet.write_table(table, filename, compression='zstd')
+            print(f"💾 Results exported to Parquet: {filename}")
+            return filename
+            
+        except Exception as e:
+            print(f"❌ Error exporting to Parquet: {str(e)}")
+            return None
+    
+    def export_results_msgpack(self, filename: str = None) -> str:
+        """Export summary and results to a MessagePack file (requires msgpack)"""
+        try:
+            import msgpack
+        except ImportError:
+            print("❌ MessagePack export requires msgpack (pip install msgpack)")
+            return None
+        
+        if not filename:
+            filename = self._export_filename('msgpack')
+        
+        try:
+            with open(filename, 'wb', buffering=1 << 20) as f:
+                f.write(msgpack.packb(self._export_payload(), use_bin_type=True))
+            print(f"💾 Results exported to MessagePack: {filename}")
+            return filename
+            
+        except Exception as e:
+            print(f"❌ Error exporting to MessagePack: {str(e)}")
+            return None
+    
+    def export_results_parallel(self, csv_filename: str = None, json_filename: str = None,
+                                compact: bool = False) -> Tuple[str, str]:
+        """Write the CSV and JSON exports concurrently in two worker processes"""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        csv_filename = csv_filename or self._export_filename('csv')
+        json_filename = json_filename or self._export_filename('json')
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            csv_future = executor.submit(_write_csv, csv_filename, self.results)
+            json_future = executor.submit(_write_json, json_filename, self._export_payload(), compact)
+        
+        exported = []
+        for label, future, filename in (('CSV', csv_future, csv_filename), ('JSON', json_future, json_filename)):
+            try:
+                future.result()
+                print(f"💾 Results exported to {label}: {filename}")
+                exported.append(filename)
+            except Exception as e:
+                print(f"❌ Error exporting to {label}: {str(e)}")
+                exported.append(None)
+        
+        return exported[0], exported[1]
+
+def _write_csv(path: str, rows: List[Dict]) -> None:
+    """Write result rows to a CSV file (module level so it can run in a worker process)"""
+    import csv
+    
+    # Large buffer so the export goes out in a few big writes instead of one per row
+    with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        # Result records always carry every exported field, so columns are pulled positionally
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(map(_CSV_ROW_GETTER, rows))
+
+def _write_json(path: str, payload: Dict, compact: bool = False) -> None:
+    """Stream the JSON export one result at a time (module level so it can run in a worker process)"""
+    if orjson is not None:
+        _write_json_orjson(path, payload, compact)
+        return
+    
+    import json
+    
+    test_summary = payload['test_summary']
+    results = payload['results']
+    
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        if compact:
+            f.write('{"test_summary":')
+            json.dump(test_summary, f, ensure_ascii=False, separators=(',', ':'))
+            f.write(',"results":[')
+            for i, result in enumerate(results):
+                if i:
+                    f.write(',')
+                f.write(json.dumps(result, ensure_ascii=False, separators=(',', ':')))
+            f.write(']}')
+        else:
+            f.write('{\n  "test_summary": ')
+            f.write(json.dumps(test_summary, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+            f.write(',\n  "results": [')
+            for i, result in enumerate(results):
+                f.write(',\n    ' if i else '\n    ')
+                f.write(json.dumps(result, indent=2, ensure_ascii=False).replace('\n', '\n    '))
+            f.write('\n  ]\n}' if results else ']\n}')
+
+def _write_json_orjson(path: str, payload: Dict, compact: bool = False) -> None:
+    """orjson variant of _write_json, writing UTF-8 bytes straight to a binary file"""
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+    results = payload['results']
+    
+    with open(path, 'wb', buffering=1 << 20) as f:
+        if compact:
+            f.write(b'{"test_summary":')
+            f.write(orjson.dumps(payload['test_summary'], option=option))
+            f.write(b',"results":[')
+            for i, result in enumerate(results):
+                if i:
+                    f.write(b',')
+                f.write(orjson.dumps(result, option=option))
+            f.write(b']}')
+        else:
+            option |= orjson.OPT_INDENT_2
+            f.write(b'{\n  "test_summary": ')
+            f.write(orjson.dumps(payload['test_summary'], option=option).replace(b'\n', b'\n  '))
+            f.write(b',\n  "results": [')
+            for i, result in enumerate(results):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(orjson.dumps(result, option=option).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]\n}' if results else b']\n}')
 
 def main():
     """Main function with command line argument parsing"""
@@ -810,8 +1431,10 @@ Examples:
   %(prog)s                                    # Test all hosts with default settings
   %(prog)s -c my_hosts.json                   # Use custom config file
   %(prog)s -p -w 10                           # Parallel testing with 10 workers
+  %(prog)s --async                            # Async connectivity probe (asyncssh)
   %(prog)s -t 30 --export-csv                 # 30s timeout and export CSV
   %(prog)s --export-json --no-summary         # Export JSON without summary
+  %(prog)s --export-parquet                   # Columnar archive for large runs
         '''
     )
     
@@ -823,18 +1446,32 @@ Examples:
                        help='SSH connection timeout in seconds (default: 10)')
     parser.add_argument('-p', '--parallel', action='store_true',
                        help='Run tests in parallel instead of sequential')
-    parser.add_argument('-w', '--workers', type=int, default=5,
-                       help='Max parallel workers for parallel mode (default: 5)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='Probe connectivity on an asyncio event loop (requires asyncssh)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                       help='Max parallel detection workers for parallel mode (default: min(32, CPUs*4))')
+    parser.add_argument('--connect-workers', type=int, default=64,
+                       help='Max parallel connects for parallel mode (default: 64)')
     parser.add_argument('--export-csv', action='store_true',
                        help='Export results to CSV file')
     parser.add_argument('--export-json', action='store_true',
                        help='Export results to JSON file')
+    parser.add_argument('--export-parquet', action='store_true',
+                       help='Export results to a Parquet file (requires pyarrow)')
+    parser.add_argument('--export-msgpack', action='store_true',
+                       help='Export results to a MessagePack file (requires msgpack)')
+    parser.add_argument('--json-compact', action='store_true',
+                       help='Write the JSON export without indentation')
     parser.add_argument('--no-summary', action='store_true',
                        help='Skip printing summary report')
     parser.add_argument('--csv-file', type=str,
                        help='Custom CSV export filename')
     parser.add_argument('--json-file', type=str,
                        help='Custom JSON export filename')
+    parser.add_argument('--parquet-file', type=str,
+                       help='Custom Parquet export filename')
+    parser.add_argument('--msgpack-file', type=str,
+                       help='Custom MessagePack export filename')
     
     args = parser.parse_args()
     
@@ -850,24 +1487,46 @@ Examples:
     
     # Run tests
     try:
-        if args.parallel:
-            tester.test_all_hosts_parallel(timeout=args.timeout, max_workers=args.workers)
+        if args.use_async and _import_asyncssh() is None:
+            print("⚠️  asyncssh is not installed, falling back to threaded parallel mode")
+            args.use_async = False
+            args.parallel = True
+        
+        if args.use_async:
+            asyncio.run(tester.test_all_hosts_async(timeout=args.timeout))
+        elif args.parallel:
+            tester.test_all_hosts_parallel(timeout=args.timeout, max_workers=args.workers,
+                                           connect_workers=args.connect_workers)
         else:
             tester.test_all_hosts_sequential(timeout=args.timeout)
         
+        # Nothing else to produce: exit straight away, stopping at the first failed host
+        exporting = args.export_csv or args.export_json or args.export_parquet or args.export_msgpack
+        if args.no_summary and not exporting:
+            sys.exit(1 if any(r['status'] != 'SUCCESS' for r in tester.results) else 0)
+        
         # Print summary report
         if not args.no_summary:
             tester.print_summary_report()
         
-        # Export results
-        if args.export_csv:
-            tester.export_results_csv(args.csv_file)
+        # Export results; with both formats and an explicit --workers of 2 or more, write them in parallel
+        if args.export_csv and args.export_json and args.workers and args.workers >= 2:
+            tester.export_results_parallel(args.csv_file, args.json_file, compact=args.json_compact)
+        else:
+            if args.export_csv:
+                tester.export_results_csv(args.csv_file)
+            
+            if args.export_json:
+                tester.export_results_json(args.json_file, compact=args.json_compact)
+        
+        if args.export_parquet:
+            tester.export_results_parquet(args.parquet_file)
         
-        if args.export_json:
-            tester.export_results_json(args.json_file)
+        if args.export_msgpack:
+            tester.export_results_msgpack(args.msgpack_file)
         
         # Return appropriate exit code
-        failed_count = len([r for r in tester.results if r['status'] != 'SUCCESS'])
+        failed_count = tester.status_counts()[1]
         if failed_count > 0:
             print(f"\n⚠️  Warning: {failed_count} host(s) failed connectivity test")
             sys.exit(1)
@@ -881,6 +1540,9 @@ Examples:
     except Exception as e:
         print(f"\n❌ Unexpected error during testing: {str(e)}")
         sys.exit(1)
+    finally:
+        # Nothing reuses the pool after a one-shot CLI run, whichever way it ends
+        tester.pool.close_all()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Shared pytest configuration for the VersaLogIQ test suite
+"""
+
+# Category markers applied to the REST API connectivity TestCases
+CATEGORY_MARKERS = {
+    'basic': 'health and version endpoint checks',
+    'connectivity': 'per-server and bulk connection tests',
+    'status': 'server status and connectivity report tests',
+    'mock': 'mock server tests that need no real SSH hosts',
+    'performance': 'response time threshold tests',
+    'error': 'error handling tests',
+}
+
+def pytest_configure(config):
+    """Register the category markers so -m selection works without warnings"""
+    for name, description in CATEGORY_MARKERS.items():
+        config.addinivalue_line("markers", f"{name}: {description}")
@@ -15,6 +15,9 @@ sys.path.insert(0, str(project_root / 'integration'))
 sys.path.insert(0, str(project_root / 'mock'))
 sys.path.insert(0, str(project_root / '..' / 'backend'))
 
+from demo_helpers import buffered_section, scan_file_sizes
+
+@buffered_section
 def test_framework_components():
     """Test that all framework components are working"""
     print("🧪 VersaLogIQ Test Framework Demo")
@@ -48,11 +51,8 @@ def test_framework_components():
         print(f"❌ Mock response system failed: {e}")
         return False
     
-    # Test 3: Test basic imports (without full execution)
+    # Test 3: Check the test modules are present (without importing them)
     try:
-        # Import test modules without running them
-        import importlib.util
-        
         test_files = [
             'unit/test_flavor_detection.py',
             'unit/test_ssh_connection.py',
@@ -60,14 +60,13 @@ def test_framework_components():
         ]
         
         for test_file in test_files:
-            spec = importlib.util.spec_from_file_location("test_module", project_root / test_file)
-            if spec:
-                print(f"✅ Test module {test_file} can be imported")
+            if os.path.isfile(project_root / test_file):
+                print(f"✅ Test module file present: {test_file}")
             else:
-                print(f"❌ Test module {test_file} import failed")
+                print(f"❌ Test module file missing: {test_file}")
                 
     except Exception as e:
-        print(f"❌ Test module imports failed: {e}")
+        print(f"❌ Test module check failed: {e}")
         return False
     
     # Test 4: Check file structure
@@ -82,10 +81,10 @@ def test_framework_components():
     ]
     
     print("\n📁 Test Framework Structure:")
+    sizes = scan_file_sizes(project_root)
     for file_path in expected_files:
-        full_path = project_root / file_path
-        if full_path.exists():
-            size = full_path.stat().st_size
+        size = sizes.get(file_path)
+        if size is not None:
             print(f"   ✅ {file_path} ({size:,} bytes)")
         else:
             print(f"   ❌ {file_path} (missing)")
@@ -111,6 +110,7 @@ def test_framework_components():
     
     return True
 
+@buffered_section
 def demonstrate_mock_responses():
     """Demonstrate mock response capabilities"""
     print("\n🎭 Mock Response Demonstration")
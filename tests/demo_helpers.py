@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Output and file scanning helpers shared by the framework demo scripts
+"""
+
+import contextlib
+import functools
+import io
+import os
+import sys
+
+def buffered_section(func):
+    """Collect a section's printed output and write it to stdout in one call"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+    return wrapper
+
+def scan_file_sizes(root):
+    """Map each file under root (relative POSIX path) to its size using one scandir walk"""
+    sizes = {}
+    pending = [(str(root), "")]
+    while pending:
+        path, rel_prefix = pending.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                rel_path = rel_prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '__pycache__':
+                        pending.append((entry.path, rel_path + "/"))
+                else:
+                    sizes[rel_path] = entry.stat().st_size
+    return sizes
@@ -4,12 +4,12 @@ Comprehensive demonstration of VersaLogIQ Test Automation Framework
 Shows all components working together for REST API connectivity testing
 """
 
-import json
-import os
 import sys
 from pathlib import Path
-import time
 
+from demo_helpers import buffered_section, scan_file_sizes
+
+@buffered_section
 def show_test_framework_overview():
     """Display overview of the test framework"""
     print("🧪 VersaLogIQ Test Automation Framework")
@@ -18,6 +18,7 @@ def show_test_framework_overview():
     print("with mock servers, real server testing, and comprehensive reporting")
     print()
 
+@buffered_section
 def show_framework_structure():
     """Show the test framework structure"""
     print("📁 Test Framework Structure:")
@@ -44,15 +45,17 @@ def show_framework_structure():
         }
     }
     
-    def print_structure(items, prefix=""):
+    # Stat the whole tree once instead of once per listed file
+    sizes = scan_file_sizes(test_dir)
+    
+    def print_structure(items, prefix="", rel_dir=""):
         for name, description in items.items():
             if isinstance(description, dict):
                 print(f"{prefix}📂 {name}")
-                print_structure(description, prefix + "   ")
+                print_structure(description, prefix + "   ", rel_dir + name)
             else:
-                file_path = test_dir / name if not prefix else test_dir / name
-                if file_path.exists():
-                    size = file_path.stat().st_size if file_path.is_file() else 0
+                size = sizes.get(rel_dir + name)
+                if size is not None:
                     print(f"{prefix}✅ {name} ({size:,} bytes)")
                     print(f"{prefix}   {description}")
                 else:
@@ -60,11 +63,14 @@ def show_framework_structure():
     
     print_structure(structure)
 
+@buffered_section
 def show_ssh_hosts_configuration():
     """Show servers configured for testing"""
     print("\n🖥️  Server Configuration (ssh_hosts.json):")
     print("=" * 50)
     
+    import json
+    
     ssh_hosts_file = Path(__file__).parent.parent / "ssh_hosts.json"
     
     try:
@@ -76,25 +82,27 @@ def show_ssh_hosts_configuration():
         print()
         
         flavor_count = {}
+        lines = []
         for i, server in enumerate(servers, 1):
             flavor = server['flavour']
             flavor_count[flavor] = flavor_count.get(flavor, 0) + 1
             
-            print(f"{i}. {server['name']}")
-            print(f"   Hostname: {server['hostname']}")
-            print(f"   Flavor: {flavor}")
-            print(f"   User: {server['user']}")
-            print()
+            lines.append(f"{i}. {server['name']}")
+            lines.append(f"   Hostname: {server['hostname']}")
+            lines.append(f"   Flavor: {flavor}")
+            lines.append(f"   User: {server['user']}")
+            lines.append("")
         
-        print("Server Types Summary:")
-        for flavor, count in flavor_count.items():
-            print(f"   {flavor}: {count} server(s)")
+        lines.append("Server Types Summary:")
+        lines.extend(f"   {flavor}: {count} server(s)" for flavor, count in flavor_count.items())
+        print('\n'.join(lines))
             
     except FileNotFoundError:
         print("❌ ssh_hosts.json not found")
     except json.JSONDecodeError as e:
         print(f"❌ Invalid JSON in ssh_hosts.json: {e}")
 
+@buffered_section
 def show_test_capabilities():
     """Show test framework capabilities"""
     print("\n🔧 Test Framework Capabilities:")
@@ -116,9 +124,9 @@ def show_test_capabilities():
         "✅ WebSocket Event Testing - Real-time communication validation"
     ]
     
-    for capability in capabilities:
-        print(f"   {capability}")
+    print('\n'.join(f"   {capability}" for capability in capabilities))
 
+@buffered_section
 def show_rest_api_endpoints():
     """Show REST API endpoints available for testing"""
     print("\n🌐 REST API Endpoints:")
@@ -133,9 +141,9 @@ def show_rest_api_endpoints():
         ("GET", "/api/connectivity_report", "Generate comprehensive report")
     ]
     
-    for method, endpoint, description in endpoints:
-        print(f"   {method:4} {endpoint:35} - {description}")
+    print('\n'.join(f"   {method:4} {endpoint:35} - {description}" for method, endpoint, description in endpoints))
 
+@buffered_section
 def show_test_execution_examples():
     """Show examples of running tests"""
     print("\n🚀 Test Execution Examples:")
@@ -155,9 +163,9 @@ def show_test_execution_examples():
         ("Mock Tests Only", "python test_rest_api_connectivity.py --mock-only")
     ]
     
-    for description, command in examples:
-        print(f"   {description:20} : {command}")
+    print('\n'.join(f"   {description:20} : {command}" for description, command in examples))
 
+@buffered_section
 def show_mock_testing_capabilities():
     """Show mock testing capabilities"""
     print("\n🎭 Mock Testing System:")
@@ -174,17 +182,23 @@ def show_mock_testing_capabilities():
         "🌐 All Server Types - VMS, VOS, SCIM, ECP, VAN, Ubuntu coverage"
     ]
     
-    for feature in mock_features:
-        print(f"   {feature}")
+    print('\n'.join(f"   {feature}" for feature in mock_features))
 
+@buffered_section
 def demonstrate_api_testing():
     """Demonstrate API testing functionality"""
     print("\n📡 REST API Testing Demonstration:")
     print("=" * 45)
     
-    # Check if VersaLogIQ server is running
+    # requests is only needed here, so import it lazily
     try:
         import requests
+    except ImportError:
+        print("⚠️  requests module not available for API testing")
+        return
+    
+    # Check if VersaLogIQ server is running
+    try:
         response = requests.get("http://localhost:5000/health", timeout=2)
         if response.status_code == 200:
             data = response.json()
@@ -197,11 +211,10 @@ def demonstrate_api_testing():
         print("❌ VersaLogIQ server is not running")
         print("   Start the server to test REST API endpoints")
         print("   Command: cd backend && python versalogiq_app.py")
-    except ImportError:
-        print("⚠️  requests module not available for API testing")
     except Exception as e:
         print(f"❌ API test error: {e}")
 
+@buffered_section
 def show_next_steps():
     """Show next steps for using the framework"""
     print("\n📋 Next Steps:")
@@ -220,8 +233,7 @@ def show_next_steps():
         "10. 📋 Generate full report: python run_tests.py --report full_results.json"
     ]
     
-    for step in steps:
-        print(f"   {step}")
+    print('\n'.join(f"   {step}" for step in steps))
 
 def main():
     """Main demonstration function"""
@@ -5,15 +5,22 @@ REST API connectivity tests for VersaLogIQ servers
 
 import unittest
 import requests
+from urllib3.util.retry import Retry
 import json
 import time
+import functools
+import socket
+import types
+from urllib.parse import urlsplit
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from unittest.mock import Mock, patch
 import sys
 import os
 from pathlib import Path
 
 # Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'backend'))
 sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -28,42 +35,168 @@ except ImportError:
         'timeout': {'default': 10}
     }
 
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+# Mock tests call the Flask app in-process when it imports, skipping the
+# loopback socket entirely; set VERSALOGIQ_TEST_EXTERNAL=1 to force HTTP
+_FLASK_APP = None
+if not os.environ.get('VERSALOGIQ_TEST_EXTERNAL'):
+    try:
+        from versalogiq_app import app as _FLASK_APP
+    except ImportError:
+        _FLASK_APP = None
+
 try:
     from mock.mock_responses import create_mock_server
 except ImportError:
     def create_mock_server(flavor):
         return {'flavor': flavor, 'responses': {}}
 
-class TestRESTAPIConnectivity(unittest.TestCase):
+BASE_URL = "http://localhost:5000"
+
+# Resolved once at import; open() takes the plain string directly
+_SSH_HOSTS_FILE = str(Path(__file__).resolve().parent.parent / "ssh_hosts.json")
+
+# Mock server configurations based on ssh_hosts.json
+MOCK_SERVERS = tuple(types.MappingProxyType(server) for server in (
+    {
+        'name': 'mock-vms-server',
+        'hostname': '192.168.1.100',
+        'flavour': 'VMS',
+        'user': 'admin',
+        'password': 'test123'
+    },
+    {
+        'name': 'mock-vos-server',
+        'hostname': '192.168.1.101',
+        'flavour': 'VOS',
+        'user': 'admin',
+        'password': 'test123'
+    },
+    {
+        'name': 'mock-scim-server',
+        'hostname': '192.168.1.102',
+        'flavour': 'SCIM',
+        'user': 'versa',
+        'password': 'test123'
+    }
+))
+
+@functools.lru_cache(maxsize=1)
+def _load_ssh_hosts(path: str) -> tuple:
+    """Load servers from ssh_hosts.json once and cache them as read-only mappings"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return ()
+    return tuple(types.MappingProxyType(host) for host in data.get('hosts', []))
+
+# Category name -> TestCase classes, used when running without pytest
+_CATEGORY_CLASSES = {}
+
+def _category(name):
+    """Tag a TestCase with a pytest marker (selected with pytest -m name)"""
+    def decorate(cls):
+        _CATEGORY_CLASSES.setdefault(name, []).append(cls)
+        return getattr(pytest.mark, name)(cls) if pytest else cls
+    return decorate
+
+@functools.lru_cache(maxsize=1)
+def _server_up() -> bool:
+    """Probe the VersaLogIQ port once per run"""
+    url = urlsplit(BASE_URL)
+    try:
+        with socket.create_connection((url.hostname, url.port or 80), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+class _ServerRequiredMixin:
+    """Skip a whole TestCase up front when the VersaLogIQ server is down"""
+    
+    requires_live_server = True
+    
+    @classmethod
+    def setUpClass(cls):
+        """Skip every test in the class without waiting on request timeouts"""
+        if cls.requires_live_server and not _server_up():
+            raise unittest.SkipTest("VersaLogIQ server not running")
+        super().setUpClass()
+
+class _SshHostsMixin:
+    """Shared access to the servers configured in ssh_hosts.json"""
+    
+    ssh_hosts_file = _SSH_HOSTS_FILE
+    
+    @classmethod
+    def _hosts(cls) -> tuple:
+        """Return the cached host mappings for this class's hosts file"""
+        return _load_ssh_hosts(cls.ssh_hosts_file)
+
+# Keys each response shape must carry, checked with one set difference
+_VERSION_KEYS = frozenset({'service', 'version', 'features'})
+_CONNECTION_KEYS = frozenset({'success', 'hostname', 'connection_time'})
+_BULK_TOP_KEYS = frozenset({'results', 'summary'})
+_BULK_SUMMARY_KEYS = frozenset({'total_tested', 'successful', 'failed'})
+_STATUS_KEYS = frozenset({'hostname', 'status', 'last_check'})
+_REPORT_TOP_KEYS = frozenset({'generated_at', 'servers', 'summary'})
+_REPORT_SUMMARY_KEYS = frozenset({'total_servers', 'online_servers', 'offline_servers', 'by_flavor'})
+
+# Upper bound on ThreadPoolExecutor workers used by the per-server fan-out;
+# the adapter pool must be at least this large or extra threads queue for a socket
+_MAX_FANOUT_WORKERS = 32
+
+# One pooled session for the whole module so every test reuses the same
+# keep-alive connection to the VersaLogIQ server instead of reconnecting.
+# Retries are disabled because the tests assert on exact status codes.
+_SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=_MAX_FANOUT_WORKERS,
+    pool_maxsize=_MAX_FANOUT_WORKERS,
+    max_retries=Retry(total=0)
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+def tearDownModule():
+    """Close the shared HTTP session"""
+    _SESSION.close()
+
+@_category('basic')
+class TestRESTAPIConnectivity(_ServerRequiredMixin, _SshHostsMixin, unittest.TestCase):
     """Test REST API connectivity to servers from ssh_hosts.json"""
     
+    session = _SESSION
+    base_url = BASE_URL
+    
+    # Test timeout settings
+    timeout = 10
+    connection_timeout = 30
+    
+    @classmethod
+    def setUpClass(cls):
+        """Fetch /health and /version concurrently, once for the whole class"""
+        super().setUpClass()
+        # Both probes are in flight together, each on its own pooled keep-alive connection
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cls._health_future = executor.submit(cls.session.get, f"{cls.base_url}/health", timeout=cls.timeout)
+            cls._version_future = executor.submit(cls.session.get, f"{cls.base_url}/version", timeout=cls.timeout)
+    
     def setUp(self):
         """Set up test environment"""
-        self.base_url = "http://localhost:5000"
-        self.ssh_hosts_file = Path(__file__).parent.parent / "ssh_hosts.json"
-        
         # Load SSH hosts configuration
-        self.servers = self.load_ssh_hosts()
-        
-        # Test timeout settings
-        self.timeout = 10
-        self.connection_timeout = 30
+        self.servers = list(self._hosts())
+        if not self.servers:
+            self.skipTest(f"No usable SSH hosts in {self.ssh_hosts_file}")
         
-    def load_ssh_hosts(self):
-        """Load servers from ssh_hosts.json"""
-        try:
-            with open(self.ssh_hosts_file, 'r') as f:
-                data = json.load(f)
-                return data.get('hosts', [])
-        except FileNotFoundError:
-            self.skipTest(f"SSH hosts file not found: {self.ssh_hosts_file}")
-        except json.JSONDecodeError as e:
-            self.skipTest(f"Invalid JSON in SSH hosts file: {e}")
-    
     def test_api_health_check(self):
         """Test basic API health check endpoint"""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=self.timeout)
+            response = self._health_future.result()
             
             self.assertEqual(response.status_code, 200)
             data = response.json()
@@ -76,57 +209,54 @@ class TestRESTAPIConnectivity(unittest.TestCase):
     def test_api_version_endpoint(self):
         """Test API version endpoint"""
         try:
-            response = requests.get(f"{self.base_url}/version", timeout=self.timeout)
+            response = self._version_future.result()
             
             self.assertEqual(response.status_code, 200)
             data = response.json()
-            self.assertIn('service', data)
-            self.assertIn('version', data)
-            self.assertIn('features', data)
+            missing = _VERSION_KEYS - data.keys()
+            self.assertFalse(missing, f"missing: {missing}")
             
         except requests.exceptions.ConnectionError:
             self.skipTest("VersaLogIQ server not running")
 
-class TestServerConnectivityAPI(unittest.TestCase):
+@_category('connectivity')
+class TestServerConnectivityAPI(_ServerRequiredMixin, _SshHostsMixin, unittest.TestCase):
     """Test API endpoints for server connectivity checking"""
     
+    session = _SESSION
+    base_url = BASE_URL
+    timeout = 15
+    
+    # API endpoints for testing (these would need to be added to the main app)
+    API_ENDPOINTS = types.MappingProxyType({
+        'test_connection': f"{BASE_URL}/api/test_connection",
+        'check_all_servers': f"{BASE_URL}/api/check_all_servers",
+        'server_status': f"{BASE_URL}/api/server_status",
+        'connectivity_report': f"{BASE_URL}/api/connectivity_report"
+    })
+    
     def setUp(self):
         """Set up server connectivity test environment"""
-        self.base_url = "http://localhost:5000"
-        self.ssh_hosts_file = Path(__file__).parent.parent / "ssh_hosts.json"
-        self.servers = self.load_ssh_hosts()
-        self.timeout = 15
-        
-        # Create API endpoints for testing (these would need to be added to the main app)
-        self.api_endpoints = {
-            'test_connection': f"{self.base_url}/api/test_connection",
-            'check_all_servers': f"{self.base_url}/api/check_all_servers",
-            'server_status': f"{self.base_url}/api/server_status",
-            'connectivity_report': f"{self.base_url}/api/connectivity_report"
-        }
-    
-    def load_ssh_hosts(self):
-        """Load servers from ssh_hosts.json"""
-        try:
-            with open(self.ssh_hosts_file, 'r') as f:
-                data = json.load(f)
-                return data.get('hosts', [])
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
+        self.servers = list(self._hosts())
     
     def test_individual_server_connectivity(self):
         """Test connectivity to individual servers via API"""
         if not self.servers:
             self.skipTest("No servers configured in ssh_hosts.json")
         
-        for server in self.servers:
-            with self.subTest(server=server['name']):
-                self._test_server_connection(server)
+        # Fire every server's request at once; the calls are I/O-bound
+        with ThreadPoolExecutor(max_workers=min(_MAX_FANOUT_WORKERS, len(self.servers))) as executor:
+            futures = {
+                executor.submit(self._post_server_connection, server): server
+                for server in self.servers
+            }
+            for future in as_completed(futures, timeout=self.timeout * 2):
+                server = futures[future]
+                with self.subTest(server=server['name']):
+                    self._test_server_connection(server, future)
     
-    def _test_server_connection(self, server):
-        """Test connection to a specific server"""
+    def _post_server_connection(self, server):
+        """POST a connection test request for a specific server"""
         payload = {
             'hostname': server['hostname'],
             'username': server['user'],
@@ -134,13 +264,17 @@ class TestServerConnectivityAPI(unittest.TestCase):
             'expected_flavor': server['flavour']
         }
         
+        # This endpoint would need to be implemented in the main application
+        return self.session.post(
+            self.API_ENDPOINTS['test_connection'],
+            json=payload,
+            timeout=self.timeout
+        )
+    
+    def _test_server_connection(self, server, response_future):
+        """Test connection to a specific server"""
         try:
-            # This endpoint would need to be implemented in the main application
-            response = requests.post(
-                self.api_endpoints['test_connection'],
-                json=payload,
-                timeout=self.timeout
-            )
+            response = response_future.result()
             
             if response.status_code == 404:
                 self.skipTest("API endpoint not implemented yet")
@@ -149,9 +283,8 @@ class TestServerConnectivityAPI(unittest.TestCase):
             data = response.json()
             
             # Verify response structure
-            self.assertIn('success', data)
-            self.assertIn('hostname', data)
-            self.assertIn('connection_time', data)
+            missing = _CONNECTION_KEYS - data.keys()
+            self.assertFalse(missing, f"missing: {missing}")
             
             if data['success']:
                 self.assertIn('detected_flavor', data)
@@ -174,8 +307,8 @@ class TestServerConnectivityAPI(unittest.TestCase):
         
         try:
             # This endpoint would check all servers in ssh_hosts.json
-            response = requests.post(
-                self.api_endpoints['check_all_servers'],
+            response = self.session.post(
+                self.API_ENDPOINTS['check_all_servers'],
                 timeout=60  # Longer timeout for multiple servers
             )
             
@@ -186,11 +319,10 @@ class TestServerConnectivityAPI(unittest.TestCase):
             data = response.json()
             
             # Verify response structure
-            self.assertIn('results', data)
-            self.assertIn('summary', data)
-            self.assertIn('total_tested', data['summary'])
-            self.assertIn('successful', data['summary'])
-            self.assertIn('failed', data['summary'])
+            missing = _BULK_TOP_KEYS - data.keys()
+            self.assertFalse(missing, f"missing: {missing}")
+            missing = _BULK_SUMMARY_KEYS - data['summary'].keys()
+            self.assertFalse(missing, f"missing: {missing}")
             
             # Verify all configured servers were tested
             tested_servers = {result['hostname'] for result in data['results']}
@@ -201,61 +333,65 @@ class TestServerConnectivityAPI(unittest.TestCase):
         except requests.exceptions.ConnectionError:
             self.skipTest("VersaLogIQ server not running")
 
-class TestServerStatusAPI(unittest.TestCase):
+@_category('status')
+class TestServerStatusAPI(_ServerRequiredMixin, _SshHostsMixin, unittest.TestCase):
     """Test API endpoints for server status monitoring"""
     
     def setUp(self):
         """Set up server status test environment"""
-        self.base_url = "http://localhost:5000"
-        self.ssh_hosts_file = Path(__file__).parent.parent / "ssh_hosts.json"
-        self.servers = self.load_ssh_hosts()
+        self.session = _SESSION
+        self.base_url = BASE_URL
+        self.servers = list(self._hosts())
         self.timeout = 10
-    
-    def load_ssh_hosts(self):
-        """Load servers from ssh_hosts.json"""
-        try:
-            with open(self.ssh_hosts_file, 'r') as f:
-                data = json.load(f)
-                return data.get('hosts', [])
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
+        
+        # Build every status URL once instead of formatting it inside the fan-out
+        status_prefix = f"{self.base_url}/api/server_status/"
+        self._status_urls = {s['hostname']: status_prefix + s['hostname'] for s in self.servers}
     
     def test_server_status_by_hostname(self):
         """Test getting server status by hostname"""
         if not self.servers:
             self.skipTest("No servers configured in ssh_hosts.json")
         
-        for server in self.servers:
-            with self.subTest(server=server['name']):
-                try:
-                    response = requests.get(
-                        f"{self.base_url}/api/server_status/{server['hostname']}",
-                        timeout=self.timeout
-                    )
-                    
-                    if response.status_code == 404:
-                        self.skipTest("Server status API endpoint not implemented yet")
-                    
-                    self.assertEqual(response.status_code, 200)
-                    data = response.json()
-                    
-                    # Verify response structure
-                    self.assertIn('hostname', data)
-                    self.assertIn('status', data)
-                    self.assertIn('last_check', data)
-                    
-                    self.assertEqual(data['hostname'], server['hostname'])
-                    self.assertIn(data['status'], ['online', 'offline', 'unknown'])
-                    
-                except requests.exceptions.ConnectionError:
-                    self.skipTest("VersaLogIQ server not running")
+        with ThreadPoolExecutor(max_workers=min(_MAX_FANOUT_WORKERS, len(self.servers))) as executor:
+            futures = {
+                executor.submit(
+                    self.session.get,
+                    self._status_urls[server['hostname']],
+                    timeout=self.timeout
+                ): server
+                for server in self.servers
+            }
+            for future in as_completed(futures, timeout=self.timeout * 2):
+                server = futures[future]
+                with self.subTest(server=server['name']):
+                    self._check_server_status(server, future)
+    
+    def _check_server_status(self, server, response_future):
+        """Verify the status response for a specific server"""
+        try:
+            response = response_future.result()
+            
+            if response.status_code == 404:
+                self.skipTest("Server status API endpoint not implemented yet")
+            
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            
+            # Verify response structure
+            missing = _STATUS_KEYS - data.keys()
+            self.assertFalse(missing, f"missing: {missing}")
+            
+            self.assertEqual(data['hostname'], server['hostname'])
+            self.assertIn(data['status'], ['online', 'offline', 'unknown'])
+            
+        except requests.exceptions.ConnectionError:
+            self.skipTest("VersaLogIQ server not running")
     
     def test_connectivity_report_endpoint(self):
         """Test comprehensive connectivity report endpoint"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/connectivity_report",
                 timeout=self.timeout
             )
@@ -267,19 +403,16 @@ class TestServerStatusAPI(unittest.TestCase):
             data = response.json()
             
             # Verify report structure
-            self.assertIn('generated_at', data)
-            self.assertIn('servers', data)
-            self.assertIn('summary', data)
+            missing = _REPORT_TOP_KEYS - data.keys()
+            self.assertFalse(missing, f"missing: {missing}")
             
             # Verify summary statistics
             summary = data['summary']
-            self.assertIn('total_servers', summary)
-            self.assertIn('online_servers', summary)
-            self.assertIn('offline_servers', summary)
-            self.assertIn('by_flavor', summary)
+            missing = _REPORT_SUMMARY_KEYS - summary.keys()
+            self.assertFalse(missing, f"missing: {missing}")
+            flavor_counts = summary['by_flavor']
             
             # Verify flavor breakdown
-            flavor_counts = summary['by_flavor']
             expected_flavors = {'VMS', 'VOS', 'SCIM', 'ECP', 'VAN'}
             
             for flavor in expected_flavors:
@@ -291,171 +424,161 @@ class TestServerStatusAPI(unittest.TestCase):
         except requests.exceptions.ConnectionError:
             self.skipTest("VersaLogIQ server not running")
 
-class TestMockServerConnectivity(unittest.TestCase):
+@_category('mock')
+class TestMockServerConnectivity(_ServerRequiredMixin, unittest.TestCase):
     """Test server connectivity using mock servers for reliable testing"""
     
+    session = _SESSION
+    base_url = BASE_URL
+    timeout = 10
+    mock_servers = MOCK_SERVERS
+    requires_live_server = _FLASK_APP is None
+    
     def setUp(self):
-        """Set up mock server testing environment"""
-        self.base_url = "http://localhost:5000"
-        self.timeout = 10
-        
-        # Mock server configurations based on ssh_hosts.json
-        self.mock_servers = [
-            {
-                'name': 'mock-vms-server',
-                'hostname': '192.168.1.100',
-                'flavour': 'VMS',
-                'user': 'admin',
-                'password': 'test123'
-            },
-            {
-                'name': 'mock-vos-server',
-                'hostname': '192.168.1.101',
-                'flavour': 'VOS',
-                'user': 'admin',
-                'password': 'test123'
-            },
-            {
-                'name': 'mock-scim-server',
-                'hostname': '192.168.1.102',
-                'flavour': 'SCIM',
-                'user': 'versa',
-                'password': 'test123'
-            }
-        ]
+        """Use the in-process Flask test client when the app imports"""
+        self.client = _FLASK_APP.test_client() if _FLASK_APP is not None else None
     
     def test_mock_server_connectivity(self):
         """Test connectivity to mock servers"""
+        # One bulk request covers every mock server instead of one POST each
+        try:
+            status_code, data = self._post_mock_servers()
+        except requests.exceptions.ConnectionError:
+            self.skipTest("VersaLogIQ server not running")
+        
+        if status_code == 404:
+            self.skipTest("Mock connectivity API endpoint not implemented yet")
+        
+        self.assertEqual(status_code, 200)
+        results_by_host = {entry['hostname']: entry for entry in data['results']}
+        
         for mock_server in self.mock_servers:
             with self.subTest(server=mock_server['name']):
-                self._test_mock_server_connection(mock_server)
+                self._test_mock_server_connection(mock_server, results_by_host.get(mock_server['hostname']))
     
-    def _test_mock_server_connection(self, mock_server):
-        """Test connection to a mock server"""
+    def _post_mock_servers(self):
+        """POST all mock servers to the bulk endpoint, returning (status_code, decoded body)"""
         payload = {
-            'hostname': mock_server['hostname'],
-            'username': mock_server['user'],
-            'password': mock_server['password'],
-            'expected_flavor': mock_server['flavour'],
+            'servers': [dict(server) for server in self.mock_servers],
             'use_mock': True  # Flag to use mock responses
         }
         
-        try:
-            response = requests.post(
-                f"{self.base_url}/api/test_connection",
-                json=payload,
-                timeout=self.timeout
-            )
-            
-            if response.status_code == 404:
-                self.skipTest("Mock connectivity API endpoint not implemented yet")
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            
-            # Verify mock response
-            self.assertTrue(data['success'])
-            self.assertEqual(data['hostname'], mock_server['hostname'])
-            self.assertEqual(data['detected_flavor'], mock_server['flavour'])
-            self.assertLessEqual(data['connection_time'], 5.0)  # Mocks should be fast
-            
-        except requests.exceptions.ConnectionError:
-            self.skipTest("VersaLogIQ server not running")
+        if self.client is not None:
+            # In-process WSGI dispatch: a plain function call, no socket
+            response = self.client.post('/api/check_all_servers', json=payload)
+            return response.status_code, response.get_json()
+        
+        response = self.session.post(f"{self.base_url}/api/check_all_servers", json=payload, timeout=self.timeout)
+        return response.status_code, response.json() if response.status_code == 200 else None
+    
+    def _test_mock_server_connection(self, mock_server, data):
+        """Test the bulk result entry for a mock server"""
+        self.assertIsNotNone(data, f"No result returned for {mock_server['hostname']}")
+        
+        # Verify mock response
+        self.assertTrue(data['success'])
+        self.assertEqual(data['hostname'], mock_server['hostname'])
+        self.assertEqual(data['detected_flavor'], mock_server['flavour'])
+        self.assertLessEqual(data['connection_time'], 5.0)  # Mocks should be fast
 
-class TestAPIPerformance(unittest.TestCase):
+@_category('performance')
+class TestAPIPerformance(_ServerRequiredMixin, unittest.TestCase):
     """Test API performance for server connectivity operations"""
     
-    def setUp(self):
-        """Set up performance test environment"""
-        self.base_url = "http://localhost:5000"
-        self.timeout = 30
-        self.performance_thresholds = {
-            'single_connection': 30.0,  # seconds
-            'bulk_check': 120.0,        # seconds for all servers
-            'status_check': 2.0         # seconds
-        }
+    session = _SESSION
+    base_url = BASE_URL
+    timeout = 30
+    performance_thresholds = types.MappingProxyType({
+        'single_connection': 30.0,  # seconds
+        'bulk_check': 120.0,        # seconds for all servers
+        'status_check': 2.0         # seconds
+    })
+    
+    # Integer nanosecond thresholds compared against perf_counter_ns deltas
+    _SINGLE_NS = int(performance_thresholds['single_connection'] * 1e9)
+    _BULK_NS = int(performance_thresholds['bulk_check'] * 1e9)
+    
+    # Static request bodies
+    _SINGLE_SERVER_PAYLOAD = types.MappingProxyType({
+        'hostname': '192.168.1.100',
+        'username': 'admin',
+        'password': 'test123',
+        'use_mock': True
+    })
+    _BULK_MOCK_PAYLOAD = types.MappingProxyType({'use_mock': True})
     
     def test_single_connection_performance(self):
         """Test performance of single server connection"""
-        test_server = {
-            'hostname': '192.168.1.100',
-            'username': 'admin',
-            'password': 'test123',
-            'use_mock': True
-        }
-        
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/test_connection",
-                json=test_server,
+                json=dict(self._SINGLE_SERVER_PAYLOAD),
                 timeout=self.timeout
             )
             
-            end_time = time.time()
-            execution_time = end_time - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
             if response.status_code == 404:
                 self.skipTest("Performance test API endpoint not implemented yet")
             
             self.assertEqual(response.status_code, 200)
-            self.assertLessEqual(
-                execution_time, 
-                self.performance_thresholds['single_connection'],
-                f"Single connection took {execution_time:.2f}s, threshold: {self.performance_thresholds['single_connection']}s"
-            )
+            if elapsed_ns > self._SINGLE_NS:
+                self.fail(f"Single connection took {elapsed_ns / 1e9:.2f}s, threshold: {self.performance_thresholds['single_connection']}s")
             
         except requests.exceptions.ConnectionError:
             self.skipTest("VersaLogIQ server not running")
     
     def test_bulk_connectivity_performance(self):
         """Test performance of bulk connectivity check"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/check_all_servers",
-                json={'use_mock': True},
+                json=dict(self._BULK_MOCK_PAYLOAD),
                 timeout=self.performance_thresholds['bulk_check']
             )
             
-            end_time = time.time()
-            execution_time = end_time - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
             if response.status_code == 404:
                 self.skipTest("Bulk performance test API endpoint not implemented yet")
             
             self.assertEqual(response.status_code, 200)
-            self.assertLessEqual(
-                execution_time,
-                self.performance_thresholds['bulk_check'],
-                f"Bulk check took {execution_time:.2f}s, threshold: {self.performance_thresholds['bulk_check']}s"
-            )
+            if elapsed_ns > self._BULK_NS:
+                self.fail(f"Bulk check took {elapsed_ns / 1e9:.2f}s, threshold: {self.performance_thresholds['bulk_check']}s")
             
         except requests.exceptions.ConnectionError:
             self.skipTest("VersaLogIQ server not running")
 
-class TestAPIErrorHandling(unittest.TestCase):
+@_category('error')
+class TestAPIErrorHandling(_ServerRequiredMixin, unittest.TestCase):
     """Test API error handling for various failure scenarios"""
     
-    def setUp(self):
-        """Set up error handling test environment"""
-        self.base_url = "http://localhost:5000"
-        self.timeout = 10
+    session = _SESSION
+    base_url = BASE_URL
+    timeout = 10
+    
+    # Static request bodies
+    _INVALID_HOST_PAYLOAD = types.MappingProxyType({
+        'hostname': 'invalid.hostname.test',
+        'username': 'admin',
+        'password': 'test123'
+    })
+    _AUTH_FAILURE_PAYLOAD = types.MappingProxyType({
+        'hostname': '10.73.21.106',  # Real server from ssh_hosts.json
+        'username': 'invalid_user',
+        'password': 'wrong_password'
+    })
     
     def test_invalid_hostname_error(self):
         """Test API response to invalid hostname"""
-        payload = {
-            'hostname': 'invalid.hostname.test',
-            'username': 'admin',
-            'password': 'test123'
-        }
-        
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/test_connection",
-                json=payload,
+                json=dict(self._INVALID_HOST_PAYLOAD),
                 timeout=self.timeout
             )
             
@@ -475,16 +598,10 @@ class TestAPIErrorHandling(unittest.TestCase):
     
     def test_authentication_failure_error(self):
         """Test API response to authentication failures"""
-        payload = {
-            'hostname': '10.73.21.106',  # Real server from ssh_hosts.json
-            'username': 'invalid_user',
-            'password': 'wrong_password'
-        }
-        
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/test_connection",
-                json=payload,
+                json=dict(self._AUTH_FAILURE_PAYLOAD),
                 timeout=self.timeout
             )
             
@@ -504,51 +621,59 @@ class TestAPIErrorHandling(unittest.TestCase):
             self.skipTest("VersaLogIQ server not running")
 
 if __name__ == '__main__':
-    # Run REST API connectivity tests
+    # Categories are pytest markers, e.g.:
+    #   pytest -m 'basic or mock' -n auto tests/integration/test_rest_api_connectivity.py
+    # This entry point only translates the legacy flags into a marker expression.
     import argparse
     
     parser = argparse.ArgumentParser(description='Run VersaLogIQ REST API connectivity tests')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
-    parser.add_argument('--category', 
-                       choices=['basic', 'connectivity', 'status', 'mock', 'performance', 'error'], 
-                       help='Test category to run')
+    parser.add_argument('--category', choices=sorted(_CATEGORY_CLASSES), help='Test category to run')
     parser.add_argument('--server', help='Test specific server hostname')
     parser.add_argument('--mock-only', action='store_true', help='Run only mock server tests')
+    parser.add_argument('--parallel', action='store_true',
+                       help='Run the TestCase classes across pytest-xdist workers')
     
     args = parser.parse_args()
     
-    verbosity = 2 if args.verbose else 1
-    
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Build test suite based on arguments
-    if args.category == 'basic':
-        suite.addTests(loader.loadTestsFromTestCase(TestRESTAPIConnectivity))
-    elif args.category == 'connectivity':
-        suite.addTests(loader.loadTestsFromTestCase(TestServerConnectivityAPI))
-    elif args.category == 'status':
-        suite.addTests(loader.loadTestsFromTestCase(TestServerStatusAPI))
-    elif args.category == 'mock':
-        suite.addTests(loader.loadTestsFromTestCase(TestMockServerConnectivity))
-    elif args.category == 'performance':
-        suite.addTests(loader.loadTestsFromTestCase(TestAPIPerformance))
-    elif args.category == 'error':
-        suite.addTests(loader.loadTestsFromTestCase(TestAPIErrorHandling))
+    if args.category:
+        marker_expr = args.category
     elif args.mock_only:
-        suite.addTests(loader.loadTestsFromTestCase(TestMockServerConnectivity))
+        marker_expr = 'mock'
+    elif args.server:
+        marker_expr = 'not mock'  # Skip mock tests when testing specific server
     else:
-        # Run all tests
-        suite.addTests(loader.loadTestsFromTestCase(TestRESTAPIConnectivity))
-        suite.addTests(loader.loadTestsFromTestCase(TestServerConnectivityAPI))
-        suite.addTests(loader.loadTestsFromTestCase(TestServerStatusAPI))
-        if not args.server:  # Skip mock tests when testing specific server
-            suite.addTests(loader.loadTestsFromTestCase(TestMockServerConnectivity))
-        suite.addTests(loader.loadTestsFromTestCase(TestAPIPerformance))
-        suite.addTests(loader.loadTestsFromTestCase(TestAPIErrorHandling))
-    
-    runner = unittest.TextTestRunner(verbosity=verbosity)
-    result = runner.run(suite)
+        marker_expr = None
+    
+    if pytest is not None:
+        # Root the run at tests/ so its conftest.py, which registers the category markers, is loaded
+        pytest_args = [__file__, '--rootdir', str(Path(__file__).resolve().parent.parent)]
+        if marker_expr:
+            pytest_args += ['-m', marker_expr]
+        if args.verbose:
+            pytest_args.append('-v')
+        if args.parallel:
+            import importlib.util
+            if importlib.util.find_spec('xdist'):
+                # Each xdist worker is its own process with its own pooled session
+                pytest_args += ['-n', 'auto']
+            else:
+                print("⚠️  pytest-xdist not available, running tests serially")
+        sys.exit(pytest.main(pytest_args))
+    
+    # pytest is not installed: fall back to the plain unittest runner
+    if marker_expr == 'not mock':
+        categories = [name for name in _CATEGORY_CLASSES if name != 'mock']
+    else:
+        categories = [marker_expr] if marker_expr else list(_CATEGORY_CLASSES)
+    
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(
+        loader.loadTestsFromTestCase(cls)
+        for name in categories
+        for cls in _CATEGORY_CLASSES[name]
+    )
+    result = unittest.TextTestRunner(verbosity=2 if args.verbose else 1).run(suite)
     
     # Print summary
     if result.wasSuccessful():
@@ -557,4 +682,4 @@ if __name__ == '__main__':
         print(f"\n❌ REST API connectivity tests failed: {len(result.failures)} failures, {len(result.errors)} errors")
     
     # Exit with appropriate code
-    exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
+    sys.exit(0 if result.wasSuccessful() else 1)
@@ -3,37 +3,110 @@
 Mock server responses for VersaLogIQ testing
 """
 
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+import io
+import os
 import time
 import re
 
+# Real wall-clock delays are opt-in; by default simulated latency costs nothing
+SIMULATED_DELAY_ENABLED = os.environ.get('VERSALOGIQ_MOCK_DELAYS', '').lower() in ('1', 'true', 'yes')
+
+# find argument that marks a listing request as excluding .gz files
+_GZ_EXCLUDE_NEEDLE = "! -name '*.gz'"
+
+# `find /var/log` listings returned by MockSSHClient, sorted and joined once at import
+_LOG_LISTING_NO_GZ = '\n'.join(sorted([
+    '/var/log/apache2/access.log',
+    '/var/log/apache2/error.log',
+    '/var/log/auth.log',
+    '/var/log/syslog',
+    '/var/log/nginx/access.log',
+    '/var/log/nginx/error.log'
+]))
+_LOG_LISTING_WITH_GZ = '\n'.join(sorted([
+    '/var/log/apache2/access.log',
+    '/var/log/apache2/access.log.1.gz',
+    '/var/log/apache2/error.log',
+    '/var/log/auth.log',
+    '/var/log/auth.log.1.gz', 
+    '/var/log/syslog',
+    '/var/log/syslog.1.gz',
+    '/var/log/nginx/access.log',
+    '/var/log/nginx/error.log'
+]))
+
+@lru_cache(maxsize=256)
+def _encode(text: str) -> bytes:
+    """UTF-8 encode a mock response, sharing the bytes for repeated static responses"""
+    return text.encode('utf-8')
+
+class FakeClock:
+    """Virtual clock that advances instantly instead of sleeping"""
+    
+    def __init__(self, start: float = 0.0):
+        self.now = start
+    
+    def advance(self, seconds: float):
+        """Move virtual time forward"""
+        self.now += seconds
+    
+    def time(self) -> float:
+        """Current virtual time"""
+        return self.now
+
+def simulate_delay(seconds: float, clock: FakeClock = None):
+    """Account for a simulated delay on the clock, or really sleep if delays are enabled"""
+    if seconds <= 0:
+        return
+    if clock is not None:
+        clock.advance(seconds)
+    elif SIMULATED_DELAY_ENABLED:
+        time.sleep(seconds)
+
 class MockSSHResponse:
     """Mock SSH response for testing"""
     
-    def __init__(self, stdout: str = "", stderr: str = "", delay: float = 0.1):
+    def __init__(self, stdout: str = "", stderr: str = "", delay: float = 0.1, clock: FakeClock = None):
         self.stdout = stdout
         self.stderr = stderr
         self.delay = delay
+        self.clock = clock
         self.executed = False
         
     def execute(self) -> Tuple[str, str]:
         """Simulate command execution with delay"""
-        if self.delay > 0:
-            time.sleep(self.delay)
+        simulate_delay(self.delay, self.clock)
         self.executed = True
         return self.stdout, self.stderr
 
 class MockShell:
     """Mock SSH shell for interactive commands"""
     
+    __slots__ = ('server_config', 'responses', 'sudo_type', 'buffer', '_read_pos', 'current_user',
+                 'is_root', '_hostname', '_user_prompt', '_root_prompt', '_sudo_su_output', '_password_prompt')
+    
     def __init__(self, server_config: Dict):
         self.server_config = server_config
-        self.responses = server_config.get('responses', {})
+        # Encoded once here so send() copies bytes straight into the buffer
+        self.responses = {cmd: _encode(text) for cmd, text in server_config.get('responses', {}).items()}
         self.sudo_type = server_config.get('sudo_type', 'password_required')
-        self.buffer = ""
+        # Pending output; recv consumes from _read_pos instead of re-slicing the tail
+        self.buffer = bytearray()
+        self._read_pos = 0
         self.current_user = server_config.get('username', 'user')
         self.is_root = False
         
+        # Prompts depend only on the config, so format and encode them once
+        self._hostname = hostname = server_config.get('hostname', 'server')
+        user = self.current_user
+        self._user_prompt = f"{user}@{hostname}$ ".encode('utf-8')
+        self._root_prompt = f"root@{hostname}# ".encode('utf-8')
+        self._sudo_su_output = f"{user}@{hostname}: ~] # sudo su\nroot@{hostname}:/home/{user}# ".encode('utf-8')
+        self._password_prompt = f"[sudo] password for {user}: ".encode('utf-8')
+        
     def send(self, command: str):
         """Simulate sending command to shell"""
         command = command.strip()
@@ -41,48 +114,58 @@ class MockShell:
         if command == 'sudo su':
             self._handle_sudo_su()
         elif command in self.responses:
-            self.buffer += self.responses[command]
+            self.buffer.extend(self.responses[command])
         else:
             # Generic response for unknown commands
-            if self.is_root:
-                self.buffer += f"root@{self.server_config['hostname']}# "
-            else:
-                self.buffer += f"{self.current_user}@{self.server_config['hostname']}$ "
+            self.buffer.extend(self._root_prompt if self.is_root else self._user_prompt)
     
     def recv_ready(self) -> bool:
         """Simulate checking if data is ready"""
-        return len(self.buffer) > 0
+        return self._read_pos < len(self.buffer)
     
     def recv(self, size: int) -> bytes:
         """Simulate receiving data from shell"""
-        if len(self.buffer) == 0:
+        start = self._read_pos
+        if start >= len(self.buffer):
             return b""
         
-        # Return part of buffer and clear it
-        data = self.buffer[:size]
-        self.buffer = self.buffer[size:]
-        return data.encode('utf-8')
+        with memoryview(self.buffer) as view:
+            data = bytes(view[start:start + size])
+        self._read_pos = start + len(data)
+        
+        # Compact once most of the buffer has been consumed, keeping recv loops linear
+        if self._read_pos > len(self.buffer) // 2:
+            del self.buffer[:self._read_pos]
+            self._read_pos = 0
+        return data
     
     def close(self):
         """Simulate closing shell"""
-        self.buffer = ""
+        self.buffer.clear()
+        self._read_pos = 0
     
     def _handle_sudo_su(self):
         """Handle sudo su command based on server configuration"""
         if self.sudo_type == 'passwordless':
             # Direct transition to root
             self.is_root = True
-            hostname = self.server_config.get('hostname', 'server')
-            self.buffer += f"{self.current_user}@{hostname}: ~] # sudo su\nroot@{hostname}:/home/{self.current_user}# "
+            self.buffer.extend(self._sudo_su_output)
         else:
             # Require password
-            self.buffer += f"[sudo] password for {self.current_user}: "
+            self.buffer.extend(self._password_prompt)
 
 class MockSSHClient:
     """Mock SSH client for testing"""
     
-    def __init__(self, server_config: Dict):
+    def __init__(self, server_config: Dict, clock: FakeClock = None):
         self.server_config = server_config
+        self.clock = clock
+        # Expected (host, user, password), compared as one tuple on connect
+        self._creds = (
+            server_config.get('hostname', 'localhost'),
+            server_config.get('username', 'admin'),
+            server_config.get('password', 'password')
+        )
         self.connected = False
         self.shell = None
         
@@ -93,16 +176,10 @@ class MockSSHClient:
     def connect(self, hostname: str, username: str, password: str, **kwargs):
         """Mock SSH connection"""
         # Simulate connection delay
-        time.sleep(0.1)
+        simulate_delay(0.1, self.clock)
         
         # Check if credentials match
-        expected_host = self.server_config.get('hostname', 'localhost')
-        expected_user = self.server_config.get('username', 'admin')
-        expected_pass = self.server_config.get('password', 'password')
-        
-        if (hostname != expected_host or 
-            username != expected_user or 
-            password != expected_pass):
+        if (hostname, username, password) != self._creds:
             raise Exception(f"Authentication failed for {username}@{hostname}")
         
         self.connected = True
@@ -153,37 +230,17 @@ class MockSSHClient:
     
     def _mock_log_file_listing(self, command: str) -> str:
         """Generate mock log file listing based on command"""
-        # Check if .gz files should be excluded
-        if '! -name \'*.gz\'' in command:
-            log_files = [
-                '/var/log/apache2/access.log',
-                '/var/log/apache2/error.log',
-                '/var/log/auth.log',
-                '/var/log/syslog',
-                '/var/log/nginx/access.log',
-                '/var/log/nginx/error.log'
-            ]
-        else:
-            # Include .gz files if not explicitly excluded
-            log_files = [
-                '/var/log/apache2/access.log',
-                '/var/log/apache2/access.log.1.gz',
-                '/var/log/apache2/error.log',
-                '/var/log/auth.log',
-                '/var/log/auth.log.1.gz', 
-                '/var/log/syslog',
-                '/var/log/syslog.1.gz',
-                '/var/log/nginx/access.log',
-                '/var/log/nginx/error.log'
-            ]
-        
-        return '\n'.join(sorted(log_files))
+        # Include .gz files unless explicitly excluded
+        if _GZ_EXCLUDE_NEEDLE in command:
+            return _LOG_LISTING_NO_GZ
+        return _LOG_LISTING_WITH_GZ
 
 class MockStreamResponse:
     """Mock SSH stream response"""
     
     def __init__(self, data: str):
-        self.data = data.encode('utf-8') if isinstance(data, str) else data
+        self.data = _encode(data) if isinstance(data, str) else data
+        self._reader = None
         
     def read(self) -> bytes:
         """Read all data from stream"""
@@ -191,41 +248,94 @@ class MockStreamResponse:
     
     def readline(self) -> bytes:
         """Read one line from stream"""
-        lines = self.data.split(b'\n')
-        return lines[0] + b'\n' if lines else b''
+        # Created on first use; successive calls advance through the data like a real channel file
+        if self._reader is None:
+            self._reader = io.BytesIO(self.data)
+        return self._reader.readline()
+
+# Each flavor's responses to the common detection commands, shared read-only by every mock server
+_FLAVOR_RESPONSES: Dict[str, Mapping[str, str]] = {flavor: MappingProxyType(responses) for flavor, responses in {
+    'VMS': {'vsh status | grep msgservice': "msgservice: running (pid: 1234)"},
+    'VOS': {
+        'vsh details': "versa-flexvnf version 20.2.3",
+        'cat /etc/versa-release': "Versa FlexVNF Release 20.2.3"
+    },
+    'SCIM': {'docker ps |grep -i versa_scim': "abcd1234    versa_scim:latest"},
+    'ECP': {'vsh system details | grep concerto': "concerto-platform version 21.1.2"},
+    'VAN': {},
+    'UBUNTU': {
+        'lsb_release -d': "Description:\tUbuntu 18.04.6 LTS",
+        'cat /etc/os-release': 'NAME="Ubuntu"\nVERSION="18.04.6 LTS (Bionic Beaver)"'
+    }
+}.items()}
 
 # Flavor detection response generators
 class FlavorResponseGenerator:
     """Generate responses for flavor detection commands"""
     
+    # Parsed state shared by every generator built from an identical mock config
+    _parsed_cache = {}
+    
+    def __init__(self, mock_config: Dict = None):
+        mock_config = mock_config or {}
+        cache_key = (
+            mock_config.get('flavor', ''),
+            mock_config.get('username', 'admin'),
+            tuple(sorted(mock_config.get('responses', {}).items()))
+        )
+        
+        parsed = self._parsed_cache.get(cache_key)
+        if parsed is None:
+            flavor, username, responses = cache_key
+            generator = getattr(self, f"generate_{flavor.lower()}_response", None)
+            parsed = (dict(responses), generator, username)
+            self._parsed_cache[cache_key] = parsed
+        
+        self.responses, self.generator, self.username = parsed
+    
+    def get_response(self, command: str) -> Tuple[str, str]:
+        """Return (stdout, stderr) for a command against this mock server"""
+        if command in self.responses:
+            return self.responses[command], ""
+        
+        if self.generator:
+            response = self.generator(command)
+            if response:
+                return response, ""
+        
+        if command == 'whoami':
+            return self.username, ""
+        
+        return "", f"Command not found: {command}"
+    
     @staticmethod
     def generate_vms_response(command: str) -> str:
         """Generate VMS-specific responses"""
         if 'vsh status' in command and 'msgservice' in command:
-            return "msgservice: running (pid: 1234)"
+            return _FLAVOR_RESPONSES['VMS']['vsh status | grep msgservice']
         return ""
     
     @staticmethod  
     def generate_vos_response(command: str) -> str:
         """Generate VOS-specific responses"""
         if 'vsh details' in command:
-            return "versa-flexvnf version 20.2.3"
+            return _FLAVOR_RESPONSES['VOS']['vsh details']
         elif 'versa-release' in command:
-            return "Versa FlexVNF Release 20.2.3"
+            return _FLAVOR_RESPONSES['VOS']['cat /etc/versa-release']
         return ""
     
     @staticmethod
     def generate_scim_response(command: str) -> str:
         """Generate SCIM-specific responses"""
         if 'docker ps' in command and 'versa_scim' in command:
-            return "abcd1234    versa_scim:latest"
+            return _FLAVOR_RESPONSES['SCIM']['docker ps |grep -i versa_scim']
         return ""
     
     @staticmethod
     def generate_ecp_response(command: str) -> str:
         """Generate ECP-specific responses"""
         if 'vsh system details' in command and 'concerto' in command:
-            return "concerto-platform version 21.1.2"
+            return _FLAVOR_RESPONSES['ECP']['vsh system details | grep concerto']
         return ""
     
     @staticmethod
@@ -239,51 +349,34 @@ class FlavorResponseGenerator:
     def generate_ubuntu_response(command: str) -> str:
         """Generate Ubuntu-specific responses"""
         if 'lsb_release -d' in command:
-            return "Description:\tUbuntu 18.04.6 LTS"
+            return _FLAVOR_RESPONSES['UBUNTU']['lsb_release -d']
         elif '/etc/os-release' in command:
-            return 'NAME="Ubuntu"\nVERSION="18.04.6 LTS (Bionic Beaver)"'
+            return _FLAVOR_RESPONSES['UBUNTU']['cat /etc/os-release']
         return ""
 
-def create_mock_server(flavor: str, sudo_type: str = 'password_required') -> Dict:
-    """Create mock server configuration for specific flavor"""
+@lru_cache(maxsize=32)
+def create_mock_server(flavor: str, sudo_type: str = 'password_required') -> Mapping:
+    """Create mock server configuration for specific flavor (memoized, returned as a read-only view)"""
     base_config = {
         'hostname': f'test-{flavor.lower()}.local',
         'username': 'admin' if flavor != 'SCIM' else 'versa',
         'password': 'test123',
         'flavor': flavor.upper(),
         'sudo_type': sudo_type,
-        'responses': {}
-    }
-    
-    # Add flavor-specific responses
-    generator_map = {
-        'VMS': FlavorResponseGenerator.generate_vms_response,
-        'VOS': FlavorResponseGenerator.generate_vos_response,
-        'SCIM': FlavorResponseGenerator.generate_scim_response,
-        'ECP': FlavorResponseGenerator.generate_ecp_response,
-        'VAN': FlavorResponseGenerator.generate_van_response,
-        'UBUNTU': FlavorResponseGenerator.generate_ubuntu_response
+        # Flavor-specific responses to the common detection commands
+        'responses': _FLAVOR_RESPONSES.get(flavor.upper(), MappingProxyType({}))
     }
     
-    if flavor.upper() in generator_map:
-        generator = generator_map[flavor.upper()]
-        # Add common detection commands for this flavor
-        common_commands = [
-            'vsh status | grep msgservice',
-            'vsh details',
-            'cat /etc/versa-release', 
-            'vsh system details | grep concerto',
-            'docker ps |grep -i versa_scim',
-            'lsb_release -d',
-            'cat /etc/os-release'
-        ]
-        
-        for cmd in common_commands:
-            response = generator(cmd)
-            if response:
-                base_config['responses'][cmd] = response
-    
-    return base_config
+    # Shared between callers, so expose it read-only; use copy_mock_server() if a test must mutate it
+    return MappingProxyType(base_config)
+
+def copy_mock_server(config: Mapping) -> Dict:
+    """Mutable deep copy of a mock server config, thawing every read-only mapping into a dict"""
+    if isinstance(config, Mapping):
+        return {key: copy_mock_server(value) for key, value in config.items()}
+    if isinstance(config, list):
+        return [copy_mock_server(item) for item in config]
+    return config
 
 if __name__ == "__main__":
     # Test mock response generation
@@ -5,20 +5,82 @@ Comprehensive test runner for VersaLogIQ test automation
 
 import os
 import sys
+import contextlib
 import unittest
 import subprocess
 import argparse
 import time
 import json
+import io
+import re
+import importlib
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
-# Add project paths
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Test modules add the backend and shared test paths themselves, so sys.path is left alone here
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / 'unit'))
-sys.path.insert(0, str(project_root / 'integration'))
-sys.path.insert(0, str(project_root / 'mock'))
-sys.path.insert(0, str(project_root / '..' / 'backend'))
+
+# Percentage column of the coverage report's TOTAL line
+_TOTAL_RE = re.compile(r"^TOTAL\s+.*?(\S+)%\s*$", re.MULTILINE)
+
+# Test directories to discover for each --type (api tests live under integration)
+TEST_DIRS = {
+    'all': ('unit', 'integration'),
+    'unit': ('unit',),
+    'integration': ('integration',),
+    'api': ('integration',),
+}
+
+@contextlib.contextmanager
+def _buffered_stdout(buffer_size=65536):
+    """Yield a large-buffered text stream over stdout, flushed once when the run ends"""
+    raw = getattr(sys.stdout, 'buffer', None)
+    if raw is None:
+        yield sys.stdout
+        return
+    
+    sys.stdout.flush()
+    stream = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=buffer_size),
+        encoding=sys.stdout.encoding,
+        errors='replace'
+    )
+    try:
+        yield stream
+    finally:
+        stream.flush()
+        # Detach both wrappers so neither closes sys.stdout's buffer when collected
+        stream.detach().detach()
+
+def _iter_test_ids(test_suite):
+    """Yield the id of every test case in a (nested) suite"""
+    for test in test_suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_test_ids(test)
+        else:
+            yield test.id()
+
+def _run_test_chunk(test_ids, verbosity, search_paths=()):
+    """Run a chunk of tests in a worker process and return picklable results"""
+    # Discovery only had the test directories on sys.path temporarily; a fresh worker needs them to import by id
+    sys.path[:0] = [path for path in search_paths if path not in sys.path]
+    suite = unittest.TestLoader().loadTestsFromNames(test_ids)
+    stream = io.StringIO()
+    result = unittest.TextTestRunner(verbosity=verbosity, stream=stream, buffer=True).run(suite)
+    return (
+        result.testsRun,
+        [(str(test), trace) for test, trace in result.failures],
+        [(str(test), trace) for test, trace in result.errors],
+        len(result.skipped),
+        stream.getvalue()
+    )
 
 class TestRunner:
     """Main test runner for VersaLogIQ test automation"""
@@ -39,76 +101,124 @@ class TestRunner:
     def discover_tests(self, test_type='all', pattern='test_*.py'):
         """Discover tests based on type and pattern"""
         test_suites = unittest.TestSuite()
+        loader = unittest.TestLoader()
         
-        if test_type in ['all', 'unit']:
-            # Discover unit tests
-            unit_tests = unittest.TestLoader().discover(
-                str(self.project_root / 'unit'), 
-                pattern=pattern
-            )
-            test_suites.addTest(unit_tests)
-        
-        if test_type in ['all', 'integration', 'api']:
-            # Discover integration tests
-            integration_tests = unittest.TestLoader().discover(
-                str(self.project_root / 'integration'), 
-                pattern=pattern
-            )
-            test_suites.addTest(integration_tests)
+        # Each directory is walked once; the test dirs are not packages, so they are discovered separately
+        for test_dir in TEST_DIRS.get(test_type, ()):
+            start_dir = str(self.project_root / test_dir)
+            added = start_dir not in sys.path
+            test_suites.addTest(loader.discover(start_dir, pattern=pattern))
+            # discover() prepends start_dir for its imports; the loaded modules are cached, so drop it again
+            if added and start_dir in sys.path:
+                sys.path.remove(start_dir)
         
         return test_suites
     
-    def run_tests_with_coverage(self, test_suite, verbose=False):
+    def run_tests_with_coverage(self, test_suite, verbose=False, jobs=1):
         """Run tests with coverage analysis"""
         try:
             import coverage
-            cov = coverage.Coverage(source=[str(self.project_root / '..' / 'backend')])
+        except ImportError:
+            print("⚠️  Coverage module not available. Running tests without coverage.")
+            if jobs > 1:
+                return self.run_tests_parallel(test_suite, jobs, verbose)
+            return self.run_tests_without_coverage(test_suite, verbose)
+        
+        if jobs > 1:
+            # Worker processes write their own data files, combined after the run
+            cov = coverage.Coverage(
+                source=[str(self.project_root / '..' / 'backend')],
+                concurrency='multiprocessing',
+                data_suffix=True
+            )
             cov.start()
-            
-            # Run tests
+            result = self.run_tests_parallel(test_suite, jobs, verbose)
+            cov.stop()
+            cov.save()
+            cov.combine()
+            self.results['coverage'] = self.generate_coverage_report(cov)
+            return result
+        
+        cov = coverage.Coverage(source=[str(self.project_root / '..' / 'backend')])
+        cov.start()
+        
+        # Run tests
+        with _buffered_stdout() as stream:
             runner = unittest.TextTestRunner(
                 verbosity=2 if verbose else 1,
-                stream=sys.stdout,
+                stream=stream,
                 buffer=True
             )
             
             start_time = time.time()
             result = runner.run(test_suite)
             end_time = time.time()
-            
-            cov.stop()
-            cov.save()
-            
-            # Generate coverage report
-            coverage_report = self.generate_coverage_report(cov)
-            
-            self.results.update({
-                'total_tests': result.testsRun,
-                'passed': result.testsRun - len(result.failures) - len(result.errors),
-                'failed': len(result.failures),
-                'errors': len(result.errors),
-                'execution_time': end_time - start_time,
-                'coverage': coverage_report
-            })
-            
-            return result
-            
-        except ImportError:
-            print("⚠️  Coverage module not available. Running tests without coverage.")
-            return self.run_tests_without_coverage(test_suite, verbose)
+        
+        cov.stop()
+        cov.save()
+        
+        # Generate coverage report
+        coverage_report = self.generate_coverage_report(cov)
+        
+        self.results.update({
+            'total_tests': result.testsRun,
+            'passed': result.testsRun - len(result.failures) - len(result.errors),
+            'failed': len(result.failures),
+            'errors': len(result.errors),
+            'execution_time': end_time - start_time,
+            'coverage': coverage_report
+        })
+        
+        return result
     
-    def run_tests_without_coverage(self, test_suite, verbose=False):
-        """Run tests without coverage analysis"""
-        runner = unittest.TextTestRunner(
-            verbosity=2 if verbose else 1,
-            stream=sys.stdout,
-            buffer=True
-        )
+    def run_tests_parallel(self, test_suite, workers=None, verbose=False):
+        """Run tests across worker processes and merge their results"""
+        workers = workers or os.cpu_count() or 1
+        test_ids = list(_iter_test_ids(test_suite))
+        
+        # Contiguous chunks keep each test class in one worker, so setUpClass runs once
+        chunk_size = max(-(-len(test_ids) // workers), 1)
+        chunks = [test_ids[i:i + chunk_size] for i in range(0, len(test_ids), chunk_size)]
         
+        result = unittest.TestResult()
+        skipped = 0
         start_time = time.time()
-        result = runner.run(test_suite)
+        with ProcessPoolExecutor(max_workers=max(len(chunks), 1)) as pool:
+            search_paths = [str(self.project_root / test_dir) for test_dir in TEST_DIRS['all']]
+            for tests_run, failures, errors, chunk_skipped, output in pool.map(
+                    _run_test_chunk, chunks, repeat(2 if verbose else 1), repeat(search_paths)):
+                sys.stdout.write(output)
+                result.testsRun += tests_run
+                result.failures.extend(failures)
+                result.errors.extend(errors)
+                skipped += chunk_skipped
         end_time = time.time()
         
+        self.results.update({
+            'total_tests': result.testsRun,
+            'passed': result.testsRun - len(result.failures) - len(result.errors),
+            'failed': len(result.failures),
+            'errors': len(result.errors),
+            'skipped': skipped,
+            'execution_time': end_time - start_time,
+            'coverage': None
+        })
+        
+        return result
+    
+    def run_tests_without_coverage(self, test_suite, verbose=False):
+        """Run tests without coverage analysis"""
+        with _buffered_stdout() as stream:
+            runner = unittest.TextTestRunner(
+                verbosity=2 if verbose else 1,
+                stream=stream,
+                buffer=True
+            )
+            
+            start_time = time.time()
+            result = runner.run(test_suite)
+            end_time = time.time()
+        
         self.results.update({
             'total_tests': result.testsRun,
             'passed': result.testsRun - len(result.failures) - len(result.errors),
@@ -126,30 +236,14 @@ class TestRunner:
             # Get coverage data
             coverage_data = {}
             
-            # Create temporary report
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                cov.report(file=f, show_missing=True)
-                report_file = f.name
-            
-            # Read and parse coverage report
-            with open(report_file, 'r') as f:
-                report_content = f.read()
-            
-            # Clean up temp file
-            os.unlink(report_file)
+            # Render the report in memory
+            buffer = io.StringIO()
+            cov.report(file=buffer, show_missing=True)
+            report_content = buffer.getvalue()
             
             # Parse coverage percentage
-            lines = report_content.split('\n')
-            for line in lines:
-                if 'TOTAL' in line:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        try:
-                            coverage_data['total_percentage'] = parts[-1].rstrip('%')
-                        except:
-                            coverage_data['total_percentage'] = 'N/A'
-                    break
+            match = _TOTAL_RE.search(report_content)
+            coverage_data['total_percentage'] = match.group(1) if match else 'N/A'
             
             coverage_data['report'] = report_content
             return coverage_data
@@ -158,6 +252,29 @@ class TestRunner:
             print(f"⚠️  Error generating coverage report: {e}")
             return None
     
+    def _load_test_file(self, module_path):
+        """Load a test module straight from its file path, or return None if it is not a file"""
+        path = Path(module_path)
+        if not path.is_file():
+            path = self.project_root / module_path
+            if not path.is_file():
+                return None
+        
+        name = path.stem
+        if name in sys.modules:
+            return sys.modules[name]
+        
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module
+    
+    def _import_test_module(self, module_path):
+        """Import a test module by dotted name (a 'unit/test_x.py' style path is converted)"""
+        # import_module returns the leaf module and reuses sys.modules on repeat selections
+        return importlib.import_module(module_path.removesuffix('.py').replace('/', '.'))
+    
     def run_specific_test(self, test_path, verbose=False):
         """Run a specific test file or test case"""
         try:
@@ -167,14 +284,12 @@ class TestRunner:
             if '::' in test_path:
                 # Specific test method
                 module_path, test_method = test_path.split('::')
-                module = __import__(module_path.replace('/', '.').replace('.py', ''))
+                module = self._load_test_file(module_path) or self._import_test_module(module_path)
                 suite = loader.loadTestsFromName(test_method, module)
             else:
                 # Entire test file
-                if test_path.endswith('.py'):
-                    test_path = test_path[:-3]
-                
-                suite = loader.loadTestsFromName(test_path.replace('/', '.'))
+                module = self._load_test_file(test_path) or self._import_test_module(test_path)
+                suite = loader.loadTestsFromModule(module)
             
             return self.run_tests_without_coverage(suite, verbose)
             
@@ -182,8 +297,25 @@ class TestRunner:
             print(f"❌ Error running specific test {test_path}: {e}")
             return None
     
-    def validate_test_environment(self):
-        """Validate test environment and dependencies"""
+    def _existing_files(self, rel_paths):
+        """Return which project-relative paths exist, listing each parent directory only once"""
+        by_dir = {}
+        for rel_path in rel_paths:
+            parent, _, name = rel_path.rpartition('/')
+            by_dir.setdefault(parent, []).append((rel_path, name))
+        
+        existing = set()
+        for parent, entries in by_dir.items():
+            try:
+                with os.scandir(self.project_root / parent) as scan:
+                    names = {entry.name for entry in scan if entry.is_file()}
+            except OSError:
+                continue
+            existing.update(rel_path for rel_path, name in entries if name in names)
+        return existing
+    
+    def validate_test_environment(self, skip_file_checks=False):
+        """Validate test environment and dependencies, optionally without the required-file checks"""
         print("🔍 Validating test environment...")
         
         validation_errors = []
@@ -196,23 +328,25 @@ class TestRunner:
         required_modules = ['unittest', 'paramiko', 'json', 'pathlib']
         optional_modules = ['coverage']
         
+        # find_spec only locates each module; heavy imports like paramiko are not executed
         for module in required_modules:
-            try:
-                __import__(module)
+            if importlib.util.find_spec(module) is not None:
                 print(f"✅ {module}")
-            except ImportError:
+            else:
                 validation_errors.append(f"Required module {module} not found")
                 print(f"❌ {module}")
         
         for module in optional_modules:
-            try:
-                __import__(module)
+            if importlib.util.find_spec(module) is not None:
                 print(f"✅ {module} (optional)")
-            except ImportError:
+            else:
                 print(f"⚠️  {module} (optional, not available)")
         
-        # Check test files exist
-        test_files = [
+        if skip_file_checks:
+            print("⏭️  Skipping file checks (--skip-file-checks)")
+        
+        # Test files that must exist
+        test_files = () if skip_file_checks else [
             'unit/test_flavor_detection.py',
             'unit/test_ssh_connection.py',
             'integration/test_versalogiq_workflow.py',
@@ -220,23 +354,24 @@ class TestRunner:
             'test_config.py'
         ]
         
+        # Backend files that must exist
+        backend_files = () if skip_file_checks else [
+            '../backend/versalogiq_app.py',
+            '../config/server_flavors.json'
+        ]
+        
+        # One scandir per parent directory instead of a stat per file
+        existing = self._existing_files([*test_files, *backend_files])
+        
         for test_file in test_files:
-            file_path = self.project_root / test_file
-            if file_path.exists():
+            if test_file in existing:
                 print(f"✅ {test_file}")
             else:
                 validation_errors.append(f"Test file {test_file} not found")
                 print(f"❌ {test_file}")
         
-        # Check backend files
-        backend_files = [
-            '../backend/versalogiq_app.py',
-            '../config/server_flavors.json'
-        ]
-        
         for backend_file in backend_files:
-            file_path = self.project_root / backend_file
-            if file_path.exists():
+            if backend_file in existing:
                 print(f"✅ {backend_file}")
             else:
                 validation_errors.append(f"Backend file {backend_file} not found")
@@ -253,17 +388,20 @@ class TestRunner:
     
     def generate_test_report(self, output_file=None):
         """Generate comprehensive test report"""
+        results = self.results
+        success_rate = round(results['passed'] * 100.0 / max(results['total_tests'], 1), 2)
+        
         report = {
             'test_run_summary': {
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'total_tests': self.results['total_tests'],
-                'passed': self.results['passed'],
-                'failed': self.results['failed'],
-                'errors': self.results['errors'],
-                'success_rate': round(self.results['passed'] / max(self.results['total_tests'], 1) * 100, 2),
-                'execution_time_seconds': round(self.results['execution_time'], 2)
+                'total_tests': results['total_tests'],
+                'passed': results['passed'],
+                'failed': results['failed'],
+                'errors': results['errors'],
+                'success_rate': success_rate,
+                'execution_time_seconds': round(results['execution_time'], 2)
             },
-            'coverage': self.results['coverage'],
+            'coverage': results['coverage'],
             'environment': {
                 'python_version': sys.version,
                 'platform': sys.platform,
@@ -272,8 +410,13 @@ class TestRunner:
         }
         
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            # Serialize in one call and write once; orjson is used when installed
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w') as f:
+                    f.write(json.dumps(report, indent=2))
             print(f"📝 Test report saved to {output_file}")
         
         return report
@@ -332,6 +475,10 @@ def main():
     parser.add_argument('--report', help='Generate JSON report file')
     parser.add_argument('--quick', action='store_true', 
                        help='Run quick tests only (skip performance tests)')
+    parser.add_argument('--skip-file-checks', action='store_true',
+                       help='Skip the required test and backend file checks during validation')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes to run tests in')
     
     args = parser.parse_args()
     
@@ -343,11 +490,11 @@ def main():
     
     # Validate environment if requested
     if args.validate:
-        success = runner.validate_test_environment()
+        success = runner.validate_test_environment(args.skip_file_checks)
         sys.exit(0 if success else 1)
     
     # Always validate before running tests
-    if not runner.validate_test_environment():
+    if not runner.validate_test_environment(args.skip_file_checks):
         print("❌ Environment validation failed. Fix issues before running tests.")
         sys.exit(1)
     
@@ -376,7 +523,9 @@ def main():
     # Run tests
     print(f"\n🏃 Running tests...")
     if args.coverage:
-        result = runner.run_tests_with_coverage(test_suite, args.verbose)
+        result = runner.run_tests_with_coverage(test_suite, args.verbose, args.jobs)
+    elif args.jobs > 1:
+        result = runner.run_tests_parallel(test_suite, args.jobs, args.verbose)
     else:
         result = runner.run_tests_without_coverage(test_suite, args.verbose)
     
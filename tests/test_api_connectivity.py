@@ -4,53 +4,215 @@ Simple connectivity test for VersaLogIQ REST API endpoints
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import logging.handlers
+import socket
 import sys
+import functools
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlsplit
+
+from test_config import API_TEST_CONFIG
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# One keep-alive session for every check, sized for the concurrent checks in main().
+# The Flask/Socket.IO dev server speaks plain HTTP/1.1 and httpx only negotiates
+# HTTP/2 over TLS, so pooled keep-alive connections are the reuse available here.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504))
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+# Output is buffered and written in batches; errors flush immediately
+LOG = logging.getLogger("versalogiq.test")
+LOG.setLevel(logging.INFO)
+LOG.propagate = False
+_STREAM_HANDLER = logging.StreamHandler(sys.stdout)
+_MEMORY_HANDLER = logging.handlers.MemoryHandler(256, flushLevel=logging.ERROR, target=_STREAM_HANDLER)
+LOG.addHandler(_MEMORY_HANDLER)
+
+# REST capabilities advertised on /version; None until read, in which case nothing is skipped
+_FEATURES = None
+
+def _advertised(feature):
+    """False only when the server listed its capabilities and feature is not among them"""
+    if _FEATURES is None or feature in _FEATURES:
+        return True
+    LOG.info(f"⏭️  Skipping {feature}: not advertised by /version")
+    return False
+
+# Client-side request time per check in ns, summarised at the end of main()
+_TIMINGS = {}
+_TIMINGS_LOCK = threading.Lock()
+
+def _timed(name, method, url, **kwargs):
+    """Issue a SESSION request, recording its round-trip time under name"""
+    start = time.perf_counter_ns()
+    try:
+        return getattr(SESSION, method)(url, **kwargs)
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        with _TIMINGS_LOCK:
+            _TIMINGS[name] = _TIMINGS.get(name, 0) + elapsed
+        LOG.info(f"   ⏱️  {name}: {elapsed // 1000} us")
+
+@functools.lru_cache(maxsize=None)
+def endpoint_urls(base_url):
+    """Absolute endpoint URLs for base_url (the configured default is precomputed)"""
+    if base_url == API_TEST_CONFIG['base_url']:
+        return API_TEST_CONFIG['full_urls']
+    return {name: base_url + path for name, path in API_TEST_CONFIG['endpoints'].items()}
+
+def _loads(raw):
+    """Decode JSON bytes, with orjson when installed"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _json(response):
+    """Decode a JSON response body, with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _read_streamed(response, chunk_size=65536):
+    """Read a stream=True body chunk by chunk; each chunk is bounded by the read timeout"""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size):
+        body.extend(chunk)
+    return bytes(body)
+
+@functools.lru_cache(maxsize=1)
+def _load_hosts():
+    """Hosts from ssh_hosts.json, read and parsed once per process"""
+    data = (Path(__file__).parent.parent / "ssh_hosts.json").read_bytes()
+    return _loads(data).get('hosts', [])
+
+def _stream_summary(response):
+    """Parse only the top-level summary object, stopping once it has been read"""
+    if ijson is None:
+        return _json(response).get('summary', {})
+    response.raw.decode_content = True
+    return next(ijson.items(response.raw, 'summary'), {})
+
+def _port_open(host, port, timeout=0.1):
+    """TCP connect probe; a refused port fails in well under a millisecond"""
+    sock = socket.socket()
+    sock.settimeout(timeout)
+    try:
+        return sock.connect_ex((host, port)) == 0
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+class _RecordsByThread(logging.Handler):
+    """Holds log records per thread name so concurrent checks can be logged one after another"""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = defaultdict(list)
+    
+    def emit(self, record):
+        self.records[record.threadName].append(record)
+
+def _run_check(test, base_url):
+    """Run one check, logging instead of raising if it fails"""
+    try:
+        test(base_url)
+    except Exception as e:
+        LOG.error(f"❌ {test.__name__} error: {e}")
+
+def run_concurrently(tests, base_url):
+    """Run independent endpoint tests in parallel, then log each one's lines in order"""
+    _MEMORY_HANDLER.flush()
+    collector = _RecordsByThread()
+    LOG.removeHandler(_MEMORY_HANDLER)
+    LOG.addHandler(collector)
+    try:
+        # One named thread per check, so its records can be told apart
+        threads = [
+            threading.Thread(target=_run_check, args=(test, base_url), name=test.__name__)
+            for test in tests
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        LOG.removeHandler(collector)
+        LOG.addHandler(_MEMORY_HANDLER)
+    
+    for test in tests:
+        for record in collector.records[test.__name__]:
+            LOG.handle(record)
 
 def test_basic_endpoints(base_url="http://localhost:5000"):
     """Test basic API endpoints"""
-    print("🔍 Testing Basic API Endpoints")
-    print("=" * 40)
+    global _FEATURES
+    LOG.info("🔍 Testing Basic API Endpoints")
+    LOG.info("=" * 40)
     
     # Test health endpoint
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = _timed('health', 'get', endpoint_urls(base_url)['health'], timeout=5)
         if response.status_code == 200:
-            print("✅ Health endpoint: OK")
-            data = response.json()
-            print(f"   Status: {data.get('status')}")
+            LOG.info("✅ Health endpoint: OK")
+            data = _json(response)
+            LOG.info(f"   Status: {data.get('status')}")
         else:
-            print(f"❌ Health endpoint failed: {response.status_code}")
+            LOG.error(f"❌ Health endpoint failed: {response.status_code}")
             return False
     except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to VersaLogIQ server")
-        print("   Make sure the server is running on localhost:5000")
+        LOG.error("❌ Cannot connect to VersaLogIQ server")
+        LOG.info(f"   Make sure the server is running on {base_url}")
         return False
     except Exception as e:
-        print(f"❌ Health endpoint error: {e}")
+        LOG.error(f"❌ Health endpoint error: {e}")
         return False
     
     # Test version endpoint
     try:
-        response = requests.get(f"{base_url}/version", timeout=5)
+        response = _timed('version', 'get', endpoint_urls(base_url)['version'], timeout=5)
         if response.status_code == 200:
-            print("✅ Version endpoint: OK")
-            data = response.json()
-            print(f"   Version: {data.get('version')}")
-            print(f"   Features: {len(data.get('features', []))}")
+            LOG.info("✅ Version endpoint: OK")
+            data = _json(response)
+            LOG.info(f"   Version: {data.get('version')}")
+            LOG.info(f"   Features: {len(data.get('features', []))}")
+            if 'api_features' in data:
+                _FEATURES = frozenset(data['api_features'])
         else:
-            print(f"❌ Version endpoint failed: {response.status_code}")
+            LOG.error(f"❌ Version endpoint failed: {response.status_code}")
     except Exception as e:
-        print(f"❌ Version endpoint error: {e}")
+        LOG.error(f"❌ Version endpoint error: {e}")
     
     return True
 
 def test_mock_connectivity(base_url="http://localhost:5000"):
     """Test mock server connectivity"""
-    print("\n🎭 Testing Mock Server Connectivity")
-    print("=" * 40)
+    LOG.info("\n🎭 Testing Mock Server Connectivity")
+    LOG.info("=" * 40)
+    
+    if not _advertised('test_connection'):
+        return True
     
     # Test mock VMS server
     test_payload = {
@@ -62,53 +224,88 @@ def test_mock_connectivity(base_url="http://localhost:5000"):
     }
     
     try:
-        response = requests.post(
-            f"{base_url}/api/test_connection",
+        response = _timed(
+            'mock_test_connection', 'post',
+            endpoint_urls(base_url)['test_connection'],
             json=test_payload,
             timeout=10
         )
         
         if response.status_code == 200:
-            print("✅ Mock connection test: OK")
-            data = response.json()
-            print(f"   Success: {data.get('success')}")
-            print(f"   Flavor: {data.get('detected_flavor')}")
-            print(f"   Time: {data.get('connection_time')}s")
+            LOG.info("✅ Mock connection test: OK")
+            data = _json(response)
+            LOG.info(f"   Success: {data.get('success')}")
+            LOG.info(f"   Flavor: {data.get('detected_flavor')}")
+            LOG.info(f"   Time: {data.get('connection_time')}s")
         elif response.status_code == 404:
-            print("⚠️  Connection API endpoint not found")
-            print("   The REST API endpoints may not be loaded yet")
+            LOG.info("⚠️  Connection API endpoint not found")
+            LOG.info("   The REST API endpoints may not be loaded yet")
             return False
         else:
-            print(f"❌ Mock connection test failed: {response.status_code}")
-            print(f"   Response: {response.text}")
+            LOG.error(f"❌ Mock connection test failed: {response.status_code}")
+            LOG.info(f"   Response: {response.text}")
             return False
     except Exception as e:
-        print(f"❌ Mock connection test error: {e}")
+        LOG.error(f"❌ Mock connection test error: {e}")
+        return False
+    
+    # Compare one POST per mock server against a single batched POST
+    if not _advertised('batch_test_connection'):
+        return True
+    
+    payloads = [API_TEST_CONFIG['test_servers'][key] for key in ('mock_vms', 'mock_vos', 'mock_scim')]
+    try:
+        start = time.perf_counter()
+        for payload in payloads:
+            _post_test_connection(base_url, payload)
+        serial_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        response = _timed(
+            'batch_test_connection', 'post',
+            endpoint_urls(base_url)['test_connection'],
+            params={'batch': 1},
+            json={'tests': payloads},
+            timeout=API_TEST_CONFIG['timeout']['single_connection']
+        )
+        batch_time = time.perf_counter() - start
+        
+        if response.status_code == 200:
+            results = _json(response).get('results', [])
+            ok = sum(1 for result in results if result.get('success'))
+            LOG.info(f"✅ Batched mock connection test: {ok}/{len(payloads)} OK")
+            LOG.info(f"   Serial {serial_time:.3f}s, batched {batch_time:.3f}s")
+            if ok != len(payloads):
+                LOG.error("❌ Batched mock connection test: not every server succeeded")
+                return False
+        else:
+            LOG.info(f"⚠️  Batched connection test not available: {response.status_code}")
+    except Exception as e:
+        LOG.error(f"❌ Batched mock connection test error: {e}")
         return False
     
     return True
 
 def test_real_server_connectivity(base_url="http://localhost:5000"):
     """Test connectivity to a real server from ssh_hosts.json"""
-    print("\n🖥️  Testing Real Server Connectivity")
-    print("=" * 40)
+    LOG.info("\n🖥️  Testing Real Server Connectivity")
+    LOG.info("=" * 40)
     
-    # Load ssh_hosts.json
-    ssh_hosts_file = Path(__file__).parent.parent / "ssh_hosts.json"
+    if not _advertised('test_connection'):
+        return True
     
+    # Load ssh_hosts.json
     try:
-        with open(ssh_hosts_file, 'r') as f:
-            hosts_data = json.load(f)
-            servers = hosts_data.get('hosts', [])
+        servers = _load_hosts()
     except FileNotFoundError:
-        print("⚠️  ssh_hosts.json not found - skipping real server tests")
+        LOG.info("⚠️  ssh_hosts.json not found - skipping real server tests")
         return True
-    except json.JSONDecodeError:
-        print("❌ Invalid JSON in ssh_hosts.json")
+    except ValueError:
+        LOG.error("❌ Invalid JSON in ssh_hosts.json")
         return False
     
     if not servers:
-        print("⚠️  No servers configured in ssh_hosts.json")
+        LOG.info("⚠️  No servers configured in ssh_hosts.json")
         return True
     
     # Test first server in the list
@@ -120,126 +317,195 @@ def test_real_server_connectivity(base_url="http://localhost:5000"):
         "expected_flavor": test_server['flavour']
     }
     
-    print(f"Testing connection to: {test_server['name']} ({test_server['hostname']})")
+    LOG.info(f"Testing connection to: {test_server['name']} ({test_server['hostname']})")
     
     try:
-        response = requests.post(
-            f"{base_url}/api/test_connection",
+        # Separate connect/read timeouts, streamed so a stalled body fails on the read timeout
+        with _timed(
+            'real_test_connection', 'post',
+            endpoint_urls(base_url)['test_connection'],
             json=test_payload,
-            timeout=30  # Longer timeout for real connections
-        )
+            timeout=(5, 10),
+            stream=True
+        ) as response:
+            body = _read_streamed(response)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(body)
             if data.get('success'):
-                print("✅ Real server connection: SUCCESS")
-                print(f"   Detected flavor: {data.get('detected_flavor')}")
-                print(f"   Expected flavor: {test_server['flavour']}")
-                print(f"   Flavor match: {data.get('detected_flavor') == test_server['flavour']}")
-                print(f"   Connection time: {data.get('connection_time')}s")
-                print(f"   Sudo available: {data.get('sudo_available')}")
+                LOG.info("✅ Real server connection: SUCCESS")
+                LOG.info(f"   Detected flavor: {data.get('detected_flavor')}")
+                LOG.info(f"   Expected flavor: {test_server['flavour']}")
+                LOG.info(f"   Flavor match: {data.get('detected_flavor') == test_server['flavour']}")
+                LOG.info(f"   Connection time: {data.get('connection_time')}s")
+                LOG.info(f"   Sudo available: {data.get('sudo_available')}")
             else:
-                print("❌ Real server connection: FAILED")
-                print(f"   Error: {data.get('error')}")
+                LOG.error("❌ Real server connection: FAILED")
+                LOG.info(f"   Error: {data.get('error')}")
         else:
-            print(f"❌ Real server connection failed: HTTP {response.status_code}")
-            print(f"   Response: {response.text}")
+            LOG.error(f"❌ Real server connection failed: HTTP {response.status_code}")
+            LOG.info(f"   Response: {body.decode('utf-8', 'replace')}")
     
-    except requests.exceptions.Timeout:
-        print("⏱️  Real server connection: TIMEOUT")
-        print("   This is normal if the server is unreachable")
+    except (requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError):
+        LOG.info("⏱️  Real server connection: TIMEOUT")
+        LOG.info("   This is normal if the server is unreachable")
     except Exception as e:
-        print(f"❌ Real server connection error: {e}")
+        LOG.error(f"❌ Real server connection error: {e}")
     
     return True
 
 def test_bulk_connectivity(base_url="http://localhost:5000"):
     """Test bulk connectivity check"""
-    print("\n📋 Testing Bulk Connectivity Check")
-    print("=" * 40)
+    LOG.info("\n📋 Testing Bulk Connectivity Check")
+    LOG.info("=" * 40)
+    
+    if not _advertised('bulk_check'):
+        return
     
     # Test with mock servers
     test_payload = {"use_mock": True}
     
     try:
-        response = requests.post(
-            f"{base_url}/api/check_all_servers",
+        response = _timed(
+            'check_all_servers', 'post',
+            endpoint_urls(base_url)['check_all_servers'],
             json=test_payload,
             timeout=30
         )
         
         if response.status_code == 200:
-            print("✅ Bulk connectivity check: OK")
-            data = response.json()
+            LOG.info("✅ Bulk connectivity check: OK")
+            data = _json(response)
             summary = data.get('summary', {})
-            print(f"   Total servers: {summary.get('total_tested', 0)}")
-            print(f"   Successful: {summary.get('successful', 0)}")
-            print(f"   Failed: {summary.get('failed', 0)}")
-            print(f"   Success rate: {summary.get('success_rate', 0)}%")
+            LOG.info(f"   Total servers: {summary.get('total_tested', 0)}")
+            LOG.info(f"   Successful: {summary.get('successful', 0)}")
+            LOG.info(f"   Failed: {summary.get('failed', 0)}")
+            LOG.info(f"   Success rate: {summary.get('success_rate', 0)}%")
         elif response.status_code == 404:
-            print("⚠️  Bulk connectivity API endpoint not found")
+            LOG.info("⚠️  Bulk connectivity API endpoint not found")
         else:
-            print(f"❌ Bulk connectivity check failed: {response.status_code}")
-            print(f"   Response: {response.text}")
+            LOG.error(f"❌ Bulk connectivity check failed: {response.status_code}")
+            LOG.info(f"   Response: {response.text}")
     
     except Exception as e:
-        print(f"❌ Bulk connectivity check error: {e}")
+        LOG.error(f"❌ Bulk connectivity check error: {e}")
+
+def compare_fanout(base_url="http://localhost:5000"):
+    """Compare serial and parallel client-side fan-out over the configured mock servers"""
+    LOG.info("\n🔀 Comparing Serial and Parallel Fan-out")
+    LOG.info("=" * 40)
+    
+    if not _advertised('test_connection'):
+        return
+    
+    servers = list(API_TEST_CONFIG['test_servers'].values())
+    start = time.perf_counter()
+    for payload in servers:
+        try:
+            _post_test_connection(base_url, payload)
+        except requests.exceptions.RequestException:
+            pass
+    serial_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    results = bulk_parallel(servers, base_url)
+    parallel_time = time.perf_counter() - start
+    
+    ok = sum(1 for result in results if getattr(result, 'status_code', None) == 200)
+    LOG.info(f"   Fan-out of {len(servers)} servers ({ok} OK): serial {serial_time:.2f}s, parallel {parallel_time:.2f}s")
+
+def _post_test_connection(base_url, payload):
+    """POST one server to /api/test_connection"""
+    return SESSION.post(
+        endpoint_urls(base_url)['test_connection'],
+        json=payload,
+        timeout=API_TEST_CONFIG['timeout']['single_connection']
+    )
+
+def bulk_parallel(servers, base_url="http://localhost:5000"):
+    """Test every server at once; each result is a response or the exception it raised"""
+    with ThreadPoolExecutor(max_workers=max(len(servers), 1)) as pool:
+        futures = [pool.submit(_post_test_connection, base_url, payload) for payload in servers]
+    return [future.exception() or future.result() for future in futures]
 
 def test_connectivity_report(base_url="http://localhost:5000"):
     """Test connectivity report generation"""
-    print("\n📊 Testing Connectivity Report")
-    print("=" * 40)
+    LOG.info("\n📊 Testing Connectivity Report")
+    LOG.info("=" * 40)
+    
+    if not _advertised('connectivity_report'):
+        return
     
     try:
-        response = requests.get(f"{base_url}/api/connectivity_report", timeout=30)
-        
-        if response.status_code == 200:
-            print("✅ Connectivity report: OK")
-            data = response.json()
-            summary = data.get('summary', {})
-            print(f"   Total servers: {summary.get('total_servers', 0)}")
-            print(f"   Online servers: {summary.get('online_servers', 0)}")
-            print(f"   Availability: {summary.get('availability_percentage', 0)}%")
-            
-            # Show flavor breakdown
-            by_flavor = summary.get('by_flavor', {})
-            if by_flavor:
-                print("   By flavor:")
-                for flavor, stats in by_flavor.items():
-                    print(f"     {flavor}: {stats.get('online', 0)}/{stats.get('total', 0)}")
-        elif response.status_code == 404:
-            print("⚠️  Connectivity report API endpoint not found")
-        else:
-            print(f"❌ Connectivity report failed: {response.status_code}")
+        # Streamed so only the summary is parsed, not the per-server details
+        with _timed('connectivity_report', 'get', endpoint_urls(base_url)['connectivity_report'], timeout=30, stream=True) as response:
+            if response.status_code == 200:
+                LOG.info("✅ Connectivity report: OK")
+                summary = _stream_summary(response)
+                LOG.info(f"   Total servers: {summary.get('total_servers', 0)}")
+                LOG.info(f"   Online servers: {summary.get('online_servers', 0)}")
+                LOG.info(f"   Availability: {summary.get('availability_percentage', 0)}%")
+                
+                # Show flavor breakdown
+                by_flavor = summary.get('by_flavor', {})
+                if by_flavor:
+                    LOG.info("   By flavor:")
+                    for flavor, stats in by_flavor.items():
+                        LOG.info(f"     {flavor}: {stats.get('online', 0)}/{stats.get('total', 0)}")
+            elif response.status_code == 404:
+                LOG.info("⚠️  Connectivity report API endpoint not found")
+            else:
+                LOG.error(f"❌ Connectivity report failed: {response.status_code}")
     
     except Exception as e:
-        print(f"❌ Connectivity report error: {e}")
+        LOG.error(f"❌ Connectivity report error: {e}")
 
 def main():
     """Main test function"""
-    print("🚀 VersaLogIQ REST API Connectivity Test")
-    print("=" * 50)
+    LOG.info("🚀 VersaLogIQ REST API Connectivity Test")
+    LOG.info("=" * 50)
     
     base_url = "http://localhost:5000"
     
-    # Test basic endpoints first
-    if not test_basic_endpoints(base_url):
-        print("\n❌ Basic endpoint tests failed - server may not be running")
-        sys.exit(1)
-    
-    # Test connectivity features
-    test_mock_connectivity(base_url)
-    test_real_server_connectivity(base_url)
-    test_bulk_connectivity(base_url)
-    test_connectivity_report(base_url)
-    
-    print("\n" + "=" * 50)
-    print("🎉 REST API Connectivity Test Completed!")
-    print("\nNext steps:")
-    print("1. Run the full test suite: python run_tests.py --type integration")
-    print("2. Test specific category: python test_rest_api_connectivity.py --category connectivity")
-    print("3. Run with mock only: python test_rest_api_connectivity.py --mock-only")
-    print("=" * 50)
+    try:
+        # Nothing listening at all: bail out before waiting on any request timeouts
+        address = urlsplit(base_url)
+        if not _port_open(address.hostname, address.port or (443 if address.scheme == 'https' else 80)):
+            LOG.error(f"❌ Basic endpoint tests failed - server is not running on {address.netloc}")
+            sys.exit(1)
+        
+        # Test basic endpoints first
+        if not test_basic_endpoints(base_url):
+            LOG.info("\n❌ Basic endpoint tests failed - server may not be running")
+            sys.exit(1)
+        
+        # Test connectivity features; they are independent, so the round-trips overlap
+        run_concurrently([
+            test_mock_connectivity,
+            test_real_server_connectivity,
+            test_bulk_connectivity,
+            test_connectivity_report
+        ], base_url)
+        
+        # Timed on its own so the other checks do not share the pool or the server with it
+        compare_fanout(base_url)
+    finally:
+        SESSION.close()
+        _MEMORY_HANDLER.flush()
+    
+    if _TIMINGS:
+        LOG.info("\n⏱️  Client-side request times:")
+        for name, elapsed in _TIMINGS.items():
+            LOG.info(f"   {name}: {elapsed / 1e6:.1f} ms")
+    
+    LOG.info("\n" + "=" * 50)
+    LOG.info("🎉 REST API Connectivity Test Completed!")
+    LOG.info("\nNext steps:")
+    LOG.info("1. Run the full test suite: python run_tests.py --type integration")
+    LOG.info("2. Test specific category: python test_rest_api_connectivity.py --category connectivity")
+    LOG.info("3. Run with mock only: python test_rest_api_connectivity.py --mock-only")
+    LOG.info("=" * 50)
+    _MEMORY_HANDLER.flush()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
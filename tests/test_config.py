@@ -3,17 +3,34 @@
 Test configuration for VersaLogIQ test automation
 """
 
+import functools
 import os
+import re
 import sys
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Tuple
 
 # Add parent directory to path for imports
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(TEST_DIR)
 BACKEND_DIR = os.path.join(PROJECT_ROOT, 'backend')
 
-# Add paths for imports
-sys.path.insert(0, PROJECT_ROOT)
-sys.path.insert(0, BACKEND_DIR)
+# Add paths for imports, once per process
+for _path in (PROJECT_ROOT, BACKEND_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+def _compact(value):
+    """Intern strings and freeze lists into tuples, recursing through dicts in place"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_compact(item) for item in value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _compact(item)
+    return value
 
 # Test configuration
 TEST_CONFIG = {
@@ -84,6 +101,17 @@ FLAVOR_TEST_CONFIG = {
         'expected_patterns': ['ubuntu']
     }
 }
+_compact(FLAVOR_TEST_CONFIG)
+
+# Every expected pattern in one alternation, longest first so 'versa_scim' wins over 'versa'
+_FLAVOR_BY_PATTERN = {}
+for _flavor_key, _flavor in FLAVOR_TEST_CONFIG.items():
+    for _pattern in _flavor['expected_patterns']:
+        _FLAVOR_BY_PATTERN.setdefault(_pattern.lower(), _flavor_key)
+FLAVOR_REGEX = re.compile(
+    '|'.join(map(re.escape, sorted(_FLAVOR_BY_PATTERN, key=len, reverse=True))),
+    re.IGNORECASE
+)
 
 # Sudo response patterns for testing
 SUDO_RESPONSE_PATTERNS = {
@@ -106,6 +134,7 @@ SUDO_RESPONSE_PATTERNS = {
         ''  # Empty response
     ]
 }
+_compact(SUDO_RESPONSE_PATTERNS)
 
 # API Testing Configuration
 API_TEST_CONFIG = {
@@ -150,8 +179,30 @@ API_TEST_CONFIG = {
     }
 }
 
+# Absolute endpoint URLs for the default base_url, built once at import
+API_TEST_CONFIG['full_urls'] = {
+    name: API_TEST_CONFIG['base_url'] + path for name, path in API_TEST_CONFIG['endpoints'].items()
+}
+
+@dataclass(slots=True, frozen=True)
+class MockServer:
+    """Mock server definition; responses are (command, output) pairs"""
+    hostname: str
+    username: str
+    password: str
+    flavor: str
+    sudo_type: str
+    banner: str
+    responses: Tuple[Tuple[str, str], ...]
+    
+    def as_dict(self):
+        """Plain dict form, with responses as a command -> output dict"""
+        data = asdict(self)
+        data['responses'] = dict(self.responses)
+        return data
+
 # Mock server definitions
-MOCK_SERVERS = {
+_RAW_MOCK_SERVERS = {
     'vms_server': {
         'hostname': 'test-vms.local',
         'username': 'admin',
@@ -189,6 +240,11 @@ MOCK_SERVERS = {
         }
     }
 }
+_compact(_RAW_MOCK_SERVERS)
+MOCK_SERVERS = {
+    key: MockServer(**{**server, 'responses': tuple(server['responses'].items())})
+    for key, server in _RAW_MOCK_SERVERS.items()
+}
 
 # Log file test data
 LOG_FILE_TEST_DATA = {
@@ -227,37 +283,61 @@ TEST_CREDENTIALS = {
     }
 }
 
-# Test environment settings
+# Test environment settings, fixed for the life of the process
+_ENV = MappingProxyType({
+    'project_root': PROJECT_ROOT,
+    'backend_dir': BACKEND_DIR,
+    'test_dir': TEST_DIR,
+    'config_file': os.path.join(PROJECT_ROOT, 'config', 'server_flavors.json'),
+    'ssh_hosts_file': os.path.join(PROJECT_ROOT, 'ssh_hosts.json')
+})
+
 def get_test_env():
-    """Get test environment configuration"""
-    return {
-        'project_root': PROJECT_ROOT,
-        'backend_dir': BACKEND_DIR,
-        'test_dir': TEST_DIR,
-        'config_file': os.path.join(PROJECT_ROOT, 'config', 'server_flavors.json'),
-        'ssh_hosts_file': os.path.join(PROJECT_ROOT, 'ssh_hosts.json')
-    }
+    """Get test environment configuration (read-only)"""
+    return _ENV
 
 # Validation functions
+_REQUIRED_CONFIG_KEYS = frozenset({'timeout', 'mock_data', 'logging', 'coverage'})
+
 def validate_test_config():
     """Validate test configuration is complete"""
-    required_keys = ['timeout', 'mock_data', 'logging', 'coverage']
-    for key in required_keys:
-        if key not in TEST_CONFIG:
-            raise ValueError(f"Missing required test config key: {key}")
+    missing = _REQUIRED_CONFIG_KEYS - TEST_CONFIG.keys()
+    if missing:
+        raise ValueError(f"Missing required test config keys: {sorted(missing)}")
     return True
 
+@functools.lru_cache(maxsize=None)
 def get_flavor_config(flavor_key):
-    """Get configuration for specific server flavor"""
-    return FLAVOR_TEST_CONFIG.get(flavor_key.lower())
+    """Get configuration for specific server flavor (read-only, as it is shared through the cache)"""
+    config = FLAVOR_TEST_CONFIG.get(flavor_key.lower())
+    return MappingProxyType(config) if config is not None else None
+
+def match_flavor(output):
+    """Return the flavor key of the first expected pattern found in output, or None"""
+    if isinstance(output, bytes):
+        output = output.decode('utf-8', 'replace')
+    match = FLAVOR_REGEX.search(output)
+    return _FLAVOR_BY_PATTERN[match.group().lower()] if match else None
 
+@functools.lru_cache(maxsize=None)
 def get_mock_server(server_key):
     """Get mock server configuration"""
     return MOCK_SERVERS.get(server_key)
 
+def get_test_server(flavor):
+    """Get connection parameters for a flavor's API test server (e.g. 'vms'), or None"""
+    server = API_TEST_CONFIG['test_servers'].get(f"mock_{flavor.lower()}")
+    if server is None:
+        return None
+    # Keyed like the ssh_connect event and connect_to_server, which take 'host' rather than 'hostname'
+    params = {key: value for key, value in server.items() if key != 'hostname'}
+    params['host'] = server['hostname']
+    return params
+
+@functools.lru_cache(maxsize=None)
 def get_sudo_patterns(pattern_type):
     """Get sudo response patterns for testing"""
-    return SUDO_RESPONSE_PATTERNS.get(pattern_type, [])
+    return SUDO_RESPONSE_PATTERNS.get(pattern_type, ())
 
 if __name__ == "__main__":
     # Test configuration validation
@@ -279,7 +359,7 @@ if __name__ == "__main__":
         
         print(f"\n🖥️  Mock servers configured: {len(MOCK_SERVERS)}")
         for server, config in MOCK_SERVERS.items():
-            print(f"   {config['flavor']}: {config['hostname']} ({config['sudo_type']})")
+            print(f"   {config.flavor}: {config.hostname} ({config.sudo_type})")
         
         print(f"\n📝 Test patterns configured:")
         for pattern_type, patterns in SUDO_RESPONSE_PATTERNS.items():
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the asyncssh flavour detection path of the SSH connectivity tester
+"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directories to path
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mock.mock_responses import create_mock_server
+import ssh_connectivity_tester
+from ssh_connectivity_tester import SSHConnectivityTester
+
+class FakeAsyncConnection:
+    """Stand-in for an asyncssh connection answering from a mock server's responses"""
+    
+    def __init__(self, responses):
+        self.responses = responses
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def run(self, command):
+        # Probes are sent as "export PATH=...; <command>"
+        probe = command.split('; ', 1)[1]
+        self.commands.append(probe)
+        return SimpleNamespace(stdout=self.responses.get(probe, ''))
+
+class TestAsyncFlavorDetection(unittest.TestCase):
+    """Test cases for detect_flavour_async and its sudo fallback"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Load the real flavour rules once"""
+        cls.tester = SSHConnectivityTester(
+            flavour_config_file=os.path.join(PROJECT_ROOT, 'config', 'server_flavors.json')
+        )
+        cls.tester.load_flavour_configs()
+    
+    def setUp(self):
+        """VMS host whose release file would also satisfy the lower-priority VOS rule"""
+        self.vms_server = create_mock_server('VMS')
+        self.responses = {
+            **self.vms_server['responses'],
+            'whoami': self.vms_server['username'],
+            'cat /etc/versa-release': 'Versa Director Release 21.2.1'
+        }
+        self.host_config = {
+            'name': 'vms-test',
+            'hostname': self.vms_server['hostname'],
+            'user': self.vms_server['username'],
+            'password': self.vms_server['password'],
+            'flavour': 'VMS'
+        }
+    
+    def test_sudo_rule_defers_to_paramiko_path(self):
+        """A sudo rule next in priority order stops async detection instead of letting VOS win"""
+        connection = FakeAsyncConnection(self.responses)
+        
+        flavour, outputs = asyncio.run(self.tester.detect_flavour_async(connection))
+        
+        self.assertIsNone(flavour)
+        # The sudo probe is never sent over asyncssh
+        self.assertNotIn('vsh status | grep msgservice', connection.commands)
+    
+    def test_async_probe_detects_vms_through_sudo_fallback(self):
+        """The full async probe of a VMS host reports VMS, with no flavour mismatch"""
+        connection = FakeAsyncConnection(self.responses)
+        sudo_commands = []
+        
+        async def connect(*args, **kwargs):
+            return connection
+        
+        def execute_ssh_command(ssh_client, command, timeout=15, use_sudo=False):
+            if use_sudo:
+                sudo_commands.append(command)
+            return self.responses.get(command, ''), ''
+        
+        fake_asyncssh = SimpleNamespace(connect=connect)
+        with patch.object(ssh_connectivity_tester, 'asyncssh', fake_asyncssh), \
+             patch.object(self.tester, '_phase_connect', return_value=(object(), {})), \
+             patch.object(self.tester, 'execute_ssh_command', side_effect=execute_ssh_command), \
+             patch.object(self.tester.pool, 'release'):
+            result = asyncio.run(self.tester._probe_async(self.host_config, 5, asyncio.Semaphore(1)))
+        
+        self.assertEqual(result['status'], 'SUCCESS')
+        self.assertEqual(result['detected_flavour'], 'VMS')
+        self.assertFalse(result['flavour_mismatch'])
+        self.assertEqual(sudo_commands, ['vsh status | grep msgservice'])
+
+if __name__ == '__main__':
+    unittest.main()
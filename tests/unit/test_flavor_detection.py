@@ -4,6 +4,7 @@ Unit tests for server flavor detection functionality
 """
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
@@ -12,16 +13,18 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from test_config import FLAVOR_TEST_CONFIG, get_flavor_config
-from mock.mock_responses import FlavorResponseGenerator, create_mock_server
+from test_config import FLAVOR_TEST_CONFIG, get_flavor_config, match_flavor
+from mock.mock_responses import FlavorResponseGenerator, copy_mock_server, create_mock_server
+import versalogiq_app
 from versalogiq_app import VersaLogIQ
+from versalogiq_fixtures import CapturedLogMixin, SharedVersaLogIQMixin
 
-class TestFlavorDetection(unittest.TestCase):
+class TestFlavorDetection(SharedVersaLogIQMixin, CapturedLogMixin, unittest.TestCase):
     """Test cases for server flavor detection"""
     
     def setUp(self):
         """Set up test environment"""
-        self.versalogiq = VersaLogIQ()
+        self.versalogiq = self._reset_versalogiq()
         # Mock SSH client to avoid actual connections
         self.versalogiq.ssh_client = Mock()
         self.versalogiq.connected = True
@@ -35,12 +38,6 @@ class TestFlavorDetection(unittest.TestCase):
         """Clean up after tests"""
         self.versalogiq.log_output = self.original_log_output
     
-    def _capture_log_output(self, message, tag):
-        """Capture log messages for testing"""
-        self.log_messages.append((message, tag))
-        # Still call original for debugging if needed
-        # self.original_log_output(message, tag)
-    
     def test_flavor_config_loading(self):
         """Test that flavor configuration loads correctly"""
         self.assertIsNotNone(self.versalogiq.flavour_configs)
@@ -111,9 +108,7 @@ class TestFlavorDetection(unittest.TestCase):
         mock_execute.assert_called()
         
         # Check log messages
-        log_messages_text = [msg[0] for msg in self.log_messages]
-        self.assertTrue(any("VMS" in msg for msg in log_messages_text))
-        self.assertTrue(any("✅ Server flavour detected" in msg for msg in log_messages_text))
+        self.assertTrue(self._log_contains("VMS", "✅ Server flavour detected"))
     
     @patch('versalogiq_app.VersaLogIQ.execute_ssh_command')
     def test_vos_flavor_detection(self, mock_execute):
@@ -159,8 +154,7 @@ class TestFlavorDetection(unittest.TestCase):
         self.assertEqual(detected_flavor, "Unknown")
         
         # Check log messages for fallback
-        log_messages_text = [msg[0] for msg in self.log_messages]
-        self.assertTrue(any("No flavour detected" in msg for msg in log_messages_text))
+        self.assertTrue(self._log_contains("No flavour detected"))
     
     @patch('versalogiq_app.VersaLogIQ.execute_ssh_command')
     def test_flavor_detection_priority(self, mock_execute):
@@ -179,8 +173,25 @@ class TestFlavorDetection(unittest.TestCase):
         # Should be Unknown since no patterns matched
         self.assertEqual(detected_flavor, "Unknown")
         
-        # Verify that commands were called (priority order testing)
+        # Verify that commands were called, highest priority rule first
         self.assertGreater(len(call_order), 0)
+        self.assertEqual(call_order[0], self.versalogiq._rule_commands[0])
+    
+    @patch('versalogiq_app.VersaLogIQ.execute_ssh_command')
+    def test_flavor_detection_stops_at_first_match(self, mock_execute):
+        """Test that a matching high priority rule ends detection without further commands"""
+        call_order = []
+        
+        def mock_command_execution(command, timeout, use_sudo):
+            call_order.append(command)
+            return ("msgservice: running", "")
+        
+        mock_execute.side_effect = mock_command_execution
+        
+        detected_flavor = self.versalogiq.detect_server_flavour()
+        
+        self.assertEqual(detected_flavor, "VMS")
+        self.assertEqual(call_order, ["vsh status | grep msgservice"])
     
     @patch('versalogiq_app.VersaLogIQ.execute_ssh_command')
     def test_command_execution_error_handling(self, mock_execute):
@@ -194,8 +205,7 @@ class TestFlavorDetection(unittest.TestCase):
         self.assertEqual(detected_flavor, "Unknown")
         
         # Check error messages in logs
-        log_messages_text = [msg[0] for msg in self.log_messages]
-        self.assertTrue(any("Error testing" in msg for msg in log_messages_text))
+        self.assertTrue(self._log_contains("Error testing"))
     
     def test_flavor_detection_without_ssh(self):
         """Test flavor detection when SSH is not connected"""
@@ -229,6 +239,18 @@ class TestFlavorDetection(unittest.TestCase):
                 self.assertIn('required_patterns', rule)
                 self.assertIn('priority', rule)
     
+    def test_mock_server_copy_is_mutable(self):
+        """A copied mock server can be changed without touching the shared cached config"""
+        shared = create_mock_server('VMS')
+        server = copy_mock_server(shared)
+        
+        server['sudo_type'] = 'passwordless'
+        server['responses']['vsh status | grep msgservice'] = 'msgservice: stopped'
+        
+        self.assertEqual(shared['sudo_type'], 'password_required')
+        self.assertEqual(shared['responses']['vsh status | grep msgservice'], "msgservice: running (pid: 1234)")
+        self.assertIs(create_mock_server('VMS'), shared)
+    
     def test_mock_response_generation(self):
         """Test mock response generation for different flavors"""
         test_cases = [
@@ -250,6 +272,8 @@ class TestFlavorDetection(unittest.TestCase):
             for cmd, response in responses.items():
                 if command in cmd or cmd in command:
                     self.assertIn(expected_pattern.lower(), response.lower())
+                    # The response must also classify as its own flavor across every expected pattern
+                    self.assertEqual(match_flavor(response), flavor.lower())
                     found_response = True
                     break
             
@@ -257,6 +281,68 @@ class TestFlavorDetection(unittest.TestCase):
             # but should have the flavor correctly configured
             self.assertEqual(mock_config['flavor'], flavor.upper())
 
+class StubAutomaton:
+    """Minimal ahocorasick.Automaton yielding (end_index, value) for every match in text order"""
+    
+    def __init__(self):
+        self.words = {}
+        self.yielded = 0
+    
+    def add_word(self, word, value):
+        self.words[word] = value
+    
+    def make_automaton(self):
+        pass
+    
+    def iter(self, text):
+        matches = sorted(
+            (start + len(word) - 1, value)
+            for word, value in self.words.items()
+            for start in range(len(text)) if text.startswith(word, start)
+        )
+        for match in matches:
+            self.yielded += 1
+            yield match
+
+class TestPatternAutomaton(SharedVersaLogIQMixin, unittest.TestCase):
+    """Test the Aho-Corasick branch of _check_patterns against a stub ahocorasick module"""
+    
+    def setUp(self):
+        """Install the stub module and start from an empty automaton cache"""
+        self.versalogiq = self._reset_versalogiq()
+        patcher = patch.object(versalogiq_app, 'ahocorasick', SimpleNamespace(Automaton=StubAutomaton))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Automata built from the stub must not outlive the test
+        versalogiq_app._pattern_automaton.cache_clear()
+        self.addCleanup(versalogiq_app._pattern_automaton.cache_clear)
+    
+    def test_all_patterns_found(self):
+        """Every pattern present, in any order and case, is a match"""
+        result = self.versalogiq._check_patterns("FlexVNF platform by Versa", ["versa", "flexvnf"], "contains", False)
+        self.assertTrue(result)
+        self.assertEqual(versalogiq_app._pattern_automaton.cache_info().currsize, 1)
+    
+    def test_missing_pattern(self):
+        """One absent pattern fails the check"""
+        result = self.versalogiq._check_patterns("versa system running", ["versa", "flexvnf"], "contains", False)
+        self.assertFalse(result)
+    
+    def test_stops_once_every_pattern_is_seen(self):
+        """The scan ends at the match that clears the last bit, ignoring later matches"""
+        patterns = ["versa", "flexvnf"]
+        result = self.versalogiq._check_patterns("versa flexvnf versa versa versa", patterns, "contains", False)
+        
+        self.assertTrue(result)
+        automaton = versalogiq_app._pattern_automaton(tuple(patterns))
+        self.assertEqual(automaton.yielded, 2)
+    
+    def test_single_pattern_skips_automaton(self):
+        """A lone pattern uses a plain substring test and builds no automaton"""
+        result = self.versalogiq._check_patterns("msgservice: running", ["msgservice"], "contains", False)
+        self.assertTrue(result)
+        self.assertEqual(versalogiq_app._pattern_automaton.cache_info().currsize, 0)
+
 class TestFlavorDetectionIntegration(unittest.TestCase):
     """Integration tests for flavor detection with mock servers"""
     
@@ -287,19 +373,13 @@ if __name__ == '__main__':
     verbosity = 2 if args.verbose else 1
     
     if args.pattern:
-        # Run specific test pattern
+        # Run specific test pattern; the loader only builds the matching tests
         loader = unittest.TestLoader()
+        loader.testNamePatterns = [f"*{args.pattern}*"]
         suite = loader.loadTestsFromTestCase(TestFlavorDetection)
         
-        # Filter tests by pattern
-        filtered_suite = unittest.TestSuite()
-        for test_group in suite:
-            for test in test_group:
-                if args.pattern.lower() in test._testMethodName.lower():
-                    filtered_suite.addTest(test)
-        
         runner = unittest.TextTestRunner(verbosity=verbosity)
-        result = runner.run(filtered_suite)
+        result = runner.run(suite)
     else:
         # Run all tests
         unittest.main(argv=[''], verbosity=verbosity, exit=False)
\ No newline at end of file
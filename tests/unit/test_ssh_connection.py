@@ -7,21 +7,44 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+from dataclasses import dataclass
 
 # Add parent directories to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from test_config import SUDO_RESPONSE_PATTERNS, TEST_CREDENTIALS
-from mock.mock_responses import MockSSHClient, MockShell
+from mock.mock_responses import FakeClock, MockSSHClient, MockShell
 from versalogiq_app import VersaLogIQ
+from versalogiq_fixtures import CapturedLogMixin, SharedVersaLogIQMixin
 
-class TestSSHConnection(unittest.TestCase):
+@dataclass
+class FakeChannel:
+    """Stand-in for a paramiko channel reporting a fixed exit status"""
+    exit_status: int = 0
+    
+    def recv_exit_status(self):
+        return self.exit_status
+
+@dataclass
+class FakeStdout:
+    """Stand-in for a paramiko ChannelFile; plain attribute access instead of Mock reflection"""
+    data: bytes = b""
+    exit_status: int = 0
+    
+    def read(self):
+        return self.data
+    
+    @property
+    def channel(self):
+        return FakeChannel(self.exit_status)
+
+class TestSSHConnection(SharedVersaLogIQMixin, CapturedLogMixin, unittest.TestCase):
     """Test cases for SSH connection functionality"""
     
     def setUp(self):
         """Set up test environment"""
-        self.versalogiq = VersaLogIQ()
+        self.versalogiq = self._reset_versalogiq()
         
         # Capture log output
         self.log_messages = []
@@ -39,10 +62,6 @@ class TestSSHConnection(unittest.TestCase):
             except:
                 pass
     
-    def _capture_log_output(self, message, tag):
-        """Capture log messages for testing"""
-        self.log_messages.append((message, tag))
-    
     @patch('paramiko.SSHClient')
     def test_successful_ssh_connection(self, mock_ssh_class):
         """Test successful SSH connection establishment"""
@@ -112,8 +131,7 @@ class TestSSHConnection(unittest.TestCase):
         self.assertFalse(self.versalogiq.connected)
         
         # Check error in logs
-        log_messages_text = [msg[0] for msg in self.log_messages]
-        self.assertTrue(any("Connection failed" in msg for msg in log_messages_text))
+        self.assertTrue(self._log_contains("Connection failed"))
     
     def test_sudo_pattern_detection_password_required(self):
         """Test sudo detection for password-required responses"""
@@ -182,8 +200,7 @@ class TestSSHConnection(unittest.TestCase):
         self.assertEqual(sudo_info['requires_password'], True)
         
         # Check log messages
-        log_messages_text = [msg[0] for msg in self.log_messages]
-        self.assertTrue(any("Sudo requires password" in msg for msg in log_messages_text))
+        self.assertTrue(self._log_contains("Sudo requires password"))
     
     @patch('versalogiq_app.VersaLogIQ.execute_ssh_command')
     def test_sudo_handling_passwordless(self, mock_execute):
@@ -210,15 +227,14 @@ class TestSSHConnection(unittest.TestCase):
         self.assertEqual(sudo_info['requires_password'], False)
         
         # Check log messages
-        log_messages_text = [msg[0] for msg in self.log_messages]
-        self.assertTrue(any("Sudo available without password" in msg for msg in log_messages_text))
+        self.assertTrue(self._log_contains("Sudo available without password"))
 
-class TestSSHCommandExecution(unittest.TestCase):
+class TestSSHCommandExecution(SharedVersaLogIQMixin, CapturedLogMixin, unittest.TestCase):
     """Test cases for SSH command execution"""
     
     def setUp(self):
         """Set up test environment"""
-        self.versalogiq = VersaLogIQ()
+        self.versalogiq = self._reset_versalogiq()
         self.versalogiq.ssh_client = Mock()
         self.versalogiq.connected = True
         
@@ -231,22 +247,12 @@ class TestSSHCommandExecution(unittest.TestCase):
         """Clean up after tests"""
         self.versalogiq.log_output = self.original_log_output
     
-    def _capture_log_output(self, message, tag):
-        """Capture log messages for testing"""
-        self.log_messages.append((message, tag))
-    
     def test_execute_ssh_command_success(self):
         """Test successful SSH command execution"""
         # Mock successful command execution
-        mock_stdin = Mock()
-        mock_stdout = Mock()
-        mock_stderr = Mock()
-        
-        mock_stdout.read.return_value = b"command output"
-        mock_stderr.read.return_value = b""
-        mock_stdout.channel.recv_exit_status.return_value = 0
-        
-        self.versalogiq.ssh_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
+        self.versalogiq.ssh_client.exec_command.return_value = (
+            FakeStdout(), FakeStdout(b"command output", 0), FakeStdout(b"", 0)
+        )
         
         # Execute command
         stdout, stderr = self.versalogiq.execute_ssh_command("ls -la", timeout=10)
@@ -261,15 +267,9 @@ class TestSSHCommandExecution(unittest.TestCase):
     def test_execute_ssh_command_with_sudo(self):
         """Test SSH command execution with sudo"""
         # Mock sudo command execution
-        mock_stdin = Mock()
-        mock_stdout = Mock()
-        mock_stderr = Mock()
-        
-        mock_stdout.read.return_value = b"root output"
-        mock_stderr.read.return_value = b""
-        mock_stdout.channel.recv_exit_status.return_value = 0
-        
-        self.versalogiq.ssh_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
+        self.versalogiq.ssh_client.exec_command.return_value = (
+            FakeStdout(), FakeStdout(b"root output", 0), FakeStdout(b"", 0)
+        )
         
         # Set sudo info
         self.versalogiq.sudo_info = {'sudo_available': True, 'requires_password': False}
@@ -296,15 +296,9 @@ class TestSSHCommandExecution(unittest.TestCase):
     def test_execute_ssh_command_error(self):
         """Test SSH command execution error handling"""
         # Mock error scenario
-        mock_stdin = Mock()
-        mock_stdout = Mock()
-        mock_stderr = Mock()
-        
-        mock_stdout.read.return_value = b""
-        mock_stderr.read.return_value = b"command error"
-        mock_stdout.channel.recv_exit_status.return_value = 1
-        
-        self.versalogiq.ssh_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
+        self.versalogiq.ssh_client.exec_command.return_value = (
+            FakeStdout(), FakeStdout(b"", 1), FakeStdout(b"command error", 1)
+        )
         
         # Execute command
         stdout, stderr = self.versalogiq.execute_ssh_command("invalid_command")
@@ -331,7 +325,16 @@ class TestMockSSHIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up mock integration test environment"""
-        self.mock_client = MockSSHClient()
+        server_config = {
+            'hostname': 'test-ubuntu.local',
+            'username': 'testuser',
+            'password': 'test123',
+            'sudo_type': 'password_required',
+            'responses': {'sudo whoami': '[sudo] password for testuser: '}
+        }
+        # FakeClock turns the simulated connect delay into a clock advance instead of a sleep
+        self.mock_client = MockSSHClient(server_config, clock=FakeClock())
+        self.mock_client.connect('test-ubuntu.local', 'testuser', 'test123')
     
     def test_mock_ssh_basic_commands(self):
         """Test basic commands with mock SSH client"""
@@ -361,10 +364,12 @@ class TestMockSSHIntegration(unittest.TestCase):
         
         for command in test_commands:
             stdin, stdout, stderr = self.mock_client.exec_command(command)
-            result = stdout.read().decode('utf-8')
+            # Checked as raw bytes; the probe outputs are ASCII so no decode is needed
+            result = stdout.read()
             
             # Should get some response (not empty)
             self.assertIsNotNone(result)
+            self.assertIsInstance(result, bytes)
 
 if __name__ == '__main__':
     # Run SSH connection tests
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Shared VersaLogIQ fixtures for the unit and integration tests
+"""
+
+import copy
+import queue
+import threading
+
+from versalogiq_app import VersaLogIQ
+
+# Attribute types that cannot be deep-copied, mapped to a factory for a fresh one per test
+_FRESH_PER_TEST = {queue.Queue: queue.Queue, type(threading.Lock()): threading.Lock}
+
+# Loaded once per class and treated as read-only, so tests share the snapshot's objects
+_SHARED_READ_ONLY = ('flavour_configs',)
+
+class SharedVersaLogIQMixin:
+    """Construct VersaLogIQ once per class and reset its state before each test"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the template instance and snapshot its pristine attributes"""
+        super().setUpClass()
+        cls._template_versalogiq = VersaLogIQ()
+        state = vars(cls._template_versalogiq)
+        # Queues and locks cannot be copied; they are recreated per test instead
+        cls._fresh_attrs = {
+            name: _FRESH_PER_TEST[type(value)] for name, value in state.items()
+            if type(value) in _FRESH_PER_TEST
+        }
+        cls._pristine_state = copy.deepcopy({
+            name: value for name, value in state.items() if name not in cls._fresh_attrs
+        })
+    
+    def _fresh_state(self):
+        """Per-test copy of the snapshot; only the read-only loaded configs are shared"""
+        # Seeding the memo keeps shared objects as-is, including aliases such as _rules_source
+        memo = {
+            id(self._pristine_state[name]): self._pristine_state[name]
+            for name in _SHARED_READ_ONLY if name in self._pristine_state
+        }
+        state = copy.deepcopy(self._pristine_state, memo)
+        for name, factory in self._fresh_attrs.items():
+            state[name] = factory()
+        return state
+    
+    def _reset_versalogiq(self):
+        """Return the shared instance restored to its freshly constructed state"""
+        versalogiq = self._template_versalogiq
+        state = vars(versalogiq)
+        # Dropping instance attributes also removes per-test overrides (log_output, emit)
+        state.clear()
+        state.update(self._fresh_state())
+        return versalogiq
+    
+    def _new_versalogiq(self):
+        """Return an independent instance built from the snapshot, for use alongside the shared one"""
+        versalogiq = VersaLogIQ.__new__(VersaLogIQ)
+        vars(versalogiq).update(self._fresh_state())
+        return versalogiq
+
+class CapturedLogMixin:
+    """Collect VersaLogIQ.log_output calls as (message, tag) pairs in self.log_messages"""
+    
+    def _capture_log_output(self, message, tag):
+        """Capture log messages for testing"""
+        self.log_messages.append((message, tag))
+    
+    def _log_contains(self, *needles):
+        """True if every needle appears in the captured log, joined once into a single string"""
+        joined = "\n".join(message for message, _ in self.log_messages)
+        return all(needle in joined for needle in needles)